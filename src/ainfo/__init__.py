@@ -3,30 +3,54 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import logging
 from pathlib import Path
-from urllib.parse import urlparse
 
 import typer
 
-__version__ = "1.3.0"
+__version__ = "2.0.0"
 
 from .chunking import chunk_text, stream_chunks
 from .crawler import crawl as crawl_urls
-from .extraction import extract_information, extract_text, extract_custom
+from .extraction import (
+    CustomExtractor,
+    async_extract_information,
+    extract_custom,
+    extract_information,
+    extract_text,
+)
 from .fetching import fetch_data, async_fetch_data
-from .llm_service import LLMService
+from .llm_cache import LLMCache
+from .llm_service import AsyncLLMService, LLMService
 from .output import output_results, to_json, json_schema
-from .parsing import parse_data
+from .parsing import ParseCache, parse_data
+from .incremental import ResultStore
+from .keywords import KeywordSet
 from .schemas import ContactDetails
+from .templates import SiteTemplate
 from .extractors import AVAILABLE_EXTRACTORS
+from .pipeline import (
+    apply_extractors,
+    async_extract_site,
+    async_stream_site,
+    extract_pages,
+    extract_site,
+    stream_site,
+)
 
 app = typer.Typer()
 logger = logging.getLogger(__name__)
 
 
+def _check_extractors(names: list[str]) -> None:
+    """Reject unknown extractor names before any page is processed."""
+
+    for name in names:
+        if name not in AVAILABLE_EXTRACTORS:
+            raise typer.BadParameter(f"Unknown extractor: {name}")
+
+
 @app.callback()
 def cli(
     verbose: bool = typer.Option(
@@ -113,31 +137,20 @@ def run(
 
     needs_llm = summarize or (use_llm and "contacts" in extract)
 
+    _check_extractors(extract)
     if needs_llm:
         with LLMService() as llm:
-            for name in extract:
-                func = AVAILABLE_EXTRACTORS.get(name)
-                if func is None:
-                    raise typer.BadParameter(f"Unknown extractor: {name}")
-                if name == "contacts":
-                    results[name] = func(
-                        document, method="llm" if use_llm else "regex", llm=llm
-                    )
-                else:
-                    results[name] = func(document)
+            results.update(
+                apply_extractors(
+                    document, extract, method="llm" if use_llm else "regex", llm=llm
+                )
+            )
             if summarize and text is not None:
                 results["summary"] = llm.summarize(
                     text, language=summary_language, prompt=custom_summary_prompt
                 )
     else:
-        for name in extract:
-            func = AVAILABLE_EXTRACTORS.get(name)
-            if func is None:
-                raise typer.BadParameter(f"Unknown extractor: {name}")
-            if name == "contacts":
-                results[name] = func(document, method="regex", llm=None)
-            else:
-                results[name] = func(document)
+        results.update(apply_extractors(document, extract, method="regex", llm=None))
 
     if output is not None:
         serialisable = {
@@ -198,33 +211,53 @@ def crawl(
         "--text/--no-text",
         help="Include page text in the results",
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Parse and extract pages in parallel using N workers",
+    ),
+    executor: str = typer.Option(
+        "process",
+        "--executor",
+        help="Worker type used with --workers: 'process' or 'thread'",
+    ),
+    llm_concurrency: int = typer.Option(
+        4,
+        "--llm-concurrency",
+        min=1,
+        help="Maximum number of LLM requests in flight with --use-llm",
+    ),
 ) -> None:
     """Crawl ``url`` up to ``depth`` levels and extract text and data."""
 
+    _check_extractors(extract)
     method = "llm" if use_llm else "regex"
     aggregated_results: dict[str, dict[str, object]] = {}
 
-    async def _crawl(llm: LLMService | None = None) -> None:
-        async for link, raw in crawl_urls(url, depth, render_js=render_js):
-            document = parse_data(raw, url=link)
-            page_results: dict[str, object] = {}
-            text = ""
-            if include_text:
-                text = extract_text(document)
-                page_results["text"] = text
-            for name in extract:
-                func = AVAILABLE_EXTRACTORS.get(name)
-                if func is None:
-                    raise typer.BadParameter(f"Unknown extractor: {name}")
-                if name == "contacts":
-                    page_results[name] = func(document, method=method, llm=llm)
-                else:
-                    page_results[name] = func(document)
+    if executor not in {"process", "thread"}:
+        raise typer.BadParameter("--executor must be 'process' or 'thread'")
+
+    async def _crawl(llm: AsyncLLMService | None = None) -> None:
+        pages = (
+            (link, raw, None)
+            async for link, raw in crawl_urls(url, depth, render_js=render_js)
+        )
+        async for link, page_results in extract_pages(
+            pages,
+            extract,
+            include_text=include_text,
+            method=method,
+            llm=llm,
+            workers=workers,
+            executor=executor,
+            llm_concurrency=llm_concurrency,
+        ):
             aggregated_results[link] = page_results
             if not json_output:
                 typer.echo(f"Results for {link}:")
                 if include_text:
-                    typer.echo(text)
+                    typer.echo(page_results["text"])
                 for name in extract:
                     value = page_results.get(name)
                     if name == "contacts" and isinstance(value, ContactDetails):
@@ -233,11 +266,11 @@ def crawl(
                         typer.echo(f"{name}: {value}")
                 typer.echo()
 
-    if use_llm:
-        with LLMService() as llm:
-            asyncio.run(_crawl(llm))
-    else:
-        asyncio.run(_crawl())
+    async def _crawl_with_llm() -> None:
+        async with AsyncLLMService() as llm:
+            await _crawl(llm)
+
+    asyncio.run(_crawl_with_llm() if use_llm else _crawl())
 
     if output is not None:
         serialisable = {
@@ -259,128 +292,6 @@ def crawl(
         typer.echo(json.dumps(serialisable))
 
 
-async def async_extract_site(
-    url: str,
-    *,
-    depth: int = 0,
-    render_js: bool = False,
-    extract: list[str] | None = None,
-    include_text: bool = False,
-    use_llm: bool = False,
-    llm: LLMService | None = None,
-    dedupe: bool = True,
-) -> dict[str, dict[str, object]]:
-    """Crawl ``url`` up to ``depth`` levels and run extractors on each page.
-
-    Results are returned as a mapping of page URL to the extracted data.
-    Duplicate pages are skipped by comparing a SHA-256 hash of their HTML
-    content. Only pages on the same domain as ``url`` are processed.
-    """
-
-    extract_names = list(extract or ["contacts"])
-    method = "llm" if use_llm else "regex"
-    if use_llm and llm is None:
-        msg = "llm service required when use_llm=True"
-        raise ValueError(msg)
-
-    start_domain = urlparse(url).netloc
-    results: dict[str, dict[str, object]] = {}
-    seen_hashes: set[str] = set()
-
-    async for link, raw in crawl_urls(url, depth, render_js=render_js):
-        if urlparse(link).netloc != start_domain:
-            continue
-
-        if dedupe:
-            digest = hashlib.sha256(raw.encode("utf-8", errors="ignore")).hexdigest()
-            if digest in seen_hashes:
-                logger.debug("Skipping %s due to duplicate content hash", link)
-                continue
-            seen_hashes.add(digest)
-
-        document = parse_data(raw, url=link)
-        page_results: dict[str, object] = {}
-
-        if include_text:
-            page_results["text"] = extract_text(document)
-
-        for name in extract_names:
-            func = AVAILABLE_EXTRACTORS.get(name)
-            if func is None:
-                raise ValueError(f"Unknown extractor: {name}")
-            if name == "contacts":
-                page_results[name] = func(document, method=method, llm=llm)
-            else:
-                page_results[name] = func(document)
-
-        results[link] = page_results
-
-    return results
-
-
-def extract_site(
-    url: str,
-    *,
-    depth: int = 0,
-    render_js: bool = False,
-    extract: list[str] | None = None,
-    include_text: bool = False,
-    use_llm: bool = False,
-    llm: LLMService | None = None,
-    dedupe: bool = True,
-) -> dict[str, dict[str, object]] | asyncio.Task[dict[str, dict[str, object]]]:
-    """Synchronously run :func:`async_extract_site` when no event loop exists.
-
-    When called from within a running event loop a task is scheduled instead.
-    """
-
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        if use_llm and llm is None:
-            with LLMService() as managed_llm:
-                return asyncio.run(
-                    async_extract_site(
-                        url,
-                        depth=depth,
-                        render_js=render_js,
-                        extract=extract,
-                        include_text=include_text,
-                        use_llm=True,
-                        llm=managed_llm,
-                        dedupe=dedupe,
-                    )
-                )
-        return asyncio.run(
-            async_extract_site(
-                url,
-                depth=depth,
-                render_js=render_js,
-                extract=extract,
-                include_text=include_text,
-                use_llm=use_llm,
-                llm=llm,
-                dedupe=dedupe,
-            )
-        )
-    else:
-        if use_llm and llm is None:
-            msg = "llm must be provided when use_llm=True inside an event loop"
-            raise RuntimeError(msg)
-        return loop.create_task(
-            async_extract_site(
-                url,
-                depth=depth,
-                render_js=render_js,
-                extract=extract,
-                include_text=include_text,
-                use_llm=use_llm,
-                llm=llm,
-                dedupe=dedupe,
-            )
-        )
-
-
 def main() -> None:
     app()
 
@@ -394,16 +305,26 @@ __all__ = [
     "async_fetch_data",
     "parse_data",
     "extract_information",
+    "async_extract_information",
     "extract_text",
     "extract_custom",
+    "CustomExtractor",
     "extract_site",
     "async_extract_site",
+    "stream_site",
+    "async_stream_site",
     "output_results",
     "to_json",
     "json_schema",
     "chunk_text",
     "stream_chunks",
     "LLMService",
+    "AsyncLLMService",
+    "LLMCache",
     "ContactDetails",
+    "ParseCache",
+    "ResultStore",
+    "KeywordSet",
+    "SiteTemplate",
     "__version__",
 ]
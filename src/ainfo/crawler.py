@@ -9,9 +9,8 @@ from dataclasses import dataclass
 from typing import Mapping, AsyncIterator
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
-
 from .fetching import AsyncFetcher
+from .parsing.stream import HTMLScanner
 
 logger = logging.getLogger(__name__)
 
@@ -100,10 +99,14 @@ async def crawl(
                 if depth == max_depth:
                     continue
 
-                soup = BeautifulSoup(html, "html.parser")
-                for tag in soup.find_all("a", href=True):
-                    href = tag.get("href")
-                    if not href or href.startswith("#"):
+                # Links are discovered with a streaming scan; building a
+                # document tree here would be thrown away immediately.
+                hrefs: list[str] = []
+                scanner = HTMLScanner(collect_text=False, on_link=hrefs.append)
+                scanner.feed(html)
+                scanner.close()
+                for href in hrefs:
+                    if href.startswith("#"):
                         continue
                     link = urljoin(url, href)
                     if link in visited:
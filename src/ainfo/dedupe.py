@@ -0,0 +1,127 @@
+"""Near-duplicate detection with SimHash fingerprints."""
+
+from __future__ import annotations
+
+from collections import Counter
+import hashlib
+import re
+import threading
+
+__all__ = ["SimHashIndex", "hamming_distance", "simhash"]
+
+_BITS = 64
+_TOKEN = re.compile(r"\w+")
+
+# Bit counts are accumulated in 32-bit lanes of one large integer: the
+# spread form of a byte has a 1 in the lane of every set bit, so adding the
+# spread bytes of all hashes counts the set bits of every position at once.
+_LANE = 32
+_SPREAD = [
+    sum(1 << (_LANE * bit) for bit in range(8) if value >> bit & 1) for value in range(256)
+]
+
+
+def simhash(text: str, *, shingle_size: int = 3) -> int:
+    """Return the 64-bit SimHash fingerprint of ``text``.
+
+    The text is lower-cased and split into words, and overlapping
+    ``shingle_size``-word shingles are hashed. Texts that share most of
+    their shingles receive fingerprints that differ in only a few bits.
+    Empty text yields ``0``.
+    """
+
+    words = _TOKEN.findall(text.lower())
+    if len(words) <= shingle_size:
+        shingles = Counter([" ".join(words)] if words else [])
+    else:
+        shingles = Counter(
+            " ".join(words[start : start + shingle_size])
+            for start in range(len(words) - shingle_size + 1)
+        )
+
+    total = 0
+    counts = 0
+    for shingle, weight in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        spread = 0
+        for position, value in enumerate(digest):
+            spread |= _SPREAD[value] << (_LANE * 8 * position)
+        counts += spread * weight
+        total += weight
+
+    fingerprint = 0
+    mask = (1 << _LANE) - 1
+    for bit in range(_BITS):
+        if 2 * ((counts >> (_LANE * bit)) & mask) > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Return the number of differing bits between two fingerprints."""
+
+    return (first ^ second).bit_count()
+
+
+class SimHashIndex:
+    """Find stored fingerprints within a Hamming distance of a query.
+
+    The 64 bits are split into ``max_distance + 1`` blocks. Two fingerprints
+    within ``max_distance`` bits of each other agree on at least one whole
+    block, so only entries sharing a block with the query are compared.
+
+    Parameters
+    ----------
+    max_distance:
+        Largest number of differing bits for two fingerprints to count as
+        near-duplicates.
+    """
+
+    def __init__(self, max_distance: int = 6) -> None:
+        if not 0 <= max_distance < _BITS:
+            raise ValueError(f"max_distance must be between 0 and {_BITS - 1}")
+        self.max_distance = max_distance
+        blocks = max_distance + 1
+        bounds = [_BITS * block // blocks for block in range(blocks + 1)]
+        self._blocks = [
+            (start, (1 << (stop - start)) - 1) for start, stop in zip(bounds, bounds[1:])
+        ]
+        self._tables: list[dict[int, list[tuple[int, str]]]] = [{} for _ in self._blocks]
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def find(self, fingerprint: int) -> str | None:
+        """Return the key of a stored near-duplicate of ``fingerprint``, if any."""
+
+        with self._lock:
+            return self._find(fingerprint)
+
+    def add(self, fingerprint: int, key: str) -> None:
+        """Store ``fingerprint`` under ``key``."""
+
+        with self._lock:
+            self._add(fingerprint, key)
+
+    def match_or_add(self, fingerprint: int, key: str) -> str | None:
+        """Return the key of a near-duplicate, or store ``fingerprint`` and return ``None``."""
+
+        with self._lock:
+            existing = self._find(fingerprint)
+            if existing is None:
+                self._add(fingerprint, key)
+            return existing
+
+    def _find(self, fingerprint: int) -> str | None:
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            for candidate, key in table.get((fingerprint >> shift) & mask, ()):
+                if hamming_distance(candidate, fingerprint) <= self.max_distance:
+                    return key
+        return None
+
+    def _add(self, fingerprint: int, key: str) -> None:
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            table.setdefault((fingerprint >> shift) & mask, []).append((fingerprint, key))
+        self._size += 1
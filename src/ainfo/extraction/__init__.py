@@ -2,40 +2,80 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from bisect import bisect_left
+from collections.abc import Sequence
 import json
 import logging
 import re
+from typing import Any
 
-from ..models import Document, PageNode
+from ..models import Document, NodeTree
 from ..extractors.contact import (
-    extract_addresses,
-    extract_emails,
-    extract_phone_numbers,
+    MAILTO_PATTERN,
+    contact_details,
+    extract_mailto_emails,
+    infer_region,
 )
+from ..extractors.engine import ExtractionContext, NodeVisitor, register_visitor
 from ..extractors.social import extract_social_profiles
+from ..extractors.structured import merge_contacts, structured_contacts
 from ..schemas import ContactDetails
-from ..llm_service import LLMService
+from ..llm_service import AsyncLLMService, LLMService
+from ..parsing.html import parse_html
+from ..parsing.stream import HTMLScanner, scan_html
+from .custom import CustomExtractor, cached_extractor
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE = re.compile(r"\s+")
 
-def _gather_text(nodes: Iterable[PageNode], *, content_only: bool) -> list[str]:
-    """Return text extracted from ``nodes``.
+
+def _gather_text(
+    tree: NodeTree, *, content_only: bool, excluded: Sequence[int] = ()
+) -> list[str]:
+    """Return text extracted from the nodes of ``tree``.
 
     When ``content_only`` is ``True`` only nodes flagged as primary content are
     included. Passing ``False`` includes navigation and other auxiliary
     sections, which is useful for tasks such as contact extraction where
     details are frequently located in footers or sidebars.
+
+    Text is read from the tree's shared buffer. A node whose span lies within
+    the span of an already included ancestor is skipped, so nested content
+    is only returned once. The subtrees rooted at ``excluded`` (in document
+    order) are left out, including from the spans of their ancestors.
     """
 
+    buffer = tree.text_buffer
+    starts = tree.starts
+    stops = tree.stops
+    ends = tree.ends
+    holes = [(starts[root], stops[root]) for root in excluded]
+    hole_starts = [start for start, _ in holes]
     parts: list[str] = []
-    for node in nodes:
-        include_node = node.is_content or not content_only
-        if include_node and node.text:
-            parts.append(node.text)
-        if node.children:
-            parts.extend(_gather_text(node.children, content_only=content_only))
+    covered = 0
+    next_excluded = 0
+    index = 0
+    total = len(tree)
+    while index < total:
+        if next_excluded < len(excluded) and index == excluded[next_excluded]:
+            index = ends[index]
+            next_excluded += 1
+            continue
+        start = starts[index]
+        stop = stops[index]
+        if start != stop and start >= covered and (not content_only or tree.is_content(index)):
+            position = start
+            for hole_start, hole_stop in holes[bisect_left(hole_starts, start) :]:
+                if hole_start >= stop:
+                    break
+                if hole_start > position:
+                    parts.append(buffer[position:hole_start])
+                position = max(position, hole_stop)
+            if position < stop:
+                parts.append(buffer[position:stop])
+            covered = stop
+        index += 1
     return parts
 
 
@@ -64,70 +104,231 @@ def extract_text(
     """
 
     logger.info("Extracting text from document")
-    parts = [
-        re.sub(r"\s+", " ", p).strip()
-        for p in _gather_text(doc.nodes, content_only=content_only)
-    ]
+    parts: tuple[str, ...] = doc.memo(
+        ("text_parts", content_only),
+        lambda: tuple(
+            cleaned
+            for cleaned in (
+                _WHITESPACE.sub(" ", p).strip()
+                for p in _gather_text(
+                    doc.tree, content_only=content_only, excluded=doc.excluded
+                )
+            )
+            if cleaned
+        ),
+    )
     if as_list:
-        return [p for p in parts if p]
-    filtered = [p for p in parts if p]
-    text = joiner.join(filtered)
-    return text.strip()
+        return list(parts)
+    return doc.memo(
+        ("text", content_only, joiner), lambda: joiner.join(parts).strip()
+    )
+
+
+def scanned_document(
+    scanner: HTMLScanner, url: str | None = None
+) -> tuple[Document, str, list[str]]:
+    """Return a tree-less document, the text and the ``mailto:`` addresses of a scan.
+
+    The document only carries the URL, language and JSON-LD items of the
+    page, which is all contact extraction needs besides the text.
+    """
+
+    doc = Document(url=url, lang=scanner.lang, structured_data=scanner.structured_data)
+    text = _WHITESPACE.sub(" ", scanner.text).strip()
+    emails = [
+        match.group(1)
+        for match in map(MAILTO_PATTERN.search, scanner.links)
+        if match is not None
+    ]
+    return doc, text, emails
+
+
+def regex_contacts(doc: Document, text: str, attr_emails: list[str]) -> ContactDetails:
+    """Return the structured and regex based contact details of a page."""
+
+    return merge_contacts(
+        structured_contacts(doc), contact_details(text, attr_emails, infer_region(doc))
+    )
+
+
+_CONTACTS_INSTRUCTION = (
+    "Extract any email addresses, phone numbers, street addresses and "
+    "social media profiles from the following text. Respond in JSON "
+    "with keys 'emails', 'phone_numbers', 'addresses' and "
+    "'social_media'."
+)
+
+
+def _load_document(
+    doc: Document | str, url: str | None
+) -> tuple[Document, tuple[str, list[str]] | None]:
+    """Return the document to extract from and, for scanned HTML, its text and emails."""
+
+    if not isinstance(doc, str):
+        return doc, None
+    scanner = scan_html(doc)
+    if scanner.has_microdata:
+        # Microdata items are collected from the element tree.
+        return parse_html(doc, url=url), None
+    doc, text, attr_emails = scanned_document(scanner, url)
+    return doc, (text, attr_emails)
+
+
+def _llm_request(
+    doc: Document, text: str | None, instruction: str | None
+) -> tuple[ContactDetails, tuple[str, str] | None]:
+    """Return the structured contacts and the ``(text, instruction)`` to send.
+
+    The request is ``None`` when the structured data already answers the
+    default instruction. Social profiles missing from the structured data
+    are then found in the text with :func:`extract_social_profiles`.
+    """
+
+    structured = structured_contacts(doc)
+    if text is None:
+        text = extract_text(doc, content_only=False)
+    if instruction is None and (
+        structured.emails and structured.phone_numbers and structured.addresses
+    ):
+        logger.info("Structured data provides the contact details; skipping the LLM")
+        if not structured.social_media:
+            structured.social_media = extract_social_profiles(text)
+        return structured, None
+    return structured, (text, instruction or _CONTACTS_INSTRUCTION)
+
+
+def _llm_contacts(structured: ContactDetails, response: str) -> ContactDetails:
+    """Merge the contact details of an LLM ``response`` after ``structured``."""
+
+    try:
+        data = json.loads(response)
+    except Exception:
+        data = {}
+    return merge_contacts(
+        structured,
+        ContactDetails(
+            emails=data.get("emails", []),
+            phone_numbers=data.get("phone_numbers", []),
+            addresses=data.get("addresses", []),
+            social_media=data.get("social_media", []),
+        ),
+    )
 
 
 def extract_information(
-    doc: Document,
+    doc: Document | str,
     method: str = "regex",
     llm: LLMService | None = None,
     instruction: str | None = None,
     model: str | None = None,
+    *,
+    url: str | None = None,
 ) -> ContactDetails:
     """Extract contact details from a parsed document.
 
     Parameters
     ----------
     doc:
-        Parsed :class:`Document` to process.
+        Parsed :class:`Document` to process, or raw HTML. Raw HTML is scanned
+        for its text and links with :class:`~ainfo.parsing.stream.HTMLScanner`
+        without building a document tree; pages with microdata are parsed
+        as usual.
     method:
         ``"regex"`` to use the built-in regular expressions or ``"llm"`` to
         delegate extraction to an LLM service.
     llm:
         Instance of :class:`LLMService` required when ``method`` is ``"llm"``.
+        Use :func:`async_extract_information` with an
+        :class:`~ainfo.llm_service.AsyncLLMService`.
+    url:
+        Source URL of raw HTML, used to guess the phone number region.
+
+    Contact details from the page's schema.org structured data are listed
+    first. With the default instruction the LLM is not called when the
+    structured data already provides emails, phone numbers and addresses.
     """
 
     logger.info("Extracting contact information using %s", method)
-    text = extract_text(doc, content_only=False)
+    doc, scanned = _load_document(doc, url)
+
     if method == "llm":
         if llm is None:
             msg = "LLMService instance required when method='llm'"
             raise ValueError(msg)
-        instruction = instruction or (
-            "Extract any email addresses, phone numbers, street addresses and "
-            "social media profiles from the following text. Respond in JSON "
-            "with keys 'emails', 'phone_numbers', 'addresses' and "
-            "'social_media'."
-          )
-        response = llm.extract(text, instruction, model=model)
-        try:
-            data = json.loads(response)
-        except Exception:
-            data = {}
-        return ContactDetails(
-            emails=data.get("emails", []),
-            phone_numbers=data.get("phone_numbers", []),
-            addresses=data.get("addresses", []),
-            social_media=data.get("social_media", []),
-        )
+        if isinstance(llm, AsyncLLMService):
+            msg = "AsyncLLMService requires async_extract_information"
+            raise TypeError(msg)
+        structured, request = _llm_request(doc, scanned[0] if scanned else None, instruction)
+        if request is None:
+            return structured
+        return _llm_contacts(structured, llm.extract(*request, model=model))
 
     # Default to regex based extraction
-    return ContactDetails(
-        emails=extract_emails(doc),
-        phone_numbers=extract_phone_numbers(text),
-        addresses=extract_addresses(text),
-        social_media=extract_social_profiles(text),
+    if scanned is not None:
+        return regex_contacts(doc, *scanned)
+    return regex_contacts(
+        doc,
+        extract_text(doc, content_only=False),
+        extract_mailto_emails(doc.tree, skip=doc.is_excluded),
     )
 
 
+class ContactVisitor(NodeVisitor):
+    """Visitor equivalent of :func:`extract_information`.
+
+    Regex extraction collects ``mailto:`` links during the shared traversal
+    and scans the full document text once. Other methods are delegated to
+    :func:`extract_information` unchanged.
+    """
+
+    def __init__(self, method: str = "regex", **kwargs: Any) -> None:
+        self.method = method
+        self.kwargs = kwargs
+        self.tags = frozenset() if method == "llm" else frozenset({"a"})
+
+    def start(self, context: ExtractionContext) -> None:
+        self.emails: list[str] = []
+        self.doc = context.doc
+
+    def visit(self, tree: NodeTree, index: int) -> None:
+        href = tree.attrs[index].get("href")
+        if href and not self.doc.is_excluded(index):
+            match = MAILTO_PATTERN.search(href)
+            if match:
+                self.emails.append(match.group(1))
+
+    def finish(self, context: ExtractionContext) -> Any:
+        if self.method == "llm":
+            return extract_information(context.doc, method=self.method, **self.kwargs)
+        return regex_contacts(context.doc, context.text(content_only=False), self.emails)
+
+
+register_visitor(extract_information, ContactVisitor)
+
+
+async def async_extract_information(
+    doc: Document | str,
+    llm: AsyncLLMService,
+    instruction: str | None = None,
+    model: str | None = None,
+    *,
+    url: str | None = None,
+) -> ContactDetails:
+    """Extract contact details with an :class:`~ainfo.llm_service.AsyncLLMService`.
+
+    This is the asynchronous form of :func:`extract_information` with
+    ``method="llm"``: the event loop keeps running while the model answers,
+    so several pages can be processed concurrently.
+    """
+
+    logger.info("Extracting contact information using llm")
+    doc, scanned = _load_document(doc, url)
+    structured, request = _llm_request(doc, scanned[0] if scanned else None, instruction)
+    if request is None:
+        return structured
+    return _llm_contacts(structured, await llm.extract(*request, model=model))
+
+
 def extract_custom(
     doc: Document,
     patterns: dict[str, str] | None = None,
@@ -185,12 +386,18 @@ def extract_custom(
         msg = "patterns required when llm is None"
         raise ValueError(msg)
 
-    results: dict[str, list[str]] = {}
-    for key, pattern in patterns.items():
-        regex = re.compile(pattern, re.IGNORECASE)
-        matches = [m.group(0) for m in regex.finditer(text)]
-        results[key] = list(dict.fromkeys(matches))
-    return results
+    # Compiled pattern sets are cached, so repeated calls with the same
+    # patterns do not recompile them.
+    return cached_extractor(tuple(patterns.items())).match(text)
 
 
-__all__ = ["extract_information", "extract_text", "extract_custom"]
+__all__ = [
+    "ContactVisitor",
+    "extract_information",
+    "async_extract_information",
+    "extract_text",
+    "extract_custom",
+    "CustomExtractor",
+    "regex_contacts",
+    "scanned_document",
+]
@@ -0,0 +1,119 @@
+"""Reusable regex extractors compiled once and applied to many documents."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import re
+
+from ..models import Document
+
+__all__ = ["CustomExtractor", "cached_extractor"]
+
+
+class CustomExtractor:
+    """Apply a fixed set of named regular expressions to documents.
+
+    Patterns are compiled once when the extractor is created, so the same
+    instance can be reused for any number of documents.
+
+    Parameters
+    ----------
+    patterns:
+        Mapping of field names to regular expressions, given either as strings
+        or as compiled patterns. Strings are compiled with ``flags``.
+    flags:
+        Flags used to compile string patterns. Defaults to
+        :data:`re.IGNORECASE`, matching :func:`~ainfo.extraction.extract_custom`.
+    content_only:
+        Whether to search only the primary content of each document or also
+        navigation and footer text.
+    """
+
+    def __init__(
+        self,
+        patterns: Mapping[str, str | re.Pattern[str]],
+        *,
+        flags: int = re.IGNORECASE,
+        content_only: bool = True,
+    ) -> None:
+        self.patterns: dict[str, re.Pattern[str]] = {
+            key: pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+            for key, pattern in patterns.items()
+        }
+        self.content_only = content_only
+
+    def __call__(self, doc: Document) -> dict[str, list[str]]:
+        return self.extract(doc)
+
+    def extract(self, doc: Document) -> dict[str, list[str]]:
+        """Return the unique matches of every pattern in ``doc``."""
+
+        from . import extract_text
+
+        return self.match(extract_text(doc, content_only=self.content_only))
+
+    def match(self, text: str) -> dict[str, list[str]]:
+        """Return the unique matches of every pattern in ``text``."""
+
+        results: dict[str, list[str]] = {}
+        for key, regex in self.patterns.items():
+            matches = [m.group(0) for m in regex.finditer(text)]
+            results[key] = list(dict.fromkeys(matches))
+        return results
+
+    def extract_many(
+        self,
+        docs: Iterable[Document],
+        *,
+        max_workers: int | None = None,
+        chunksize: int = 16,
+    ) -> list[dict[str, list[str]]]:
+        """Return the results of :meth:`extract` for each of ``docs`` in order.
+
+        Parameters
+        ----------
+        docs:
+            Documents to search.
+        max_workers:
+            When given, the patterns are matched in a process pool of this
+            size. Only the extracted text of each document is sent to the
+            workers, and the compiled extractor is shipped once per worker.
+            ``None`` matches everything in the current process.
+        chunksize:
+            Number of documents sent to a worker at a time.
+        """
+
+        from . import extract_text
+
+        texts = [extract_text(doc, content_only=self.content_only) for doc in docs]
+        if max_workers is None or len(texts) < 2:
+            return [self.match(text) for text in texts]
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            return list(pool.map(_match_in_worker, texts, chunksize=chunksize))
+
+
+_WORKER_EXTRACTOR: CustomExtractor | None = None
+
+
+def _init_worker(extractor: CustomExtractor) -> None:
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = extractor
+
+
+def _match_in_worker(text: str) -> dict[str, list[str]]:
+    assert _WORKER_EXTRACTOR is not None
+    return _WORKER_EXTRACTOR.match(text)
+
+
+@lru_cache(maxsize=128)
+def cached_extractor(patterns: tuple[tuple[str, str], ...]) -> CustomExtractor:
+    """Return a :class:`CustomExtractor` for ``patterns``, reusing earlier ones."""
+
+    return CustomExtractor(dict(patterns))
@@ -5,34 +5,69 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from ..models import Document
-from .links import extract_links
-from .headings import extract_headings
-from .jobs import extract_job_postings
+from .engine import (
+    ExtractionContext,
+    NodeVisitor,
+    register_visitor,
+    run_extractors,
+    visit_document,
+)
+from .links import LinkVisitor, extract_links
+from .headings import HeadingVisitor, extract_headings
+from .jobs import APPLY_KEYWORDS, JOB_KEYWORDS, extract_job_postings
+from .registry import (
+    ARTIFACTS,
+    ExtractorRegistry,
+    ExtractorSpec,
+    requires,
+    runs_on,
+)
 
 Extractor = Callable[[Document], Any]
 
 
-def extract_contacts(doc: Document, **kwargs: Any) -> Any:
-    """Proxy to :func:`ainfo.extraction.extract_information`.
-
-    Imported lazily to avoid circular imports between modules.
-    """
-    from ..extraction import extract_information
-
-    return extract_information(doc, **kwargs)
-
-
-AVAILABLE_EXTRACTORS: dict[str, Extractor] = {
-    "contacts": extract_contacts,
-    "links": extract_links,
-    "headings": extract_headings,
-    "job_postings": extract_job_postings,
-}
+AVAILABLE_EXTRACTORS = ExtractorRegistry()
+# Contact extraction lives in :mod:`ainfo.extraction`, which imports this
+# package, so it is registered by reference and imported on first use.
+_CONTACTS = AVAILABLE_EXTRACTORS.register(
+    "contacts",
+    "ainfo.extraction:extract_information",
+    inputs={"links", "text"},
+    page_types={"contact", "about"},
+)
+AVAILABLE_EXTRACTORS.register("links", extract_links, inputs={"links"})
+AVAILABLE_EXTRACTORS.register("headings", extract_headings, inputs={"tree", "text"})
+AVAILABLE_EXTRACTORS.register(
+    "job_postings", extract_job_postings, inputs={"tree", "text"}, page_types={"careers"}
+)
 
 __all__ = [
+    "ARTIFACTS",
     "AVAILABLE_EXTRACTORS",
+    "ExtractorRegistry",
+    "ExtractorSpec",
+    "requires",
+    "runs_on",
+    "ExtractionContext",
+    "HeadingVisitor",
+    "LinkVisitor",
+    "NodeVisitor",
+    "register_visitor",
+    "run_extractors",
+    "visit_document",
     "extract_links",
     "extract_headings",
     "extract_contacts",
     "extract_job_postings",
+    "JOB_KEYWORDS",
+    "APPLY_KEYWORDS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``extract_contacts`` is :func:`ainfo.extraction.extract_information`,
+    # loaded through the registry when first requested.
+    if name == "extract_contacts":
+        return _CONTACTS.load()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
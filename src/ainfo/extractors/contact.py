@@ -2,62 +2,287 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 import re
 from typing import TYPE_CHECKING, Union
+from urllib.parse import urlparse
+
+from ..schemas import ContactDetails
+from .social import SOCIAL_PATTERN
 
 if TYPE_CHECKING:
-    from ..models import Document, PageNode
+    from ..models import Document, NodeTree
 
 try:  # pragma: no cover - optional dependency
     import phonenumbers
 except Exception:  # pragma: no cover
     phonenumbers = None  # type: ignore[assignment]
 
-EMAIL_PATTERN = re.compile(
-    r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
-)
+# All contact patterns use bounded repetition so that a failed match attempt
+# costs constant time and scanning stays linear in the length of the text,
+# even for long runs of digits, words or email-like characters.
+_EMAIL_LOCAL_MAX = 64
 
-MAILTO_PATTERN = re.compile(
-    r"mailto:([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)",
-    re.IGNORECASE
+_EMAIL = (
+    rf"[a-zA-Z0-9_.+-]{{1,{_EMAIL_LOCAL_MAX}}}@[a-zA-Z0-9-]{{1,63}}\.[a-zA-Z0-9-.]{{1,255}}"
 )
 
+# The lookbehind anchors a match at the start of a run of local-part
+# characters, so starts inside an over-long run fail immediately.
+EMAIL_PATTERN = re.compile(rf"(?<![a-zA-Z0-9_.+-]){_EMAIL}")
+
+MAILTO_PATTERN = re.compile(rf"mailto:({_EMAIL})", re.IGNORECASE)
+
+# Numbers must not start inside a longer digit run such as an order number.
 PHONE_PATTERN = re.compile(
-    r"(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{3}\)?[\s-]?|\d{3}[\s-]?)\d{3}[\s-]?\d{4}\b"
+    r"(?<!\d)(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{3}\)?[\s-]?|\d{3}[\s-]?)\d{3}[\s-]?\d{4}\b"
 )
 
 ADDRESS_PATTERN = re.compile(
-    r"\b\d{1,5}\s+[\w#.]+(?:\s+[\w#.]+)*\s+"
+    r"\b\d{1,5}(?:\s+[\w#.]{1,40}){1,6}\s+"
     r"(?:Street|St\.?|Road|Rd\.?|Avenue|Ave\.?|Boulevard|Blvd\.?|Lane|Ln\.?|Drive|Dr\.?)"
-    r"(?:\s+\w+)*\b",
+    r"(?:\s+\w{1,40}){0,4}\b",
     re.IGNORECASE,
 )
 
+# Literal anchors every contact field depends on. A single pass over the text
+# with this pattern tells :func:`scan_contacts` where emails, social links,
+# phone numbers and addresses can start and whether an address suffix occurs
+# at all. Phone numbers start with "+", "(" or the first digit of a run, and
+# addresses with the first digit of a run, so each run is one anchor.
+_CONTACT_ANCHORS = re.compile(
+    r"(?P<at>@)|(?P<url>https?://)|(?P<number>[+(]|\d+)"
+    r"|(?P<street>\b(?:Street|St|Road|Rd|Avenue|Ave|Boulevard|Blvd|Lane|Ln|Drive|Dr)\b)",
+    re.IGNORECASE,
+)
+
+# Digit-dense runs that may hold a phone number. Only these spans are handed
+# to :mod:`phonenumbers`, which is far slower than a regex over the full text.
+# Separators include the dash variants :mod:`phonenumbers` accepts, such as
+# en dashes and non-breaking hyphens.
+_PHONE_CANDIDATE = re.compile(
+    r"\+?\(?\d[\d \t\u00a0().\-/\u2010-\u2015\u2212\u30fc\uff0d]*\d"
+)
+
+_MIN_PHONE_DIGITS = 7
+
+# Country-code TLDs that are mostly used as generic domains.
+_GENERIC_TLDS = frozenset(
+    "ad ai as bz cc cd co dj fm gg io la ly me ms nu sc sh sr tk to tv vc ws".split()
+)
+
+# Phone number region used when the page gives no usable hint.
+DEFAULT_REGION = "US"
+
+_TLD_REGIONS = {"uk": "GB"}
+
+_LANGUAGE_REGIONS = {
+    "cs": "CZ",
+    "da": "DK",
+    "de": "DE",
+    "en": "US",
+    "es": "ES",
+    "fi": "FI",
+    "fr": "FR",
+    "it": "IT",
+    "ja": "JP",
+    "ko": "KR",
+    "nb": "NO",
+    "nl": "NL",
+    "pl": "PL",
+    "pt": "PT",
+    "sv": "SE",
+    "zh": "CN",
+}
+
+_EMAIL_LOCAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.+-"
+)
+
+
+__all__ = [
+    "DEFAULT_REGION",
+    "contact_details",
+    "extract_emails",
+    "extract_mailto_emails",
+    "extract_phone_numbers",
+    "extract_addresses",
+    "infer_region",
+    "scan_contacts",
+]
 
-__all__ = ["extract_emails", "extract_phone_numbers", "extract_addresses"]
 
+def extract_mailto_emails(
+    tree: "NodeTree", skip: Callable[[int], bool] | None = None
+) -> list[str]:
+    """Extract emails from HTML attributes (like mailto links) in a document tree.
 
-def _extract_emails_from_nodes(nodes: list["PageNode"]) -> list[str]:
-    """Extract emails from HTML attributes (like mailto links) in document nodes."""
+    Nodes for which ``skip`` returns ``True`` are ignored.
+    """
     emails: list[str] = []
-    
-    def _visit(node_list: list["PageNode"]) -> None:
-        for node in node_list:
-            # Check href attributes for mailto links
-            if node.tag == "a" and "href" in node.attrs:
-                href = node.attrs["href"]
-                mailto_match = MAILTO_PATTERN.search(href)
-                if mailto_match:
-                    emails.append(mailto_match.group(1))
-            
-            # Recursively check child nodes
-            if node.children:
-                _visit(node.children)
-    
-    _visit(nodes)
+
+    for index in tree.with_href:
+        if skip is not None and skip(index):
+            continue
+        # Check href attributes for mailto links
+        if tree.tag(index) == "a":
+            mailto_match = MAILTO_PATTERN.search(tree.attrs[index]["href"])
+            if mailto_match:
+                emails.append(mailto_match.group(1))
+
+    return emails
+
+
+def infer_region(doc: "Document") -> str:
+    """Guess the phone number region of ``doc``.
+
+    The country-code TLD of the document URL wins; otherwise the document's
+    ``lang`` attribute is used, preferring an explicit region subtag such as
+    ``de-CH``. Hints that are not phone number regions, such as the ``.eu``
+    TLD, are skipped. Returns :data:`DEFAULT_REGION` when no hint is usable.
+    """
+    for region in (_tld_region(doc.url), _lang_region(doc.lang)):
+        if region is not None and _is_phone_region(region):
+            return region
+    return DEFAULT_REGION
+
+
+def _tld_region(url: str | None) -> str | None:
+    host = urlparse(url).hostname if url else None
+    if not host:
+        return None
+    tld = host.rsplit(".", 1)[-1].lower()
+    if len(tld) == 2 and tld.isalpha() and tld not in _GENERIC_TLDS:
+        return _TLD_REGIONS.get(tld, tld.upper())
+    return None
+
+
+def _lang_region(lang: str | None) -> str | None:
+    if not lang:
+        return None
+    parts = lang.replace("_", "-").split("-")
+    if len(parts) > 1 and len(parts[1]) == 2 and parts[1].isalpha():
+        return parts[1].upper()
+    return _LANGUAGE_REGIONS.get(parts[0].lower())
+
+
+def _is_phone_region(region: str) -> bool:
+    """Return whether :mod:`phonenumbers` knows ``region``.
+
+    Without :mod:`phonenumbers` the region is unused, so any hint is kept.
+    """
+    return phonenumbers is None or region in phonenumbers.SUPPORTED_REGIONS
+
+
+def contact_details(
+    text: str, attr_emails: list[str], region: str | None = None
+) -> ContactDetails:
+    """Return regex based contact details for ``text``.
+
+    ``attr_emails`` holds addresses already found in HTML attributes; they are
+    appended to the emails found in the text. ``region`` is the default phone
+    number region.
+    """
+    found = scan_contacts(text, region)
+    found["emails"] = list(dict.fromkeys(found["emails"] + attr_emails))
+    return ContactDetails(**found)
+
+
+def scan_contacts(text: str, region: str | None = None) -> dict[str, list[str]]:
+    """Find emails, phone numbers, addresses and social profiles in one pass.
+
+    The result matches calling :func:`extract_emails`,
+    :func:`extract_phone_numbers`, :func:`extract_addresses` and
+    :func:`~ainfo.extractors.social.extract_social_profiles` separately, but
+    the text is only scanned once, for the anchors the fields rely on: ``@``,
+    ``http(s)://``, street suffixes, and the ``+``, ``(`` and digit runs that
+    numbers start with. Each field's pattern is then only tried at its
+    anchors, and addresses are skipped when no street suffix occurs.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Mapping with the keys ``emails``, ``phone_numbers``, ``addresses`` and
+        ``social_media``.
+    """
+    at_signs: list[int] = []
+    urls: list[int] = []
+    numbers: list[int] = []
+    has_street = False
+    for anchor in _CONTACT_ANCHORS.finditer(text):
+        kind = anchor.lastgroup
+        if kind == "at":
+            at_signs.append(anchor.start())
+        elif kind == "url":
+            urls.append(anchor.start())
+        elif kind == "number":
+            numbers.append(anchor.start())
+        else:
+            has_street = True
+
+    addresses: list[str] = []
+    if has_street:
+        addresses = [
+            match.group(0).strip() for match in _matches_at(ADDRESS_PATTERN, text, numbers)
+        ]
+    return {
+        "emails": list(dict.fromkeys(_emails_at(text, at_signs))),
+        "phone_numbers": _phone_numbers(text, region, numbers),
+        "addresses": addresses,
+        "social_media": list(dict.fromkeys(_social_at(text, urls))),
+    }
+
+
+def _matches_at(
+    pattern: re.Pattern[str], text: str, starts: Iterable[int]
+) -> Iterator[re.Match[str]]:
+    """Yield the matches of ``pattern`` that ``pattern.finditer`` finds at ``starts``.
+
+    ``starts`` must hold every position where ``pattern`` can match, in
+    ascending order. Positions inside an earlier match are skipped.
+    """
+    last_end = 0
+    for start in starts:
+        if start < last_end:
+            continue
+        match = pattern.match(text, start)
+        if match:
+            yield match
+            last_end = match.end()
+
+
+def _emails_at(text: str, at_signs: list[int]) -> list[str]:
+    """Return :data:`EMAIL_PATTERN` matches around the given ``@`` positions.
+
+    A match contains exactly one ``@`` and starts at the beginning of the run
+    of local-part characters before it, so trying one position per ``@``
+    finds the same matches as ``EMAIL_PATTERN.finditer``. Runs longer than the
+    local-part limit cannot match and are not walked further back.
+    """
+    emails: list[str] = []
+    last_end = 0
+    for at in at_signs:
+        if at < last_end:
+            continue
+        start = at
+        limit = max(last_end, at - _EMAIL_LOCAL_MAX)
+        while start > limit and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        if start == at:
+            continue
+        match = EMAIL_PATTERN.match(text, start)
+        if match:
+            emails.append(match.group(0))
+            last_end = match.end()
     return emails
 
 
+def _social_at(text: str, urls: list[int]) -> list[str]:
+    """Return social profile URLs starting at the given ``http(s)://`` positions."""
+    return [match.group(1).rstrip(".,)") for match in _matches_at(SOCIAL_PATTERN, text, urls)]
+
+
 def extract_emails(source: str | "Document") -> list[str]:
     """Extract emails from text or from both text content and HTML attributes in a document.
     
@@ -89,7 +314,7 @@ def extract_emails(source: str | "Document") -> list[str]:
     text_emails = list(dict.fromkeys(m.group(0) for m in EMAIL_PATTERN.finditer(text)))
     
     # Get emails from HTML attributes (like mailto links)
-    attr_emails = _extract_emails_from_nodes(doc.nodes)
+    attr_emails = extract_mailto_emails(doc.tree, skip=doc.is_excluded)
     
     # Combine and deduplicate
     all_emails = text_emails + attr_emails
@@ -100,19 +325,40 @@ def extract_phone_numbers(text: str, region: str | None = None) -> list[str]:
     """Return phone numbers detected in ``text``.
 
     If the :mod:`phonenumbers` package is installed, numbers are parsed and
-    formatted using that library. Otherwise the raw matches are returned with
-    non-digit characters removed.
+    formatted using that library. Only digit-dense spans of ``text`` are
+    parsed, and the result for each span is cached since the same numbers
+    recur on every page of a site. ``region`` defaults to
+    :data:`DEFAULT_REGION`. Without
+    :mod:`phonenumbers` the raw matches are returned with non-digit characters
+    removed.
     """
-    if phonenumbers is not None:
-        numbers: list[str] = []
-        for match in phonenumbers.PhoneNumberMatcher(text, region or "US"):
-            formatted = phonenumbers.format_number(
-                match.number, phonenumbers.PhoneNumberFormat.E164
-            )
-            numbers.append(formatted)
-        return numbers
-
-    return [re.sub(r"\D", "", m.group(0)) for m in PHONE_PATTERN.finditer(text)]
+    return _phone_numbers(text, region)
+
+
+def _phone_numbers(
+    text: str, region: str | None, starts: Iterable[int] | None = None
+) -> list[str]:
+    """Return the phone numbers of ``text``, only trying ``starts`` when given."""
+    pattern = PHONE_PATTERN if phonenumbers is None else _PHONE_CANDIDATE
+    matches = pattern.finditer(text) if starts is None else _matches_at(pattern, text, starts)
+    if phonenumbers is None:
+        return [re.sub(r"\D", "", match.group(0)) for match in matches]
+
+    numbers: list[str] = []
+    for candidate in matches:
+        span = candidate.group(0)
+        if sum(char.isdigit() for char in span) >= _MIN_PHONE_DIGITS:
+            numbers.extend(_parse_phone_span(span, region or DEFAULT_REGION))
+    return numbers
+
+
+@lru_cache(maxsize=4096)
+def _parse_phone_span(span: str, region: str) -> tuple[str, ...]:
+    """Return the E.164 numbers :mod:`phonenumbers` finds in ``span``."""
+    return tuple(
+        phonenumbers.format_number(match.number, phonenumbers.PhoneNumberFormat.E164)
+        for match in phonenumbers.PhoneNumberMatcher(span, region)
+    )
 
 
 def extract_addresses(text: str) -> list[str]:
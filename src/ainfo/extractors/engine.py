@@ -0,0 +1,170 @@
+"""Run several extractors over a document in a single traversal."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from ..models import Document, NodeTree
+
+__all__ = [
+    "ExtractionContext",
+    "NodeVisitor",
+    "register_visitor",
+    "run_extractors",
+    "visit_document",
+]
+
+
+class ExtractionContext:
+    """Intermediate results shared by the visitors running over one document."""
+
+    def __init__(self, doc: Document) -> None:
+        self.doc = doc
+        self.shared: dict[str, Any] = {}
+
+    @property
+    def tree(self) -> NodeTree:
+        return self.doc.tree
+
+    def text(self, *, content_only: bool = True) -> str:
+        """Return the joined document text.
+
+        The text is memoised on the document, so every visitor shares it.
+        """
+
+        from ..extraction import extract_text
+
+        return extract_text(self.doc, content_only=content_only)
+
+    def links(self) -> list[str]:
+        """Return the unique hyperlinks of the document, memoised like :meth:`text`."""
+
+        from .links import extract_links
+
+        return self.doc.memo("links", lambda: extract_links(self.doc))
+
+
+class NodeVisitor:
+    """Base class for extractors driven by :func:`visit_document`.
+
+    ``tags`` lists the (lower-case) tag names the visitor wants to see; only
+    matching nodes are passed to :meth:`visit`. ``None`` requests every node
+    and an empty set skips the traversal for this visitor altogether.
+    """
+
+    tags: frozenset[str] | None = None
+
+    def start(self, context: ExtractionContext) -> None:
+        """Prepare for a new document."""
+
+    def visit(self, tree: NodeTree, index: int) -> None:
+        """Handle node ``index`` of ``tree``."""
+
+    def finish(self, context: ExtractionContext) -> Any:
+        """Return the extraction result once every node has been visited."""
+
+        raise NotImplementedError
+
+
+VisitorFactory = Callable[..., NodeVisitor]
+
+_VISITORS: dict[Callable[..., Any], VisitorFactory] = {}
+
+
+def register_visitor(extractor: Callable[..., Any], factory: VisitorFactory) -> None:
+    """Let :func:`run_extractors` run ``extractor`` as a visitor from ``factory``.
+
+    ``factory`` receives the same keyword arguments as ``extractor`` and must
+    return a :class:`NodeVisitor` producing the same result.
+    """
+
+    _VISITORS[extractor] = factory
+
+
+def visit_document(
+    doc: Document,
+    visitors: Iterable[NodeVisitor],
+    context: ExtractionContext | None = None,
+) -> list[Any]:
+    """Run ``visitors`` over ``doc`` in one pass and return their results."""
+
+    visitors = list(visitors)
+    context = context or ExtractionContext(doc)
+    for visitor in visitors:
+        visitor.start(context)
+
+    by_tag: dict[str, list[NodeVisitor]] = {}
+    every_node: list[NodeVisitor] = []
+    for visitor in visitors:
+        if visitor.tags is None:
+            every_node.append(visitor)
+        else:
+            for tag in visitor.tags:
+                by_tag.setdefault(tag, []).append(visitor)
+
+    if every_node or by_tag:
+        tree = context.tree
+        indices: Iterable[int] = range(len(tree)) if every_node else tree.find(*by_tag)
+        for index in indices:
+            for visitor in by_tag.get(tree.tag(index).lower(), ()):
+                visitor.visit(tree, index)
+            for visitor in every_node:
+                visitor.visit(tree, index)
+
+    return [visitor.finish(context) for visitor in visitors]
+
+
+def run_extractors(
+    doc: Document,
+    names: Iterable[str],
+    *,
+    extractors: Mapping[str, Callable[..., Any]] | None = None,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Run the extractors called ``names`` on ``doc`` and return their results.
+
+    Extractors with a registered visitor share a single traversal of the
+    document; any other extractor is simply called with ``doc``.
+
+    Parameters
+    ----------
+    doc:
+        Parsed :class:`Document` to process.
+    names:
+        Names of the extractors to run, in the order of the returned mapping.
+    extractors:
+        Registry mapping names to extractor functions. Defaults to
+        :data:`ainfo.extractors.AVAILABLE_EXTRACTORS`.
+    options:
+        Optional keyword arguments per extractor name.
+
+    Raises
+    ------
+    ValueError
+        If one of ``names`` is not in the registry.
+    """
+
+    if extractors is None:
+        from . import AVAILABLE_EXTRACTORS as extractors
+    options = options or {}
+
+    results: dict[str, Any] = {}
+    pending: list[tuple[str, NodeVisitor]] = []
+    for name in dict.fromkeys(names):
+        func = extractors.get(name)
+        if func is None:
+            raise ValueError(f"Unknown extractor: {name}")
+        kwargs = options.get(name, {})
+        factory = _VISITORS.get(func)
+        if factory is None:
+            results[name] = func(doc, **kwargs)
+        else:
+            results[name] = None
+            pending.append((name, factory(**kwargs)))
+
+    if pending:
+        values = visit_document(doc, [visitor for _, visitor in pending])
+        for (name, _), value in zip(pending, values):
+            results[name] = value
+    return results
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
-from ..models import Document, PageNode
+from ..models import Document, NodeTree
+from .engine import ExtractionContext, NodeVisitor, register_visitor, visit_document
 
-__all__ = ["extract_headings"]
+__all__ = ["extract_headings", "HeadingVisitor"]
+
+
+class HeadingVisitor(NodeVisitor):
+    """Collect heading text grouped by level."""
+
+    tags = frozenset(f"h{i}" for i in range(1, 7))
+
+    def start(self, context: ExtractionContext) -> None:
+        self.headings: dict[str, list[str]] = {f"h{i}": [] for i in range(1, 7)}
+
+    def visit(self, tree: NodeTree, index: int) -> None:
+        text = tree.text(index)
+        if text:
+            self.headings[tree.tag(index).lower()].append(text)
+
+    def finish(self, context: ExtractionContext) -> dict[str, list[str]]:
+        return {level: items for level, items in self.headings.items() if items}
 
 
 def extract_headings(doc: Document) -> dict[str, list[str]]:
     """Return headings grouped by level from ``doc``."""
-    headings: dict[str, list[str]] = {f"h{i}": [] for i in range(1, 7)}
+    return visit_document(doc, [HeadingVisitor()])[0]
 
-    def _visit(nodes: list[PageNode]) -> None:
-        for node in nodes:
-            if node.tag in headings and node.text:
-                headings[node.tag].append(node.text)
-            if node.children:
-                _visit(node.children)
 
-    _visit(doc.nodes)
-    return {level: items for level, items in headings.items() if items}
+register_visitor(extract_headings, HeadingVisitor)
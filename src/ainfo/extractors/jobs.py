@@ -2,39 +2,47 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
 import re
 
-from ..models import Document, PageNode
-
-__all__ = ["extract_job_postings"]
-
-
-_JOB_KEYWORDS = {
-    "job",
-    "career",
-    "position",
-    "vacancy",
-    "opening",
-    "opportunity",
-    "stelle",
-    "stellenangebot",
-    "stellenanzeige",
-    "jobangebot",
-    "karriere",
-    "ausschreibung",
-    "arbeitsplatz",
-    "beruf",
-}
-
-_APPLY_KEYWORDS = {
-    "apply",
-    "bewerb",
-    "jetzt bewerben",
-    "zur bewerbung",
-    "bewerbungsformular",
-    "bewerbung abschicken",
-}
+from ..keywords import KeywordSet
+from ..models import Document, NodeTree
+from .structured import structured_job_postings
+
+__all__ = ["APPLY_KEYWORDS", "JOB_KEYWORDS", "extract_job_postings"]
+
+
+# Keywords in a container's attributes that mark it as a job posting and in
+# a link's label or attributes that mark it as the application link. Both
+# sets can be extended for other languages or site conventions.
+JOB_KEYWORDS = KeywordSet(
+    {
+        "job",
+        "career",
+        "position",
+        "vacancy",
+        "opening",
+        "opportunity",
+        "stelle",
+        "stellenangebot",
+        "stellenanzeige",
+        "jobangebot",
+        "karriere",
+        "ausschreibung",
+        "arbeitsplatz",
+        "beruf",
+    }
+)
+
+APPLY_KEYWORDS = KeywordSet(
+    {
+        "apply",
+        "bewerb",
+        "jetzt bewerben",
+        "zur bewerbung",
+        "bewerbungsformular",
+        "bewerbung abschicken",
+    }
+)
 
 _JOB_CONTAINER_TAGS = {"section", "article", "div", "li"}
 
@@ -79,26 +87,43 @@ _FIELD_PATTERNS: dict[str, tuple[re.Pattern[str], ...]] = {
 }
 
 
-def _iter_nodes(nodes: Iterable[PageNode]) -> Iterable[PageNode]:
-    for node in nodes:
-        yield node
-        if node.children:
-            yield from _iter_nodes(node.children)
+_FIELD_ORDER = {field: order for order, field in enumerate(_FIELD_PATTERNS)}
 
+# Position of a value in document order: the node index and, for fields, the
+# index of the segment within that node. The first value of a container is
+# the one with the smallest position among its descendants.
+_Position = tuple[int, int]
 
-def _collect_segments(node: PageNode) -> list[str]:
-    segments: list[str] = []
 
-    for descendant in _iter_nodes(node.children):
-        if not descendant.text:
-            continue
-        tag = descendant.tag.lower()
-        if tag in _HEADING_TAGS or tag in _TEXT_TAGS:
-            segments.extend(_split_segment(descendant.text))
-        elif not descendant.children:
-            segments.extend(_split_segment(descendant.text))
+class _Summary:
+    """First field values, heading and apply link found within a subtree."""
+
+    __slots__ = ("fields", "heading", "apply_url", "has_segments")
 
-    return segments
+    def __init__(self) -> None:
+        self.fields: dict[str, tuple[_Position, str]] = {}
+        self.heading: tuple[_Position, str] | None = None
+        self.apply_url: tuple[_Position, str] | None = None
+        self.has_segments = False
+
+    def merge(self, other: "_Summary") -> None:
+        for field, item in other.fields.items():
+            current = self.fields.get(field)
+            if current is None or item[0] < current[0]:
+                self.fields[field] = item
+        if other.heading and (self.heading is None or other.heading[0] < self.heading[0]):
+            self.heading = other.heading
+        if other.apply_url and (
+            self.apply_url is None or other.apply_url[0] < self.apply_url[0]
+        ):
+            self.apply_url = other.apply_url
+        self.has_segments = self.has_segments or other.has_segments
+
+
+def _node_segments(tree: NodeTree, index: int, tag: str, text: str) -> list[str]:
+    if tag in _HEADING_TAGS or tag in _TEXT_TAGS or not tree.has_children(index):
+        return _split_segment(text)
+    return []
 
 
 def _split_segment(text: str) -> list[str]:
@@ -107,31 +132,22 @@ def _split_segment(text: str) -> list[str]:
     return [part for part in cleaned if part]
 
 
-def _first_heading(node: PageNode) -> str | None:
-    for descendant in _iter_nodes(node.children):
-        if descendant.tag.lower() in _HEADING_TAGS and descendant.text:
-            return descendant.text.strip()
-    return None
-
-
-def _collect_apply_link(node: PageNode) -> str | None:
-    for descendant in _iter_nodes(node.children):
-        if descendant.tag.lower() != "a":
-            continue
-        href = descendant.attrs.get("href")
-        if not href:
-            continue
-        label = descendant.text.lower() if descendant.text else ""
-        attr_tokens = " ".join(descendant.attrs.values()).lower()
-        if any(keyword in label or keyword in attr_tokens for keyword in _APPLY_KEYWORDS):
-            return href.strip()
+def _apply_link(tree: NodeTree, index: int, text: str) -> str | None:
+    attrs = tree.attrs[index]
+    href = attrs.get("href")
+    if not href:
+        return None
+    label = text.lower()
+    attr_tokens = " ".join(attrs.values()).lower()
+    if APPLY_KEYWORDS.found_in(label) or APPLY_KEYWORDS.found_in(attr_tokens):
+        return href.strip()
     return None
 
 
-def _extract_fields(segments: list[str]) -> dict[str, str]:
-    fields: dict[str, str] = {}
+def _extract_fields(index: int, segments: list[str]) -> dict[str, tuple[_Position, str]]:
+    fields: dict[str, tuple[_Position, str]] = {}
 
-    for segment in segments:
+    for number, segment in enumerate(segments):
         for field, patterns in _FIELD_PATTERNS.items():
             if field in fields:
                 continue
@@ -142,15 +158,53 @@ def _extract_fields(segments: list[str]) -> dict[str, str]:
                     # Remove trailing punctuation that often concludes inline sentences.
                     value = value.rstrip(".;, ")
                     if value:
-                        fields[field] = value
+                        fields[field] = ((index, number), value)
                     break
 
     return fields
 
 
-def _looks_like_job(node: PageNode, data: dict[str, str]) -> bool:
-    attr_values = " ".join(node.attrs.values()).lower()
-    if any(keyword in attr_values for keyword in _JOB_KEYWORDS):
+def _summarise(tree: NodeTree, index: int) -> _Summary | None:
+    """Return what node ``index`` itself contributes to its ancestors."""
+
+    text = tree.text(index)
+    tag = tree.tag(index).lower()
+    summary = _Summary()
+
+    if tag == "a":
+        link = _apply_link(tree, index, text)
+        if link:
+            summary.apply_url = ((index, 0), link)
+    if not text:
+        return summary if summary.apply_url else None
+
+    segments = _node_segments(tree, index, tag, text)
+    if segments:
+        summary.has_segments = True
+        summary.fields = _extract_fields(index, segments)
+    if tag in _HEADING_TAGS:
+        summary.heading = ((index, 0), text.strip())
+    return summary
+
+
+def _posting(summary: _Summary) -> dict[str, str]:
+    items = sorted(
+        summary.fields.items(), key=lambda item: (item[1][0], _FIELD_ORDER[item[0]])
+    )
+    data = {field: value for field, (_, value) in items}
+
+    if summary.heading and "position" not in data:
+        data["position"] = summary.heading[1]
+
+    if summary.apply_url:
+        data.setdefault("apply_url", summary.apply_url[1])
+
+    return data
+
+
+def _looks_like_job(tree: NodeTree, index: int, data: dict[str, str]) -> bool:
+    attr_values = " ".join(tree.attrs[index].values()).lower()
+    if JOB_KEYWORDS.found_in(attr_values):
         return True
 
     meaningful = {key: value for key, value in data.items() if key != "description"}
@@ -162,35 +216,52 @@ def extract_job_postings(doc: Document) -> list[dict[str, str]]:
 
     The extractor searches for containers that look like job advertisements and
     returns the structured details (position, location, employment type, etc.)
-    when available.
+    when available. ``JobPosting`` items in the page's structured data come
+    first; containers describing a position already listed there are skipped.
+
+    The tree is processed in a single bottom-up pass: visiting nodes in reverse
+    document order handles every descendant before its ancestors, so segments,
+    headings, apply links and field matches are computed once per node and
+    merged into the parent's summary.
     """
 
+    tree = doc.tree
+    # Summaries of each node's descendants, keyed by node index.
+    below: dict[int, _Summary] = {}
     postings: list[dict[str, str]] = []
 
-    for node in _iter_nodes(doc.nodes):
-        if node.tag.lower() not in _JOB_CONTAINER_TAGS:
-            continue
-
-        segments = _collect_segments(node)
-        if not segments:
+    for index in reversed(range(len(tree))):
+        summary = below.pop(index, None)
+
+        if (
+            summary is not None
+            and summary.has_segments
+            and tree.tag(index).lower() in _JOB_CONTAINER_TAGS
+        ):
+            data = _posting(summary)
+            if data and _looks_like_job(tree, index, data):
+                postings.append(data)
+
+        own = _summarise(tree, index)
+        if own is not None:
+            if summary is not None:
+                own.merge(summary)
+            summary = own
+
+        parent = tree.parents[index]
+        if summary is None or parent < 0:
             continue
-
-        data = _extract_fields(segments)
-
-        heading = _first_heading(node)
-        if heading and "position" not in data:
-            data["position"] = heading
-
-        apply_link = _collect_apply_link(node)
-        if apply_link:
-            data.setdefault("apply_url", apply_link)
-
-        if not data:
-            continue
-
-        if not _looks_like_job(node, data):
-            continue
-
-        postings.append(data)
-
-    return postings
+        siblings = below.get(parent)
+        if siblings is None:
+            below[parent] = summary
+        else:
+            siblings.merge(summary)
+
+    postings.reverse()
+    structured = structured_job_postings(doc)
+    if not structured:
+        return postings
+    positions = {posting.get("position") for posting in structured}
+    return structured + [
+        posting for posting in postings if posting.get("position") not in positions
+    ]
@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-from ..models import Document, PageNode
+from ..models import Document, NodeTree
+from .engine import ExtractionContext, NodeVisitor, register_visitor, visit_document
 
-__all__ = ["extract_links"]
+__all__ = ["extract_links", "LinkVisitor"]
+
+
+class LinkVisitor(NodeVisitor):
+    """Collect the ``href`` of every anchor in document order."""
+
+    tags = frozenset({"a"})
+
+    def start(self, context: ExtractionContext) -> None:
+        self.links: list[str] = []
+
+    def visit(self, tree: NodeTree, index: int) -> None:
+        href = tree.attrs[index].get("href")
+        if href:
+            self.links.append(href)
+
+    def finish(self, context: ExtractionContext) -> list[str]:
+        return list(dict.fromkeys(self.links))
 
 
 def extract_links(doc: Document) -> list[str]:
     """Return all hyperlink URLs from ``doc``."""
-    links: list[str] = []
-
-    def _visit(nodes: list[PageNode]) -> None:
-        for node in nodes:
-            if node.tag == "a":
-                href = node.attrs.get("href")
-                if href:
-                    links.append(href)
-            if node.children:
-                _visit(node.children)
-
-    _visit(doc.nodes)
-    return list(dict.fromkeys(links))
+    return visit_document(doc, [LinkVisitor()])[0]
+
+
+register_visitor(extract_links, LinkVisitor)
@@ -0,0 +1,237 @@
+"""Registry of named extractors with lazy loading and declared inputs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from dataclasses import dataclass, field
+import importlib
+from importlib.metadata import entry_points
+import logging
+from typing import Any
+
+from ..page_types import PAGE_TYPES
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ARTIFACTS",
+    "ENTRY_POINT_GROUP",
+    "ExtractorRegistry",
+    "ExtractorSpec",
+    "requires",
+    "runs_on",
+]
+
+# Document artifacts an extractor may depend on:
+#
+# ``tree``          the parsed node structure and attributes
+# ``links``         the hyperlinks of the page
+# ``text``          the full page text, including navigation and footers
+# ``content_text``  the text of nodes classified as primary content
+#
+# The text layers and the navigation classification behind ``content_text``
+# are computed lazily, so a run whose extractors only need ``tree`` or
+# ``links`` never builds them.
+ARTIFACTS = frozenset({"tree", "links", "text", "content_text"})
+
+# Entry point group scanned for third-party extractors.
+ENTRY_POINT_GROUP = "ainfo.extractors"
+
+
+def requires(*artifacts: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Declare the :data:`ARTIFACTS` an extractor function needs.
+
+    Extractors without a declaration are assumed to need every artifact.
+    """
+
+    inputs = _check_inputs(artifacts)
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.__ainfo_inputs__ = inputs  # type: ignore[attr-defined]
+        return func
+
+    return decorate
+
+
+def runs_on(*page_types: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Declare the :data:`~ainfo.page_types.PAGE_TYPES` an extractor is useful on.
+
+    When pages are classified, the extractor is skipped on pages of other
+    types. Extractors without a declaration run on every page.
+    """
+
+    types = _check_page_types(page_types)
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.__ainfo_page_types__ = types  # type: ignore[attr-defined]
+        return func
+
+    return decorate
+
+
+def _check_page_types(page_types: Iterable[str]) -> frozenset[str]:
+    page_types = frozenset(page_types)
+    unknown = page_types - set(PAGE_TYPES)
+    if unknown:
+        msg = f"Unknown page types: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return page_types
+
+
+def _check_inputs(inputs: Iterable[str]) -> frozenset[str]:
+    inputs = frozenset(inputs)
+    unknown = inputs - ARTIFACTS
+    if unknown:
+        msg = f"Unknown extractor inputs: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return inputs
+
+
+@dataclass
+class ExtractorSpec:
+    """A registered extractor that is imported when first used.
+
+    Parameters
+    ----------
+    name:
+        Name used to select the extractor.
+    target:
+        The extractor function, or a ``"module:attribute"`` reference that is
+        imported on first use.
+    inputs:
+        Artifacts the extractor needs. ``None`` uses the declaration made
+        with :func:`requires` on the loaded function, or all artifacts.
+    page_types:
+        Page types the extractor runs on when pages are classified. ``None``
+        uses the declaration made with :func:`runs_on` on the loaded
+        function, or every page type.
+    """
+
+    name: str
+    target: str | Callable[..., Any]
+    inputs: frozenset[str] | None = None
+    page_types: frozenset[str] | None = None
+    _func: Callable[..., Any] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.inputs is not None:
+            self.inputs = _check_inputs(self.inputs)
+        if self.page_types is not None:
+            self.page_types = _check_page_types(self.page_types)
+        if callable(self.target):
+            self._func = self.target
+
+    def load(self) -> Callable[..., Any]:
+        """Return the extractor function, importing it if necessary."""
+
+        if self._func is None:
+            module_name, _, attribute = str(self.target).partition(":")
+            value: Any = importlib.import_module(module_name)
+            for part in filter(None, attribute.split(".")):
+                value = getattr(value, part)
+            self._func = value
+        return self._func
+
+    def required_inputs(self) -> frozenset[str]:
+        """Return the artifacts needed by this extractor."""
+
+        if self.inputs is None:
+            declared = getattr(self.load(), "__ainfo_inputs__", None)
+            self.inputs = ARTIFACTS if declared is None else _check_inputs(declared)
+        return self.inputs
+
+    def runs_on(self, page_type: str) -> bool:
+        """Return whether the extractor should run on pages of ``page_type``."""
+
+        if self.page_types is None:
+            declared = getattr(self.load(), "__ainfo_page_types__", None)
+            self.page_types = (
+                frozenset(PAGE_TYPES) if declared is None else _check_page_types(declared)
+            )
+        return page_type in self.page_types
+
+
+class ExtractorRegistry(MutableMapping[str, Callable[..., Any]]):
+    """Mapping of extractor names to functions, loaded on demand.
+
+    Besides explicit registrations, extractors advertised by installed
+    packages under the :data:`ENTRY_POINT_GROUP` entry point group are
+    discovered the first time the registry is consulted. They are only
+    imported when selected. Assigning a function to a name, as with a plain
+    dictionary, registers it as well.
+    """
+
+    def __init__(self, *, entry_point_group: str | None = ENTRY_POINT_GROUP) -> None:
+        self._specs: dict[str, ExtractorSpec] = {}
+        self._entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+
+    def register(
+        self,
+        name: str,
+        target: str | Callable[..., Any],
+        *,
+        inputs: Iterable[str] | None = None,
+        page_types: Iterable[str] | None = None,
+    ) -> ExtractorSpec:
+        """Register ``target`` under ``name`` and return its specification."""
+
+        spec = ExtractorSpec(
+            name,
+            target,
+            None if inputs is None else frozenset(inputs),
+            None if page_types is None else frozenset(page_types),
+        )
+        self._specs[name] = spec
+        return spec
+
+    def spec(self, name: str) -> ExtractorSpec:
+        """Return the specification registered under ``name``."""
+
+        self._discover()
+        return self._specs[name]
+
+    def required_inputs(self, names: Iterable[str]) -> frozenset[str]:
+        """Return the artifacts needed to run the extractors ``names``."""
+
+        needed: set[str] = set()
+        for name in names:
+            needed |= self.spec(name).required_inputs()
+        return frozenset(needed)
+
+    def for_page(self, names: Iterable[str], page_type: str) -> list[str]:
+        """Return the extractors of ``names`` that run on pages of ``page_type``."""
+
+        return [name for name in names if self.spec(name).runs_on(page_type)]
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        self._discovered = True
+        for entry_point in entry_points(group=self._entry_point_group):
+            if entry_point.name in self._specs:
+                continue
+            logger.debug("Discovered extractor %s (%s)", entry_point.name, entry_point.value)
+            self.register(entry_point.name, entry_point.value)
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        return self.spec(name).load()
+
+    def __setitem__(self, name: str, func: Callable[..., Any]) -> None:
+        self.register(name, func)
+
+    def __delitem__(self, name: str) -> None:
+        self._discover()
+        del self._specs[name]
+
+    def __contains__(self, name: object) -> bool:
+        self._discover()
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._specs)
@@ -0,0 +1,229 @@
+"""Map schema.org structured data to contact details and job postings."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import re
+from typing import TYPE_CHECKING, Any
+
+from ..schemas import Address, ContactDetails
+from .contact import extract_phone_numbers, infer_region
+from .social import SOCIAL_PATTERN
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from ..models import Document
+
+__all__ = [
+    "merge_contacts",
+    "structured_contacts",
+    "structured_job_postings",
+]
+
+_JOB_TYPES = {"JobPosting"}
+
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _types(item: dict[str, Any]) -> set[str]:
+    """Return the schema.org type names of ``item`` without their prefixes."""
+
+    value = item.get("@type")
+    values = value if isinstance(value, list) else [value]
+    return {
+        re.split(r"[/:#]", entry.rstrip("/"))[-1]
+        for entry in values
+        if isinstance(entry, str) and entry
+    }
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _strings(value: Any) -> list[str]:
+    """Return the non-empty strings in ``value``, a string or a list."""
+
+    entries = (entry.strip() for entry in _as_list(value) if isinstance(entry, str))
+    return [entry for entry in entries if entry]
+
+
+def _name(value: Any) -> str | None:
+    """Return ``value`` if it is a string, or the ``name`` of an item."""
+
+    for entry in _as_list(value):
+        if isinstance(entry, dict):
+            entry = entry.get("name")
+        if isinstance(entry, str) and entry.strip():
+            return entry.strip()
+    return None
+
+
+def _walk(items: Iterable[Any], *, skip: set[str]) -> Iterator[dict[str, Any]]:
+    """Yield ``items`` and every nested item, leaving out items of ``skip`` types."""
+
+    stack = list(items)[::-1]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+            continue
+        if not isinstance(item, dict) or _types(item) & skip:
+            continue
+        yield item
+        nested = [value for value in item.values() if isinstance(value, (dict, list))]
+        stack.extend(reversed(nested))
+
+
+def _address(value: Any) -> Address | str | None:
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip() or None
+    if not isinstance(value, dict):
+        return None
+    address = Address(
+        street=_name(value.get("streetAddress")),
+        city=_name(value.get("addressLocality")),
+        postal_code=_name(value.get("postalCode")),
+        country=_name(value.get("addressCountry")),
+    )
+    if not any(address.model_dump().values()):
+        return None
+    return address
+
+
+def _append_unique(target: list[Any], values: Iterable[Any]) -> None:
+    for value in values:
+        if value not in target:
+            target.append(value)
+
+
+def structured_contacts(doc: Document) -> ContactDetails:
+    """Return the contact details given by the structured data of ``doc``.
+
+    ``email``, ``telephone``, ``address`` and ``sameAs`` properties of every
+    item, such as ``Organization``, ``LocalBusiness`` or a nested
+    ``ContactPoint``, are collected. Items inside a ``JobPosting`` are left
+    out, since they describe the job rather than the site. Telephone numbers
+    are normalised like those found in the text, and only ``sameAs`` links to
+    known social networks are reported as social media.
+    """
+
+    def compute() -> ContactDetails:
+        details = ContactDetails()
+        region = infer_region(doc) if doc.structured_data else None
+        for item in _walk(doc.structured_data, skip=_JOB_TYPES):
+            emails = [
+                email.removeprefix("mailto:").split("?", 1)[0]
+                for email in _strings(item.get("email"))
+            ]
+            _append_unique(details.emails, emails)
+            for phone in _strings(item.get("telephone")):
+                numbers = extract_phone_numbers(phone, region) or [phone]
+                _append_unique(details.phone_numbers, numbers)
+            addresses = (_address(value) for value in _as_list(item.get("address")))
+            _append_unique(details.addresses, (value for value in addresses if value))
+            profiles = _strings(item.get("sameAs"))
+            _append_unique(
+                details.social_media, (url for url in profiles if SOCIAL_PATTERN.search(url))
+            )
+        return details
+
+    return doc.memo("structured_contacts", compute).model_copy(deep=True)
+
+
+def merge_contacts(first: ContactDetails, second: ContactDetails) -> ContactDetails:
+    """Return the contact details of ``first`` followed by those of ``second``.
+
+    Values of ``second`` already listed in ``first`` are left out. The lists
+    of ``second`` are otherwise kept as they are, so regex and LLM results
+    are reported exactly as before when a page has no structured data.
+    """
+
+    merged = first.model_copy(deep=True)
+    for field in ("emails", "phone_numbers", "addresses", "social_media"):
+        known = getattr(first, field)
+        getattr(merged, field).extend(
+            value for value in getattr(second, field) if value not in known
+        )
+    return merged
+
+
+def _location(value: Any) -> str | None:
+    parts: list[str] = []
+    for place in _as_list(value):
+        if isinstance(place, str):
+            parts.append(place.strip())
+            continue
+        if not isinstance(place, dict):
+            continue
+        address = place.get("address", place)
+        if isinstance(address, str):
+            parts.append(address.strip())
+        elif isinstance(address, dict):
+            fields = ("addressLocality", "addressRegion", "addressCountry")
+            names = [_name(address.get(field)) for field in fields]
+            parts.append(", ".join(name for name in names if name))
+    text = "; ".join(part for part in parts if part)
+    return text or None
+
+
+def _salary(value: Any) -> str | None:
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    if not isinstance(value, dict):
+        return None
+    amount = value.get("value")
+    unit = None
+    if isinstance(amount, dict):
+        unit = amount.get("unitText")
+        if "minValue" in amount or "maxValue" in amount:
+            bounds = [amount.get("minValue"), amount.get("maxValue")]
+            amount = "-".join(str(bound) for bound in bounds if bound is not None)
+        else:
+            amount = amount.get("value")
+    if amount is None or amount == "":
+        return None
+    text = f"{value.get('currency', '')} {amount}".strip()
+    return f"{text} per {unit}" if isinstance(unit, str) and unit else text
+
+
+def _posting(item: dict[str, Any]) -> dict[str, str]:
+    data: dict[str, str] = {}
+    values = {
+        "company": _name(item.get("hiringOrganization")),
+        "position": _name(item.get("title")) or _name(item.get("name")),
+        "location": _location(item.get("jobLocation")),
+        "employment_type": ", ".join(_strings(item.get("employmentType"))) or None,
+        "salary": _salary(item.get("baseSalary")),
+    }
+    if values["location"] is None and "TELECOMMUTE" in _strings(item.get("jobLocationType")):
+        values["location"] = "Remote"
+    for field, value in values.items():
+        if value:
+            data[field] = value
+    url = _name(item.get("url"))
+    if url:
+        data["apply_url"] = url
+    description = _name(item.get("description"))
+    if description:
+        data["description"] = _WHITESPACE.sub(" ", _TAG.sub(" ", description)).strip()
+    return data
+
+
+def structured_job_postings(doc: Document) -> list[dict[str, str]]:
+    """Return the ``JobPosting`` items of ``doc`` in the job posting format.
+
+    The keys match :func:`~ainfo.extractors.jobs.extract_job_postings`:
+    ``position``, ``company``, ``location``, ``employment_type``, ``salary``,
+    ``apply_url`` and ``description``, each only when present.
+    """
+
+    postings = []
+    for item in _walk(doc.structured_data, skip=set()):
+        if _types(item) & _JOB_TYPES:
+            posting = _posting(item)
+            if posting:
+                postings.append(posting)
+    return postings
@@ -0,0 +1,107 @@
+"""Persist extraction results between runs to skip unchanged pages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ResultStore"]
+
+
+class ResultStore:
+    """SQLite store of per-URL content fingerprints and extraction results.
+
+    Each row records the content hash a page had when it was last processed
+    and the results produced for it under a given extraction configuration.
+    When a later run sees the same URL with the same hash and configuration,
+    the stored results are reused instead of parsing and extracting again.
+
+    Parameters
+    ----------
+    path:
+        Location of the SQLite database. ``":memory:"`` keeps the store for
+        the lifetime of the object only.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " url TEXT NOT NULL,"
+                " config TEXT NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " results TEXT NOT NULL,"
+                " updated REAL NOT NULL,"
+                " PRIMARY KEY (url, config))"
+            )
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM pages").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def config_key(**settings: Any) -> str:
+        """Return a key identifying the extraction ``settings`` of a run.
+
+        Results are only reused for runs with the same settings, such as the
+        selected extractors and whether text is included.
+        """
+
+        encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def get(self, url: str, config: str, digest: str) -> dict[str, Any] | None:
+        """Return the stored results for ``url`` if its content is unchanged."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT digest, results FROM pages WHERE url = ? AND config = ?",
+                (url, config),
+            ).fetchone()
+        if row is None or row[0] != digest:
+            return None
+        return json.loads(row[1])
+
+    def put(self, url: str, config: str, digest: str, results: dict[str, Any]) -> None:
+        """Store ``results`` for ``url`` with the content ``digest``.
+
+        Results that cannot be encoded as JSON are not stored.
+        """
+
+        try:
+            encoded = json.dumps(results)
+        except (TypeError, ValueError) as exc:
+            logger.debug("Not storing results for %s: %s", url, exc)
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (url, config, digest, results, updated)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (url, config, digest, encoded, time.time()),
+            )
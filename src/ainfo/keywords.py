@@ -0,0 +1,116 @@
+"""Keyword sets matched against attribute and label strings in one pass."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, MutableSet
+from functools import lru_cache
+import hashlib
+import re
+from typing import Any
+
+__all__ = ["KeywordSet"]
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Return a regular expression matching any of ``keywords``.
+
+    The keywords are merged into a prefix trie, so the pattern shares common
+    prefixes and the regex engine discards most keywords after looking at a
+    single character, however long the list is. Only the presence of a match
+    matters, so keywords extending another keyword are dropped.
+    """
+
+    trie: dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie) if trie else "(?!)"
+
+
+class KeywordSet(MutableSet[str]):
+    """A mutable set of lower-case keywords searched for as substrings.
+
+    All keywords are compiled into a single regular expression, and results
+    are cached per searched string, which usually repeats across elements
+    and pages. Adding or removing keywords rebuilds the expression, so the
+    built-in keyword sets can be extended with site- or language-specific
+    terms at runtime.
+
+    Parameters
+    ----------
+    keywords:
+        Initial keywords. They are lower-cased and empty strings are ignored.
+    cache_size:
+        Number of distinct strings whose result is cached.
+    """
+
+    def __init__(self, keywords: Iterable[str] = (), *, cache_size: int = 4096) -> None:
+        self._keywords: set[str] = set()
+        self._cache_size = cache_size
+        self._search: Callable[[str], bool] | None = None
+        self.update(keywords)
+
+    def __contains__(self, keyword: object) -> bool:
+        return isinstance(keyword, str) and keyword.lower() in self._keywords
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._keywords))
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self._keywords)!r})"
+
+    def add(self, keyword: str) -> None:
+        keyword = keyword.lower()
+        if keyword and keyword not in self._keywords:
+            self._keywords.add(keyword)
+            self._changed()
+
+    def discard(self, keyword: str) -> None:
+        keyword = keyword.lower()
+        if keyword in self._keywords:
+            self._keywords.remove(keyword)
+            self._changed()
+
+    def update(self, keywords: Iterable[str]) -> None:
+        """Add every keyword in ``keywords``."""
+
+        for keyword in keywords:
+            self.add(keyword)
+
+    @property
+    def signature(self) -> str:
+        """Short hash of the keywords, for cache keys that depend on them."""
+
+        joined = "\n".join(sorted(self._keywords)).encode("utf-8")
+        return hashlib.sha256(joined).hexdigest()[:12]
+
+    def found_in(self, text: str) -> bool:
+        """Return ``True`` if any keyword occurs in ``text``.
+
+        ``text`` is expected to be lower-case already.
+        """
+
+        if self._search is None:
+            pattern = re.compile(_trie_pattern(self._keywords))
+            self._search = lru_cache(maxsize=self._cache_size)(
+                lambda value: pattern.search(value) is not None
+            )
+        return self._search(text)
+
+    def _changed(self) -> None:
+        # The pattern and its cached results are rebuilt on the next search.
+        self._search = None
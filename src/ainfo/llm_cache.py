@@ -0,0 +1,180 @@
+"""Cache LLM responses by a hash of the endpoint, model and messages sent."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["LLMCache"]
+
+
+class LLMCache:
+    """Two-tier cache of LLM responses.
+
+    Responses are kept in an in-memory LRU and, when ``path`` is given, in a
+    SQLite database so that later runs can reuse them. Entries are keyed by
+    :meth:`key`, the SHA-256 of the API endpoint, the model name and the
+    chat messages, so a response is only reused for exactly the same request.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of responses kept in memory.
+    path:
+        Optional location of the SQLite database for the on-disk tier.
+    ttl:
+        Seconds after which a response is no longer reused. ``None`` keeps
+        responses until they are evicted.
+    max_disk_entries:
+        Maximum number of responses kept on disk. Responses that were
+        stored or read from disk least recently are removed first. ``None``
+        means no limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        path: str | Path | None = None,
+        *,
+        ttl: float | None = None,
+        max_disk_entries: int | None = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_disk_entries is not None and max_disk_entries <= 0:
+            raise ValueError("max_disk_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.path = str(path) if path is not None else None
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        if self.path is not None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " response TEXT NOT NULL,"
+                    " created REAL NOT NULL,"
+                    " accessed REAL NOT NULL)"
+                )
+
+    def __enter__(self) -> "LLMCache":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        """Close the on-disk tier, if any."""
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def key(
+        model: str, messages: list[dict[str, str]], *, endpoint: str | None = None
+    ) -> str:
+        """Return the cache key of a chat request for ``model`` at ``endpoint``.
+
+        ``endpoint`` is the base URL of the API, since the same model name
+        may refer to different models at different providers.
+        """
+
+        encoded = json.dumps(
+            {"endpoint": endpoint, "model": model, "messages": messages},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or ``None`` on a miss."""
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                del self._entries[key]
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created = row
+            with self._connection:
+                if self._expired(created, now):
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                self._connection.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                )
+            self._remember(key, response, created)
+        logger.debug("Serving LLM response %s from the disk cache", key[:12])
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key`` in both tiers."""
+
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now)
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created, accessed)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                if self.max_disk_entries is not None:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        " SELECT key FROM responses ORDER BY accessed DESC"
+                        " LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+
+    def clear(self) -> None:
+        """Remove every cached response from both tiers."""
+
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM responses")
+
+    def _remember(self, key: str, response: str, created: float) -> None:
+        # Called with the lock held.
+        self._entries[key] = (response, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
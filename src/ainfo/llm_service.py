@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+
 import httpx
 
 from .config import LLMConfig
+from .llm_cache import LLMCache
 
 
 DEFAULT_SUMMARY_LANGUAGE = "German"
@@ -44,12 +48,29 @@ def build_summary_prompt(language: str | None = None) -> str:
 DEFAULT_SUMMARY_PROMPT = build_summary_prompt()
 
 
+def _open_cache(cache: LLMCache | str | Path | None) -> tuple[LLMCache | None, bool]:
+    """Return the response cache for ``cache`` and whether the service owns it."""
+
+    if isinstance(cache, (str, Path)):
+        return LLMCache(path=cache), True
+    return cache, False
 
 
 class LLMService:
-    """Client for interacting with an LLM via the OpenRouter API."""
+    """Client for interacting with an LLM via the OpenRouter API.
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    Responses are cached when ``cache`` is given, either as an
+    :class:`~ainfo.llm_cache.LLMCache` or as the path of its SQLite
+    database. Identical requests for the same model are then answered from
+    the cache instead of the API.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        *,
+        cache: LLMCache | str | Path | None = None,
+    ) -> None:
         self.config = config or LLMConfig()
         configured_language = (
             self.config.summary_language or DEFAULT_SUMMARY_LANGUAGE
@@ -64,6 +85,7 @@ class LLMService:
             raise RuntimeError(msg)
         headers = {"Authorization": f"Bearer {self.config.api_key}"}
         self._client = httpx.Client(base_url=self.config.base_url, headers=headers)
+        self.cache, self._owns_cache = _open_cache(cache)
 
     # ------------------------------------------------------------------
     # lifecycle management
@@ -72,6 +94,8 @@ class LLMService:
         """Close the underlying :class:`httpx.Client` instance."""
 
         self._client.close()
+        if self._owns_cache:
+            self.cache.close()
 
     def __enter__(self) -> "LLMService":
         return self
@@ -82,11 +106,24 @@ class LLMService:
         return False
 
     def _chat(self, messages: list[dict[str, str]], model: str | None = None) -> str:
-        payload = {"model": model or self.config.model, "messages": messages}
+        model = model or self.config.model
+        key = (
+            self.cache.key(model, messages, endpoint=str(self._client.base_url))
+            if self.cache is not None
+            else None
+        )
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        payload = {"model": model, "messages": messages}
         resp = self._client.post("/chat/completions", json=payload, timeout=60)
         resp.raise_for_status()
         data = resp.json()
-        return data["choices"][0]["message"]["content"].strip()
+        content = data["choices"][0]["message"]["content"].strip()
+        if key is not None:
+            self.cache.put(key, content)
+        return content
 
     def extract(self, text: str, instruction: str, model: str | None = None) -> str:
         """Return the model's response to ``instruction`` applied to ``text``.
@@ -132,9 +169,19 @@ class LLMService:
 
 
 class AsyncLLMService:
-    """Asynchronous variant of :class:`LLMService`."""
+    """Asynchronous variant of :class:`LLMService`.
+
+    The response ``cache`` works as for :class:`LLMService`; lookups and
+    writes run in a worker thread so the on-disk tier does not block the
+    event loop.
+    """
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        *,
+        cache: LLMCache | str | Path | None = None,
+    ) -> None:
         self.config = config or LLMConfig()
         configured_language = (
             self.config.summary_language or DEFAULT_SUMMARY_LANGUAGE
@@ -151,13 +198,29 @@ class AsyncLLMService:
         self._client = httpx.AsyncClient(
             base_url=self.config.base_url, headers=headers
         )
+        self.cache, self._owns_cache = _open_cache(cache)
 
     async def _chat(self, messages: list[dict[str, str]], model: str | None = None) -> str:
-        payload = {"model": model or self.config.model, "messages": messages}
+        model = model or self.config.model
+        key = (
+            self.cache.key(model, messages, endpoint=str(self._client.base_url))
+            if self.cache is not None
+            else None
+        )
+        if key is not None:
+            # The cache may read from and write to SQLite, so it is used
+            # from a worker thread to keep the event loop responsive.
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+        payload = {"model": model, "messages": messages}
         resp = await self._client.post("/chat/completions", json=payload, timeout=60)
         resp.raise_for_status()
         data = resp.json()
-        return data["choices"][0]["message"]["content"].strip()
+        content = data["choices"][0]["message"]["content"].strip()
+        if key is not None:
+            await asyncio.to_thread(self.cache.put, key, content)
+        return content
 
     async def extract(
         self, text: str, instruction: str, model: str | None = None
@@ -186,6 +249,8 @@ class AsyncLLMService:
 
     async def aclose(self) -> None:
         await self._client.aclose()
+        if self._owns_cache:
+            self.cache.close()
 
     async def __aenter__(self) -> "AsyncLLMService":
         return self
@@ -198,6 +263,7 @@ class AsyncLLMService:
 __all__ = [
     "LLMService",
     "AsyncLLMService",
+    "LLMCache",
     "DEFAULT_SUMMARY_PROMPT",
     "DEFAULT_SUMMARY_LANGUAGE",
     "SUMMARY_PROMPT_TEMPLATE",
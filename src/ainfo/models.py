@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from array import array
+from bisect import bisect_right
+import heapq
+import json
+import struct
+import sys
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    GetJsonSchemaHandler,
+    PrivateAttr,
+    computed_field,
+    model_validator,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
 
 
 class PageNode(BaseModel):
@@ -26,8 +43,406 @@ class PageNode(BaseModel):
     )
 
 
+_EMPTY_ATTRS: Dict[str, str] = {}
+
+_CONTENT_FLAG = 1
+
+_TREE_MAGIC = b"AINFOTREE1"
+
+
+class NodeTree:
+    """Compact, array-backed representation of a document tree.
+
+    Nodes are identified by their index in document (pre-)order, so the
+    descendants of node ``i`` are exactly the indices ``i + 1`` up to
+    ``ends[i]``. Per-node data is stored in parallel columns instead of one
+    model instance per element, which keeps parsing cheap on large pages.
+    Attribute mappings are shared with the tree and must not be mutated.
+
+    The document text is stored once in :attr:`text_buffer`. Each node refers
+    to the ``starts[i]:stops[i]`` span of that buffer, so the text of a parent
+    element is never copied for its ancestors.
+
+    Indexes of the nodes per tag name and of the nodes carrying an ``href``
+    are maintained while nodes are added, so :meth:`find` and
+    :attr:`with_href` cost time proportional to the number of matches.
+
+    The text spans and the content :attr:`flags` may be registered as
+    deferred layers with :meth:`defer`. They are then computed the first time
+    they are accessed and kept afterwards.
+    """
+
+    __slots__ = (
+        "tag_names",
+        "tag_ids",
+        "parents",
+        "ends",
+        "attrs",
+        "_starts",
+        "_stops",
+        "_flags",
+        "_text_buffer",
+        "_tag_lookup",
+        "_tag_nodes",
+        "_with_href",
+        "_pieces",
+        "_piece_offsets",
+        "_length",
+        "_deferred",
+    )
+
+    def __init__(self) -> None:
+        self.tag_names: list[str] = []
+        self._tag_lookup: dict[str, int] = {}
+        self._tag_nodes: list[array] = []
+        self._with_href = array("i")
+        self.tag_ids = array("H")
+        self.parents = array("i")
+        self.ends = array("i")
+        self.attrs: list[Dict[str, str]] = []
+        self._starts = array("i")
+        self._stops = array("i")
+        self._flags = bytearray()
+        self._text_buffer = ""
+        self._pieces: list[str] = []
+        self._piece_offsets = array("i")
+        self._length = 0
+        self._deferred: dict[str, Callable[[], None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Deferred layers are closures over the parser's state, which can be
+        # neither pickled nor copied, so they are computed first.
+        self.load("text")
+        self.load("flags")
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_deferred"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._deferred = {}
+
+    # ------------------------------------------------------------------
+    # construction
+    # ------------------------------------------------------------------
+    def add(self, tag: str, attrs: Dict[str, str], parent: int = -1) -> int:
+        """Append a node below ``parent`` and return its index.
+
+        Descendants must be added before the node is closed with
+        :meth:`close`.
+        """
+
+        tag_id = self._tag_lookup.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_lookup[tag] = len(self.tag_names)
+            self.tag_names.append(tag)
+            self._tag_nodes.append(array("i"))
+        index = len(self.tag_ids)
+        self._tag_nodes[tag_id].append(index)
+        if "href" in attrs:
+            self._with_href.append(index)
+        self.tag_ids.append(tag_id)
+        self.parents.append(parent)
+        self.ends.append(index + 1)
+        self.attrs.append(attrs or _EMPTY_ATTRS)
+        self._starts.append(0)
+        self._stops.append(0)
+        self._flags.append(0)
+        return index
+
+    def close(self, index: int) -> None:
+        """Mark all nodes added since ``index`` as its descendants."""
+
+        self.ends[index] = len(self.tag_ids)
+
+    def open_span(self, index: int) -> None:
+        """Start recording the text span of node ``index``."""
+
+        # Until the span is closed ``starts`` holds the number of text pieces
+        # seen before the node; :meth:`close_span` turns it into an offset.
+        self._starts[index] = len(self._pieces)
+
+    def add_text(self, text: str) -> None:
+        """Append a stripped, non-empty string to the text of the open spans."""
+
+        if self._pieces:
+            self._length += 1
+        self._piece_offsets.append(self._length)
+        self._pieces.append(text)
+        self._length += len(text)
+
+    def close_span(self, index: int) -> None:
+        """Finish the text span of node ``index``."""
+
+        first_piece = self._starts[index]
+        if first_piece < len(self._pieces):
+            self._starts[index] = self._piece_offsets[first_piece]
+        else:
+            self._starts[index] = self._length
+        self._stops[index] = self._length
+
+    def finish_text(self) -> None:
+        """Join the collected text pieces into :attr:`text_buffer`."""
+
+        self._text_buffer = " ".join(self._pieces)
+        self._pieces = []
+        self._piece_offsets = array("i")
+        self._length = 0
+
+    def set_content(self, index: int, is_content: bool) -> None:
+        """Record whether node ``index`` contains primary content."""
+
+        self._flags[index] = _CONTENT_FLAG if is_content else 0
+
+    def defer(self, layer: str, loader: Callable[[], None]) -> None:
+        """Compute ``layer`` (``"text"`` or ``"flags"``) with ``loader`` on first use."""
+
+        self._deferred[layer] = loader
+
+    def load(self, layer: str) -> None:
+        """Compute the deferred ``layer`` now if it has not been computed yet."""
+
+        loader = self._deferred.pop(layer, None)
+        if loader is not None:
+            loader()
+
+    @property
+    def text_buffer(self) -> str:
+        """Text of the whole document, shared by all node spans."""
+
+        self.load("text")
+        return self._text_buffer
+
+    @property
+    def starts(self) -> array:
+        """Start offset of every node's span in :attr:`text_buffer`."""
+
+        self.load("text")
+        return self._starts
+
+    @property
+    def stops(self) -> array:
+        """End offset of every node's span in :attr:`text_buffer`."""
+
+        self.load("text")
+        return self._stops
+
+    @property
+    def flags(self) -> bytearray:
+        """Per-node classification flags."""
+
+        self.load("flags")
+        return self._flags
+
+    @classmethod
+    def from_page_nodes(cls, nodes: Iterable[PageNode]) -> "NodeTree":
+        """Build a tree from already materialised :class:`PageNode` objects.
+
+        The text of every node is stored as given, so spans of hand-built
+        nodes do not necessarily contain the text of their children.
+        """
+
+        tree = cls()
+
+        def _add(node: PageNode, parent: int) -> None:
+            index = tree.add(node.tag, node.attrs, parent)
+            tree.open_span(index)
+            if node.text:
+                tree.add_text(node.text)
+            tree.close_span(index)
+            for child in node.children:
+                _add(child, index)
+            tree.close(index)
+            tree.set_content(index, node.is_content)
+
+        for node in nodes:
+            _add(node, -1)
+        tree.finish_text()
+        return tree
+
+    # ------------------------------------------------------------------
+    # serialisation
+    # ------------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        """Return a compact binary representation of the fully loaded tree."""
+
+        self.load("text")
+        self.load("flags")
+        header = json.dumps(
+            {
+                "tags": self.tag_names,
+                "attrs": [attrs or None for attrs in self.attrs],
+                "count": len(self),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        text = self._text_buffer.encode("utf-8")
+        columns = [self.tag_ids, self.parents, self.ends, self._starts, self._stops]
+        if sys.byteorder != "little":  # pragma: no cover - big endian hosts
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        parts = [
+            _TREE_MAGIC,
+            struct.pack("<II", len(header), len(text)),
+            header,
+            text,
+            *(column.tobytes() for column in columns),
+            bytes(self._flags),
+        ]
+        return zlib.compress(b"".join(parts))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "NodeTree":
+        """Rebuild a tree serialised with :meth:`to_bytes`.
+
+        Raises
+        ------
+        ValueError
+            If ``data`` is not a valid serialised tree.
+        """
+
+        try:
+            raw = zlib.decompress(data)
+        except zlib.error as exc:
+            raise ValueError("invalid serialised tree") from exc
+        if raw[: len(_TREE_MAGIC)] != _TREE_MAGIC:
+            raise ValueError("invalid serialised tree")
+        offset = len(_TREE_MAGIC)
+        header_len, text_len = struct.unpack_from("<II", raw, offset)
+        offset += 8
+        header = json.loads(raw[offset : offset + header_len])
+        offset += header_len
+        tree = cls()
+        tree._text_buffer = raw[offset : offset + text_len].decode("utf-8")
+        offset += text_len
+
+        count = header["count"]
+        for name, typecode in (
+            ("tag_ids", "H"),
+            ("parents", "i"),
+            ("ends", "i"),
+            ("_starts", "i"),
+            ("_stops", "i"),
+        ):
+            column = array(typecode)
+            size = count * column.itemsize
+            column.frombytes(raw[offset : offset + size])
+            if sys.byteorder != "little":  # pragma: no cover - big endian hosts
+                column.byteswap()
+            setattr(tree, name, column)
+            offset += size
+        tree._flags = bytearray(raw[offset : offset + count])
+        if len(tree._flags) != count or len(tree.tag_ids) != count:
+            raise ValueError("truncated serialised tree")
+
+        tree.tag_names = list(header["tags"])
+        tree._tag_lookup = {tag: i for i, tag in enumerate(tree.tag_names)}
+        tree.attrs = [attrs or _EMPTY_ATTRS for attrs in header["attrs"]]
+        tree._tag_nodes = [array("i") for _ in tree.tag_names]
+        for index, tag_id in enumerate(tree.tag_ids):
+            tree._tag_nodes[tag_id].append(index)
+            if "href" in tree.attrs[index]:
+                tree._with_href.append(index)
+        return tree
+
+    # ------------------------------------------------------------------
+    # accessors
+    # ------------------------------------------------------------------
+    def tag(self, index: int) -> str:
+        """Return the tag name of node ``index``."""
+
+        return self.tag_names[self.tag_ids[index]]
+
+    def text(self, index: int) -> str:
+        """Return the text contained within node ``index``."""
+
+        self.load("text")
+        return self._text_buffer[self._starts[index] : self._stops[index]]
+
+    def is_content(self, index: int) -> bool:
+        """Return whether node ``index`` was classified as primary content."""
+
+        return bool(self.flags[index] & _CONTENT_FLAG)
+
+    def find(self, *tags: str) -> list[int]:
+        """Return the indices of nodes with any of ``tags`` in document order.
+
+        Tag names are compared case-insensitively.
+        """
+
+        wanted = {tag.lower() for tag in tags}
+        matches = [
+            self._tag_nodes[tag_id]
+            for tag_id, name in enumerate(self.tag_names)
+            if name.lower() in wanted
+        ]
+        if len(matches) == 1:
+            return list(matches[0])
+        return list(heapq.merge(*matches))
+
+    @property
+    def with_href(self) -> array:
+        """Indices of nodes carrying an ``href`` attribute, in document order."""
+
+        return self._with_href
+
+    def has_children(self, index: int) -> bool:
+        """Return ``True`` if node ``index`` has at least one child."""
+
+        return self.ends[index] > index + 1
+
+    def children(self, index: int) -> Iterator[int]:
+        """Yield the indices of the direct children of ``index``."""
+
+        child = index + 1
+        end = self.ends[index]
+        while child < end:
+            yield child
+            child = self.ends[child]
+
+    def descendants(self, index: int) -> range:
+        """Return the indices of all descendants of ``index`` in document order."""
+
+        return range(index + 1, self.ends[index])
+
+    def roots(self) -> Iterator[int]:
+        """Yield the indices of the top-level nodes."""
+
+        index = 0
+        total = len(self.tag_ids)
+        while index < total:
+            yield index
+            index = self.ends[index]
+
+    def to_page_nodes(self) -> list[PageNode]:
+        """Materialise the tree as a list of top-level :class:`PageNode` objects."""
+
+        # Children have higher indices than their parent, so walking the
+        # columns backwards always finds a node's children already built.
+        built: dict[int, PageNode] = {}
+        for index in range(len(self.tag_ids) - 1, -1, -1):
+            built[index] = PageNode.model_construct(
+                tag=self.tag(index),
+                attrs=dict(self.attrs[index]),
+                text=self.text(index),
+                children=[built.pop(child) for child in self.children(index)],
+                is_content=self.is_content(index),
+            )
+        return [built[index] for index in self.roots()]
+
+
 class Document(BaseModel):
-    """Structured representation of a parsed HTML document."""
+    """Structured representation of a parsed HTML document.
+
+    Parsed documents are backed by a compact :class:`NodeTree`; the pydantic
+    :attr:`nodes` view is only built when it is first accessed. The view is
+    read-only: extractors work on the tree, so changes made to the returned
+    nodes would not be seen by them. Assign :attr:`nodes` to replace the
+    document's content instead.
+    """
 
     title: Optional[str] = Field(
         default=None, description="Contents of the <title> element if present."
@@ -35,9 +450,176 @@ class Document(BaseModel):
     url: Optional[str] = Field(
         default=None, description="Original source URL of the document."
     )
-    nodes: List[PageNode] = Field(
-        default_factory=list, description="Top-level nodes within the document body."
+    lang: Optional[str] = Field(
+        default=None, description="``lang`` attribute of the <html> element if present."
     )
+    structured_data: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="schema.org items embedded in the page as JSON-LD or microdata.",
+    )
+
+    _tree: Optional[NodeTree] = PrivateAttr(default=None)
+    _tree_loader: Optional[Callable[[], NodeTree]] = PrivateAttr(default=None)
+    _nodes: Optional[Tuple[PageNode, ...]] = PrivateAttr(default=None)
+    _memo: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+    _excluded: tuple[int, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _accept_nodes(cls, data: Any, handler: Any) -> "Document":
+        nodes = None
+        if isinstance(data, dict) and "nodes" in data:
+            data = dict(data)
+            nodes = data.pop("nodes")
+        doc = handler(data)
+        if nodes is not None:
+            doc._nodes = tuple(PageNode.model_validate(node) for node in nodes)
+        return doc
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        json_schema = handler(schema)
+        if handler.mode == "validation":
+            # ``nodes`` is accepted as input by ``_accept_nodes`` rather than
+            # declared as a field, so it is added to the schema here.
+            target = handler.resolve_ref_schema(json_schema)
+            target["properties"]["nodes"] = {
+                "description": "Top-level nodes within the document body.",
+                "items": handler(PageNode.__pydantic_core_schema__),
+                "title": "Nodes",
+                "type": "array",
+            }
+        return json_schema
+
+    @classmethod
+    def from_tree(
+        cls,
+        tree: NodeTree | Callable[[], NodeTree],
+        *,
+        title: str | None = None,
+        url: str | None = None,
+        lang: str | None = None,
+        structured_data: List[Dict[str, Any]] | None = None,
+    ) -> "Document":
+        """Create a document backed by ``tree`` without materialising nodes.
+
+        ``tree`` may also be a callable, in which case the tree is only built
+        when :attr:`tree` or :attr:`nodes` is first accessed.
+        """
+
+        doc = cls(title=title, url=url, lang=lang, structured_data=structured_data or [])
+        if isinstance(tree, NodeTree):
+            doc._tree = tree
+        else:
+            doc._tree_loader = tree
+        return doc
+
+    @computed_field(description="Top-level nodes within the document body.")  # type: ignore[prop-decorator]
+    @property
+    def nodes(self) -> Tuple[PageNode, ...]:
+        if self._nodes is None:
+            if self._tree is None and self._tree_loader is None:
+                self._nodes = ()
+            else:
+                self._nodes = tuple(self.tree.to_page_nodes())
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value: Iterable[PageNode]) -> None:
+        self._nodes = tuple(value)
+        self._tree = None
+        self._tree_loader = None
+        self._excluded = ()
+        self._memo = {}
+
+    def __copy__(self) -> "Document":
+        # Private attributes are copied shallowly; give the copy its own memo
+        # so that excluding nodes from one document does not change the
+        # cached text of the other.
+        copy = super().__copy__()
+        copy._memo = {}
+        return copy
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "Document":
+        copy = super().__deepcopy__(memo)
+        copy._memo = {}
+        return copy
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # A pending tree loader refers to the BeautifulSoup tree and cannot
+        # be pickled; build the tree instead.
+        if self._tree_loader is not None:
+            self.tree
+        return super().__getstate__()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        return (self.title, self.url, self.lang, self.structured_data, self.nodes) == (
+            other.title,
+            other.url,
+            other.lang,
+            other.structured_data,
+            other.nodes,
+        )
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return the value derived from this document under ``key``.
+
+        ``compute`` is only called the first time ``key`` is requested, so
+        views such as the extracted text are built once per document. The
+        memo is cleared when :attr:`nodes` is replaced or nodes are excluded,
+        and copies of the document start with an empty memo.
+        """
+
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    @property
+    def excluded(self) -> tuple[int, ...]:
+        """Roots of the subtrees left out of the text, in document order."""
+
+        return self._excluded
+
+    def exclude(self, indices: Iterable[int]) -> None:
+        """Leave the subtrees rooted at ``indices`` out of the document text.
+
+        Excluded subtrees, such as site-wide headers and footers, are skipped
+        by :func:`~ainfo.extraction.extract_text` and contact extraction but
+        remain part of :attr:`tree`. Nested roots are merged into the
+        outermost one.
+        """
+
+        ends = self.tree.ends
+        roots: list[int] = []
+        for index in sorted(set(self._excluded).union(indices)):
+            if not roots or index >= ends[roots[-1]]:
+                roots.append(index)
+        self._excluded = tuple(roots)
+        self._memo = {}
+
+    def is_excluded(self, index: int) -> bool:
+        """Return whether node ``index`` lies within an excluded subtree."""
+
+        position = bisect_right(self._excluded, index)
+        return position > 0 and index < self.tree.ends[self._excluded[position - 1]]
+
+    @property
+    def tree(self) -> NodeTree:
+        """Compact tree used by the parser and the built-in extractors."""
+
+        if self._tree is None:
+            if self._tree_loader is not None:
+                self._tree = self._tree_loader()
+                self._tree_loader = None
+            else:
+                self._tree = NodeTree.from_page_nodes(self._nodes or [])
+        return self._tree
 
 
 # Rebuild models to resolve forward references
@@ -0,0 +1,92 @@
+"""Cheap classification of pages by their purpose."""
+
+from __future__ import annotations
+
+from urllib.parse import unquote, urlparse
+
+from .keywords import KeywordSet
+from .models import Document
+
+__all__ = ["PAGE_TYPES", "PAGE_TYPE_KEYWORDS", "classify_page"]
+
+# Labels assigned by :func:`classify_page`, in the order used to break ties.
+PAGE_TYPES = ("contact", "careers", "about", "other")
+
+# Keywords looked for in the URL path, title and headings of a page. The sets
+# can be extended for other languages or site conventions.
+PAGE_TYPE_KEYWORDS: dict[str, KeywordSet] = {
+    "contact": KeywordSet(
+        {
+            "contact",
+            "kontakt",
+            "impressum",
+            "imprint",
+            "legal notice",
+            "get in touch",
+            "anfahrt",
+            "location",
+        }
+    ),
+    "careers": KeywordSet(
+        {
+            "career",
+            "karriere",
+            "job",
+            "vacanc",
+            "stellen",
+            "join us",
+            "join our team",
+            "hiring",
+            "ausbildung",
+        }
+    ),
+    "about": KeywordSet(
+        {
+            "about",
+            "über uns",
+            "ueber-uns",
+            "ueber uns",
+            "who we are",
+            "our team",
+            "unternehmen",
+            "company",
+        }
+    ),
+}
+
+# Weight of a keyword hit in each part of the page, and the number of
+# headings inspected when the URL and title give no hint.
+_URL_WEIGHT = 3
+_TITLE_WEIGHT = 2
+_MAX_HEADINGS = 5
+
+
+def _scores(text: str, weight: int, scores: dict[str, int]) -> None:
+    text = text.lower()
+    for page_type, keywords in PAGE_TYPE_KEYWORDS.items():
+        if keywords.found_in(text):
+            scores[page_type] = scores.get(page_type, 0) + weight
+
+
+def classify_page(doc: Document) -> str:
+    """Return the :data:`PAGE_TYPES` label of ``doc``.
+
+    Keyword hits in the URL path weigh most, followed by the title. Only when
+    neither matches are the first ``h1`` to ``h3`` headings inspected, so
+    most pages are classified without building the document text. Pages
+    without any hit are labelled ``"other"``.
+    """
+
+    scores: dict[str, int] = {}
+    if doc.url:
+        path = unquote(urlparse(doc.url).path).replace("_", "-")
+        _scores(path, _URL_WEIGHT, scores)
+    if doc.title:
+        _scores(doc.title, _TITLE_WEIGHT, scores)
+    if not scores:
+        tree = doc.tree
+        for index in tree.find("h1", "h2", "h3")[:_MAX_HEADINGS]:
+            _scores(tree.text(index), 1, scores)
+    if not scores:
+        return "other"
+    return max(PAGE_TYPES[:-1], key=lambda page_type: scores.get(page_type, 0))
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from ..models import Document
-from .html import parse_html
+from .cache import ParseCache, content_digest
+from .html import NAV_KEYWORDS, parse_html
 
 
-def parse_data(raw: str, url: str | None = None) -> Document:
+def parse_data(raw: str, url: str | None = None, *, lazy: bool = True) -> Document:
     """Parse raw HTML into a :class:`~ainfo.models.Document`.
 
     Parameters
@@ -15,10 +16,13 @@ def parse_data(raw: str, url: str | None = None) -> Document:
         The raw HTML string.
     url:
         Optional source URL associated with the HTML.
+    lazy:
+        Build node text and content flags on first access instead of up
+        front. See :func:`~ainfo.parsing.html.parse_html`.
     """
 
-    return parse_html(raw, url=url)
+    return parse_html(raw, url=url, lazy=lazy)
 
 
-__all__ = ["parse_data", "parse_html"]
+__all__ = ["parse_data", "parse_html", "ParseCache", "content_digest", "NAV_KEYWORDS"]
 
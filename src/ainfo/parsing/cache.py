@@ -0,0 +1,159 @@
+"""Cache parsed documents by the hash of their HTML content."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Any
+
+from ..models import Document, NodeTree
+from .html import NAV_KEYWORDS, PARSER_VERSION, parse_html
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ParseCache", "content_digest"]
+
+
+def content_digest(raw: str) -> str:
+    """Return the SHA-256 hex digest used to identify ``raw`` HTML."""
+
+    return hashlib.sha256(raw.encode("utf-8", errors="ignore")).hexdigest()
+
+
+class ParseCache:
+    """Two-tier cache of parsed documents keyed by content hash.
+
+    Parsed trees are kept in an in-memory LRU and, when ``cache_dir`` is
+    given, written to disk in the compact format produced by
+    :meth:`~ainfo.models.NodeTree.to_bytes`. Keys combine the SHA-256 of the
+    HTML with :data:`~ainfo.parsing.html.PARSER_VERSION` and the signature of
+    :data:`~ainfo.parsing.html.NAV_KEYWORDS`, so entries written by an older
+    parser or classified with different navigation keywords are never reused.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of documents kept in memory.
+    cache_dir:
+        Optional directory for the on-disk tier.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: str | Path | None = None) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: OrderedDict[str, tuple[dict[str, Any], NodeTree]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, object]:
+        # Worker processes receive an empty cache sharing the on-disk tier.
+        return {"max_entries": self.max_entries, "cache_dir": self.cache_dir}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    @staticmethod
+    def key(digest: str) -> str:
+        """Return the cache key for HTML with the given content ``digest``."""
+
+        return f"v{PARSER_VERSION}-{NAV_KEYWORDS.signature}-{digest}"
+
+    def parse(self, raw: str, url: str | None = None, *, digest: str | None = None) -> Document:
+        """Return the parsed document for ``raw``, parsing only on a cache miss.
+
+        Parameters
+        ----------
+        raw:
+            The raw HTML string.
+        url:
+            Source URL assigned to the returned document.
+        digest:
+            Precomputed :func:`content_digest` of ``raw``, if available.
+        """
+
+        key = self.key(digest or content_digest(raw))
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("Parse cache hit for %s", url or "<string>")
+            meta, tree = cached
+            return Document.from_tree(
+                tree,
+                title=meta.get("title"),
+                url=url,
+                lang=meta.get("lang"),
+                structured_data=meta.get("structured_data"),
+            )
+
+        doc = parse_html(raw, url=url, lazy=False)
+        meta = {"title": doc.title, "lang": doc.lang, "structured_data": doc.structured_data}
+        self._put(key, meta, doc.tree)
+        return doc
+
+    # ------------------------------------------------------------------
+    # tiers
+    # ------------------------------------------------------------------
+    def _get(self, key: str) -> tuple[dict[str, Any], NodeTree] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _put(self, key: str, meta: dict[str, Any], tree: NodeTree) -> None:
+        self._remember(key, (meta, tree))
+        self._write(key, meta, tree)
+
+    def _remember(self, key: str, entry: tuple[dict[str, Any], NodeTree]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.tree"
+
+    def _read(self, key: str) -> tuple[dict[str, Any], NodeTree] | None:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = path.read_bytes()
+            (meta_len,) = struct.unpack_from("<I", data)
+            meta = json.loads(data[4 : 4 + meta_len])
+            tree = NodeTree.from_bytes(data[4 + meta_len :])
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as exc:
+            logger.debug("Ignoring unreadable parse cache entry %s: %s", path, exc)
+            return None
+        return meta, tree
+
+    def _write(self, key: str, meta: dict[str, Any], tree: NodeTree) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        header = json.dumps(meta).encode("utf-8")
+        data = struct.pack("<I", len(header)) + header + tree.to_bytes()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except OSError as exc:
+            logger.debug("Unable to write parse cache entry %s: %s", path, exc)
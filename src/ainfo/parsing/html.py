@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from array import array
+from collections.abc import Iterable, Mapping
 import logging
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 
-from ..models import Document, PageNode
+from ..keywords import KeywordSet
+from ..models import Document, NodeTree
+from .structured import extract_structured_data
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever a change alters the trees produced by :func:`parse_html` so
+# that cached parse results from earlier versions are not reused.
+PARSER_VERSION = 3
+
 # Tags and attribute keywords typically associated with navigation or ads.
 _NAV_TAGS = {
     "nav",
@@ -22,68 +29,129 @@ _NAV_TAGS = {
     "style",
     "noscript",
 }
-_NAV_ATTR_KEYWORDS = {
-    "nav",
-    "menu",
-    "sidebar",
-    "footer",
-    "header",
-    "advert",
-    "ads",
-    "promo",
-    "banner",
-    "social",
-}
-
-
-def _attr_tokens(tag: Tag) -> str:
-    """Return a space separated string of attribute tokens for a tag."""
+# Extend this set to recognise navigation in other languages or site
+# conventions; parse caches keep separate entries per keyword set.
+NAV_KEYWORDS = KeywordSet(
+    {
+        "nav",
+        "menu",
+        "sidebar",
+        "footer",
+        "header",
+        "advert",
+        "ads",
+        "promo",
+        "banner",
+        "social",
+    }
+)
+
+# String types BeautifulSoup includes in ``get_text`` for ordinary elements.
+_MAIN_STRING_TYPES = frozenset({NavigableString, CData})
+
+
+def _attr_tokens(attrs: Mapping[str, str]) -> str:
+    """Return a space separated string of attribute tokens for an element."""
     tokens: list[str] = []
     for key in ("id", "class", "role", "aria-label"):
-        value = tag.attrs.get(key)
-        if not value:
-            continue
-        if isinstance(value, (list, tuple)):
-            tokens.extend(str(v) for v in value)
-        else:
-            tokens.append(str(value))
+        value = attrs.get(key)
+        if value:
+            tokens.append(value)
     return " ".join(tokens).lower()
 
 
-def _is_navigation(tag: Tag) -> bool:
-    """Heuristically determine whether a tag is navigational or an advertisement."""
-    if tag.name in _NAV_TAGS:
+def _is_navigation(tag: str, attrs: Mapping[str, str]) -> bool:
+    """Heuristically determine whether an element is navigational or an advertisement."""
+    if tag in _NAV_TAGS:
         return True
-    attr_values = _attr_tokens(tag)
-    return any(keyword in attr_values for keyword in _NAV_ATTR_KEYWORDS)
-
-
-def _build_tree(elements: Iterable[Tag]) -> list[PageNode]:
-    """Recursively convert BeautifulSoup elements into :class:`PageNode` objects."""
-
-    nodes: list[PageNode] = []
-    for el in elements:
-        attrs = {
-            k: " ".join(v) if isinstance(v, (list, tuple)) else str(v)
-            for k, v in el.attrs.items()
-        }
-        text = el.get_text(" ", strip=True)
-        nav = _is_navigation(el)
-        is_content = not nav and len(text.split()) >= 5
-        children = _build_tree(el.find_all(recursive=False))
-        nodes.append(
-            PageNode(
-                tag=el.name,
-                attrs=attrs,
-                text=text,
-                children=children,
-                is_content=is_content,
+    attr_values = _attr_tokens(attrs)
+    return bool(attr_values) and NAV_KEYWORDS.found_in(attr_values)
+
+
+def _add_element(el: Tag, tree: NodeTree, parent: int) -> None:
+    """Append ``el`` and its descendant elements to the structure of ``tree``."""
+
+    attrs = {
+        k: " ".join(v) if isinstance(v, (list, tuple)) else str(v)
+        for k, v in el.attrs.items()
+    }
+    index = tree.add(el.name, attrs, parent)
+    for child in el.children:
+        if isinstance(child, Tag):
+            _add_element(child, tree, index)
+    tree.close(index)
+
+
+def _collect_text(tree: NodeTree, roots: list[Tag]) -> array:
+    """Fill the text spans of ``tree`` and return the word count of every node.
+
+    Strings are added to the tree's shared text buffer as they are visited
+    and word counts are summed bottom-up, so each string in the document is
+    only processed once.
+    """
+
+    words = array("i", bytes(4 * len(tree)))
+    position = 0
+
+    def _walk(el: Tag) -> int:
+        nonlocal position
+        index = position
+        position += 1
+        tree.open_span(index)
+        count = 0
+        for child in el.children:
+            if isinstance(child, Tag):
+                count += _walk(child)
+            elif type(child) in _MAIN_STRING_TYPES:
+                # ``script``, ``style`` and ``template`` strings use other
+                # types and are left out of the text, as in ``get_text``.
+                part = child.strip()
+                if part:
+                    tree.add_text(part)
+                    count += len(part.split())
+        tree.close_span(index)
+        words[index] = count
+        return count
+
+    for el in roots:
+        _walk(el)
+    tree.finish_text()
+    return words
+
+
+def _build_tree(elements: Iterable[Tag], *, lazy: bool = False) -> NodeTree:
+    """Convert BeautifulSoup elements into a compact :class:`NodeTree`.
+
+    With ``lazy`` the text spans and content flags are only computed when
+    they are first accessed.
+    """
+
+    roots = list(elements)
+    tree = NodeTree()
+    for el in roots:
+        _add_element(el, tree, -1)
+
+    words = array("i")
+
+    def _load_text() -> None:
+        words.extend(_collect_text(tree, roots))
+
+    def _load_flags() -> None:
+        tree.load("text")
+        for index in range(len(tree)):
+            is_content = words[index] >= 5 and not _is_navigation(
+                tree.tag(index), tree.attrs[index]
             )
-        )
-    return nodes
+            tree.set_content(index, is_content)
 
+    tree.defer("text", _load_text)
+    tree.defer("flags", _load_flags)
+    if not lazy:
+        tree.load("flags")
+    return tree
 
-def parse_html(html: str, url: str | None = None) -> Document:
+
+def parse_html(html: str, url: str | None = None, *, lazy: bool = True) -> Document:
     """Parse HTML into a :class:`Document` tree.
 
     Parameters
@@ -92,16 +160,39 @@ def parse_html(html: str, url: str | None = None) -> Document:
         Raw HTML string to parse.
     url:
         Optional source URL associated with the HTML.
+    lazy:
+        When ``True`` (the default) the node tree, node text and content
+        flags are built on first access, so callers that only need the title
+        or links skip the remaining work. Pass ``False`` to build everything
+        up front and release the underlying BeautifulSoup tree immediately.
+        Lazy documents can be pickled and deep-copied; the deferred work is
+        done first.
 
     Returns
     -------
     Document
-        Structured representation of the parsed document.
+        Structured representation of the parsed document. schema.org items
+        embedded as JSON-LD or microdata are collected up front into
+        :attr:`~ainfo.models.Document.structured_data`.
     """
     logger.info("Parsing HTML from %s", url or "<string>")
     soup = BeautifulSoup(html, "html.parser")
     title = soup.title.string.strip() if soup.title and soup.title.string else None
+    lang = soup.html.get("lang") if soup.html else None
+    if isinstance(lang, str):
+        lang = lang.strip() or None
+    structured_data = extract_structured_data(soup)
     body = soup.body or soup
-    nodes = _build_tree(body.find_all(recursive=False))
-    logger.debug("Parsed %d top-level nodes", len(nodes))
-    return Document(title=title, url=url, nodes=nodes)
+    if lazy:
+        return Document.from_tree(
+            lambda: _build_tree(body.find_all(recursive=False), lazy=True),
+            title=title,
+            url=url,
+            lang=lang,
+            structured_data=structured_data,
+        )
+    tree = _build_tree(body.find_all(recursive=False))
+    logger.debug("Parsed %d nodes", len(tree))
+    return Document.from_tree(
+        tree, title=title, url=url, lang=lang, structured_data=structured_data
+    )
@@ -0,0 +1,205 @@
+"""Scan HTML for links and text without building a tree."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from html.parser import HTMLParser
+from typing import Any
+
+from .structured import is_json_ld, json_ld_items
+
+__all__ = ["HTMLScanner", "scan_html"]
+
+# Elements that never have content, so they are not kept on the open stack.
+_VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "keygen",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Elements whose strings are not part of the document text.
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class HTMLScanner(HTMLParser):
+    """Collect what link and contact extraction need from HTML events.
+
+    No element objects are created: the scanner only keeps a stack of open
+    tag names, so its memory is bounded by the nesting depth plus the
+    collected results. HTML can be passed to :meth:`feed` in chunks as it
+    arrives. The results follow :func:`~ainfo.parsing.parse_data`: only
+    elements inside ``<body>`` (or the whole document when there is none)
+    contribute links and text, and the strings of ``script``, ``style`` and
+    ``template`` elements are left out. The ``href`` of every anchor is
+    collected in :attr:`links` in document order, duplicates included, and
+    JSON-LD blocks are decoded into :attr:`structured_data`.
+
+    Parameters
+    ----------
+    collect_text:
+        Whether to keep the document text. Link discovery can turn it off.
+    on_link:
+        Optional callback receiving the ``href`` of every anchor as soon as it
+        is seen. Anchors before ``<body>`` are reported too.
+    """
+
+    def __init__(
+        self,
+        *,
+        collect_text: bool = True,
+        on_link: Callable[[str], None] | None = None,
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self.collect_text = collect_text
+        self.on_link = on_link
+        self.links: list[str] = []
+        self.lang: str | None = None
+        self.structured_data: list[dict[str, Any]] = []
+        self.has_microdata = False
+        self._pieces: list[str] = []
+        self._data: list[str] = []
+        self._open: list[str] = []
+        self._body_depth: int | None = None
+        self._finished = False
+        self._hidden = 0
+        self._json_ld: list[str] | None = None
+        self._seen_html = False
+
+    @property
+    def text(self) -> str:
+        """Text of the scanned elements, joined by single spaces."""
+
+        self._flush()
+        return " ".join(self._pieces)
+
+    def _element_in_scope(self) -> bool:
+        # Called before the element is pushed: it is part of the document
+        # when it is a descendant of ``<body>``, or anywhere without a body.
+        if self._finished:
+            return False
+        return self._body_depth is None or len(self._open) >= self._body_depth
+
+    def _text_in_scope(self) -> bool:
+        # Strings directly below ``<body>`` or the document root belong to
+        # no element and are not part of the document text.
+        if self._finished:
+            return False
+        return len(self._open) > (self._body_depth or 0)
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data).strip()
+        self._data.clear()
+        if text:
+            self._pieces.append(text)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
+        values = {name: value or "" for name, value in attrs}
+        if "itemscope" in values:
+            self.has_microdata = True
+        if tag == "html" and not self._seen_html:
+            self._seen_html = True
+            lang = values.get("lang", "").strip()
+            self.lang = lang or None
+        elif tag == "body" and self._body_depth is None and not self._finished:
+            # Only descendants of ``<body>`` are part of the document, so
+            # anything collected before it is dropped.
+            self._body_depth = len(self._open) + 1
+            self._pieces.clear()
+            self.links.clear()
+        elif tag == "script" and is_json_ld(values.get("type", "")):
+            self._json_ld = []
+
+        if tag == "a":
+            href = values.get("href", "")
+            if href and self.on_link is not None:
+                self.on_link(href)
+            if href and self._element_in_scope():
+                self.links.append(href)
+
+        if tag not in _VOID_TAGS:
+            self._open.append(tag)
+            if tag in _HIDDEN_TEXT_TAGS:
+                self._hidden += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag not in self._open:
+            return
+        while self._open:
+            closed = self._open.pop()
+            if closed in _HIDDEN_TEXT_TAGS:
+                self._hidden -= 1
+            if closed == "script" and self._json_ld is not None:
+                self.structured_data.extend(json_ld_items("".join(self._json_ld)))
+                self._json_ld = None
+            if self._body_depth is not None and len(self._open) < self._body_depth:
+                self._finished = True
+            if closed == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if self._json_ld is not None:
+            self._json_ld.append(data)
+            return
+        if self.collect_text and not self._hidden and self._text_in_scope():
+            self._data.append(data)
+        else:
+            self._flush()
+
+    # BeautifulSoup ends the current string at every other token, so text on
+    # both sides of a comment, declaration or processing instruction forms
+    # separate strings. They are flushed here to split the text the same way.
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+        if data.upper().startswith("CDATA[") and self.collect_text and self._text_in_scope():
+            # CDATA sections are strings of their own and part of the text,
+            # even inside ``template``.
+            self._data.append(data[len("CDATA[") :])
+            self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        if self._json_ld is not None:
+            self.structured_data.extend(json_ld_items("".join(self._json_ld)))
+            self._json_ld = None
+
+
+def scan_html(html: str, *, collect_text: bool = True) -> HTMLScanner:
+    """Scan ``html`` with a :class:`HTMLScanner` and return it."""
+
+    scanner = HTMLScanner(collect_text=collect_text)
+    scanner.feed(html)
+    scanner.close()
+    return scanner
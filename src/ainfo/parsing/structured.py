@@ -0,0 +1,141 @@
+"""Collect schema.org items embedded as JSON-LD or microdata."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["extract_structured_data", "is_json_ld", "json_ld_items"]
+
+_JSON_LD_TYPE = re.compile(r"^\s*application/ld\+json\s*(;.*)?$", re.IGNORECASE)
+
+# Attribute holding the value of a microdata property, by tag name. Other
+# elements use their text.
+_VALUE_ATTRS = {
+    "meta": "content",
+    "a": "href",
+    "area": "href",
+    "link": "href",
+    "audio": "src",
+    "embed": "src",
+    "iframe": "src",
+    "img": "src",
+    "source": "src",
+    "track": "src",
+    "video": "src",
+    "object": "data",
+    "data": "value",
+    "meter": "value",
+    "time": "datetime",
+}
+
+
+def json_ld_items(source: str) -> list[dict[str, Any]]:
+    """Return the items of one JSON-LD block, or none if it is invalid.
+
+    ``@graph`` containers are flattened into their items.
+    """
+
+    if not source or not source.strip():
+        return []
+    try:
+        data = json.loads(source)
+    except ValueError as exc:
+        logger.debug("Ignoring invalid JSON-LD block: %s", exc)
+        return []
+    items: list[dict[str, Any]] = []
+    for entry in data if isinstance(data, list) else [data]:
+        if not isinstance(entry, dict):
+            continue
+        graph = entry.get("@graph")
+        if isinstance(graph, list):
+            items.extend(item for item in graph if isinstance(item, dict))
+        else:
+            items.append(entry)
+    return items
+
+
+def is_json_ld(script_type: str) -> bool:
+    """Return whether a ``<script>`` ``type`` attribute denotes JSON-LD."""
+
+    return bool(_JSON_LD_TYPE.match(script_type))
+
+
+def _json_ld(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for script in soup.find_all("script", attrs={"type": _JSON_LD_TYPE}):
+        items.extend(json_ld_items(script.string or ""))
+    return items
+
+
+def _attr(el: Tag, name: str) -> str:
+    value = el.get(name)
+    if isinstance(value, (list, tuple)):
+        value = " ".join(value)
+    return (value or "").strip()
+
+
+def _property_elements(scope: Tag) -> list[Tag]:
+    """Return the elements carrying properties of the item ``scope``.
+
+    Properties of nested items are left to those items.
+    """
+
+    found: list[Tag] = []
+    stack = [child for child in reversed(scope.contents) if isinstance(child, Tag)]
+    while stack:
+        el = stack.pop()
+        if el.has_attr("itemprop"):
+            found.append(el)
+        if not el.has_attr("itemscope"):
+            stack.extend(child for child in reversed(el.contents) if isinstance(child, Tag))
+    return found
+
+
+def _microdata_value(el: Tag) -> str:
+    attr = _VALUE_ATTRS.get(el.name)
+    if attr and el.has_attr(attr):
+        return _attr(el, attr)
+    return el.get_text(" ", strip=True)
+
+
+def _microdata_item(scope: Tag) -> dict[str, Any]:
+    item: dict[str, Any] = {}
+    item_type = _attr(scope, "itemtype").split()
+    if item_type:
+        item["@type"] = item_type[0].rstrip("/").rsplit("/", 1)[-1]
+    values: dict[str, list[Any]] = {}
+    for el in _property_elements(scope):
+        value = _microdata_item(el) if el.has_attr("itemscope") else _microdata_value(el)
+        for name in _attr(el, "itemprop").split():
+            values.setdefault(name, []).append(value)
+    for name, found in values.items():
+        item[name] = found[0] if len(found) == 1 else found
+    return item
+
+
+def _microdata(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    return [
+        _microdata_item(scope)
+        for scope in soup.find_all(attrs={"itemscope": True})
+        if not scope.has_attr("itemprop")
+    ]
+
+
+def extract_structured_data(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    """Return the top-level schema.org items of a parsed page.
+
+    JSON-LD blocks are decoded as they are, with ``@graph`` containers
+    flattened into their items. Microdata items are converted to the same
+    shape: the last segment of ``itemtype`` becomes ``@type`` and every
+    property maps to its value, a nested item, or a list of those when the
+    property occurs more than once. Invalid JSON-LD is skipped.
+    """
+
+    return _json_ld(soup) + _microdata(soup)
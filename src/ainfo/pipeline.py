@@ -0,0 +1,1008 @@
+"""Crawl sites, parse their pages and run the selected extractors on them.
+
+Besides the site entry points re-exported by :mod:`ainfo`, this module holds
+their building blocks: processing a single page, optionally in a worker
+process or by scanning it instead of parsing it, and feeding a stream of
+pages through an executor while the crawl continues.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import ExitStack
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from . import __version__
+from .crawler import crawl as crawl_urls
+from .dedupe import SimHashIndex, simhash
+from .extraction import (
+    async_extract_information,
+    extract_information,
+    extract_text,
+    regex_contacts,
+    scanned_document,
+)
+from .extractors import (
+    APPLY_KEYWORDS,
+    AVAILABLE_EXTRACTORS,
+    JOB_KEYWORDS,
+    extract_links,
+    run_extractors,
+)
+from .incremental import ResultStore
+from .llm_service import AsyncLLMService, LLMService
+from .models import Document
+from .page_types import classify_page
+from .parsing import ParseCache, content_digest, parse_data
+from .parsing.html import NAV_KEYWORDS, PARSER_VERSION
+from .parsing.stream import scan_html
+from .schemas import ContactDetails
+from .templates import SiteTemplate, page_fingerprints, strip_boilerplate
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "PendingContacts",
+    "PreparedPage",
+    "SCAN_ARTIFACTS",
+    "apply_extractors",
+    "async_extract_site",
+    "async_stream_site",
+    "await_pending_contacts",
+    "content_fingerprint",
+    "extract_page",
+    "extract_page_plain",
+    "extract_pages",
+    "extract_site",
+    "make_executor",
+    "parse_page",
+    "plain_results",
+    "prepare_page",
+    "process_page_plain",
+    "restore_models",
+    "scan_inputs",
+    "scan_page",
+    "stream_site",
+]
+
+# Extractors that can run on a scan of the raw HTML, without a document tree.
+_SCANNABLE_EXTRACTORS = {"links": extract_links, "contacts": extract_information}
+
+# Artifacts a scan of the raw HTML provides.
+SCAN_ARTIFACTS = frozenset({"links", "text"})
+
+
+def apply_extractors(
+    document: Document,
+    names: list[str],
+    *,
+    method: str,
+    llm: LLMService | AsyncLLMService | None,
+) -> dict[str, object]:
+    """Run the extractors ``names`` on ``document`` in a single traversal.
+
+    With an :class:`AsyncLLMService` the ``contacts`` result is a
+    :class:`PendingContacts` for the caller to await with
+    :func:`await_pending_contacts`, so the LLM call does not block the thread.
+    """
+
+    if method == "llm" and isinstance(llm, AsyncLLMService) and "contacts" in names:
+        names = list(dict.fromkeys(names))
+        results = apply_extractors(
+            document, [name for name in names if name != "contacts"], method=method, llm=None
+        )
+        results["contacts"] = PendingContacts(document, llm)
+        return {name: results[name] for name in names}
+    return run_extractors(
+        document,
+        names,
+        extractors=AVAILABLE_EXTRACTORS,
+        options={"contacts": {"method": method, "llm": llm}},
+    )
+
+
+@dataclass(frozen=True)
+class PendingContacts:
+    """Contact extraction of a page that waits for an :class:`AsyncLLMService`."""
+
+    document: Document
+    llm: AsyncLLMService
+
+    async def run(self) -> ContactDetails:
+        """Extract the contact details with the LLM service."""
+
+        return await async_extract_information(self.document, self.llm)
+
+
+async def await_pending_contacts(
+    page_results: Awaitable[dict[str, object] | None], slots: asyncio.Semaphore
+) -> dict[str, object] | None:
+    """Await ``page_results`` and then the :class:`PendingContacts` in them.
+
+    ``slots`` bounds how many LLM calls are in flight at once.
+    """
+
+    results = await page_results
+    contacts = results.get("contacts") if results is not None else None
+    if isinstance(contacts, PendingContacts):
+        async with slots:
+            results["contacts"] = await contacts.run()  # type: ignore[index]
+    return results
+
+
+def parse_page(
+    raw: str,
+    url: str,
+    *,
+    parse_cache: ParseCache | None = None,
+    digest: str | None = None,
+) -> Document:
+    """Parse ``raw``, going through ``parse_cache`` when one is given."""
+
+    if parse_cache is not None:
+        return parse_cache.parse(raw, url=url, digest=digest)
+    return parse_data(raw, url=url)
+
+
+def extract_page(
+    document: Document,
+    names: list[str],
+    *,
+    include_text: bool,
+    method: str,
+    llm: LLMService | AsyncLLMService | None,
+    classify_pages: bool = False,
+) -> dict[str, object]:
+    """Return the text and extractor results for one parsed page.
+
+    With ``classify_pages`` the page type is reported under ``"page_type"``
+    and only the extractors declared for that type are run. The others are
+    reported as ``None``, so every page has the same keys.
+    """
+
+    page_results: dict[str, object] = {}
+    selected = names
+    if classify_pages:
+        page_type = classify_page(document)
+        page_results["page_type"] = page_type
+        names = AVAILABLE_EXTRACTORS.for_page(names, page_type)
+    if include_text:
+        page_results["text"] = extract_text(document)
+    results = apply_extractors(document, names, method=method, llm=llm)
+    if classify_pages:
+        results = {name: results.get(name) for name in selected}
+    page_results.update(results)
+    return page_results
+
+
+def scan_inputs(names: list[str]) -> frozenset[str] | None:
+    """Return the artifacts to scan for the extractors ``names``.
+
+    Returns ``None`` when the extractors need a parsed document: when one of
+    them is not a built-in with a scan implementation, or their declared
+    inputs go beyond :data:`SCAN_ARTIFACTS`.
+    """
+
+    if not names or not all(
+        name in _SCANNABLE_EXTRACTORS
+        and AVAILABLE_EXTRACTORS[name] is _SCANNABLE_EXTRACTORS[name]
+        for name in names
+    ):
+        return None
+    inputs = AVAILABLE_EXTRACTORS.required_inputs(names)
+    return inputs if inputs <= SCAN_ARTIFACTS else None
+
+
+def scan_page(
+    raw: str, url: str, names: list[str], inputs: frozenset[str]
+) -> dict[str, object] | None:
+    """Return the results of the scannable extractors ``names`` for one page.
+
+    The HTML is scanned with :class:`~ainfo.parsing.stream.HTMLScanner`
+    instead of being parsed into a document, collecting the text only when
+    it is among the ``inputs`` the extractors declare. Returns ``None`` for
+    pages with microdata, which needs the element tree.
+    """
+
+    scanner = scan_html(raw, collect_text="text" in inputs)
+    if scanner.has_microdata:
+        return None
+    page_results: dict[str, object] = {}
+    for name in names:
+        if name == "links":
+            page_results[name] = list(dict.fromkeys(scanner.links))
+        else:
+            page_results[name] = regex_contacts(*scanned_document(scanner, url))
+    return page_results
+
+
+def content_fingerprint(document: Document) -> int | None:
+    """Return the SimHash of the content text of ``document``, if it has any."""
+
+    text = extract_text(document)
+    return simhash(text) if text else None
+
+
+@dataclass
+class PreparedPage:
+    """A parsed page with the fingerprints the pipeline decides on.
+
+    ``fingerprint`` is the SimHash of the content text used to detect
+    near-duplicates and ``blocks`` are the :func:`page_fingerprints` a site
+    template is learned from; either is ``None`` when it was not computed.
+    """
+
+    document: Document
+    fingerprint: int | None = None
+    blocks: frozenset[bytes] | None = None
+
+
+def prepare_page(
+    raw: str,
+    url: str,
+    *,
+    parse_cache: ParseCache | None = None,
+    digest: str | None = None,
+    fingerprint: bool = False,
+    learn_template: bool = False,
+    boilerplate: frozenset[bytes] | None = None,
+) -> PreparedPage:
+    """Parse ``raw`` and compute the fingerprints of the page.
+
+    The content fingerprint is computed when ``fingerprint`` is set and the
+    block fingerprints when ``learn_template`` is set. Blocks in
+    ``boilerplate`` are excluded before the content fingerprint is taken.
+    """
+
+    document = parse_page(raw, url, parse_cache=parse_cache, digest=digest)
+    blocks = page_fingerprints(document) if learn_template else None
+    if boilerplate:
+        strip_boilerplate(document, boilerplate)
+    value = content_fingerprint(document) if fingerprint else None
+    return PreparedPage(document, value, blocks)
+
+
+def process_page_plain(
+    raw: str,
+    url: str,
+    names: list[str],
+    *,
+    include_text: bool,
+    method: str,
+    classify_pages: bool = False,
+    parse_cache: ParseCache | None = None,
+    digest: str | None = None,
+    learn_template: bool = False,
+    boilerplate: frozenset[bytes] | None = None,
+    scan: frozenset[str] | None = None,
+) -> tuple[frozenset[bytes] | None, dict[str, object]]:
+    """Process a page in a worker process and return plain data.
+
+    LLM services cannot be sent to other processes, so ``method`` is never
+    ``"llm"`` here. The site template lives in the parent process, so the
+    worker only computes the block fingerprints when ``learn_template`` is
+    set. Blocks in ``boilerplate`` are excluded. Pages that are checked for
+    near-duplicates go through :func:`prepare_page` and
+    :func:`extract_page_plain` instead, so they are not extracted in vain.
+    """
+
+    if scan is not None:
+        page_results = scan_page(raw, url, names, scan)
+        if page_results is not None:
+            return None, plain_results(page_results)
+    prepared = prepare_page(
+        raw,
+        url,
+        parse_cache=parse_cache,
+        digest=digest,
+        learn_template=learn_template,
+        boilerplate=boilerplate,
+    )
+    page_results = extract_page(
+        prepared.document,
+        names,
+        include_text=include_text,
+        method=method,
+        llm=None,
+        classify_pages=classify_pages,
+    )
+    return prepared.blocks, plain_results(page_results)
+
+
+def extract_page_plain(
+    document: Document,
+    names: list[str],
+    *,
+    include_text: bool,
+    method: str,
+    classify_pages: bool = False,
+) -> dict[str, object]:
+    """Run :func:`extract_page` in a worker process and return plain data.
+
+    Used for pages prepared by :func:`prepare_page` in a worker, once the
+    parent process has checked them against the near-duplicate index.
+    """
+
+    page_results = extract_page(
+        document,
+        names,
+        include_text=include_text,
+        method=method,
+        llm=None,
+        classify_pages=classify_pages,
+    )
+    return plain_results(page_results)
+
+
+def plain_results(page_results: dict[str, object]) -> dict[str, object]:
+    """Return ``page_results`` with :class:`ContactDetails` as plain dictionaries."""
+
+    return {
+        key: (item.model_dump() if isinstance(item, ContactDetails) else item)
+        for key, item in page_results.items()
+    }
+
+
+def restore_models(page_results: dict[str, object]) -> dict[str, object]:
+    """Rebuild :class:`ContactDetails` returned as plain data by a worker process."""
+
+    contacts = page_results.get("contacts")
+    if isinstance(contacts, dict):
+        page_results["contacts"] = ContactDetails.model_validate(contacts)
+    return page_results
+
+
+def make_executor(
+    executor: str | Executor, workers: int | None, *, use_llm: bool
+) -> tuple[Executor | None, bool]:
+    """Return the executor for page processing and whether it is owned here.
+
+    ``None`` means pages are processed inline on the event loop. LLM services
+    cannot be sent to other processes, so LLM extraction uses threads.
+    """
+
+    if isinstance(executor, Executor):
+        if use_llm and isinstance(executor, ProcessPoolExecutor):
+            msg = "use_llm requires a thread executor"
+            raise ValueError(msg)
+        return executor, False
+    if executor not in {"process", "thread"}:
+        msg = f"Unknown executor: {executor}"
+        raise ValueError(msg)
+    if workers is None:
+        return None, False
+    if executor == "thread" or use_llm:
+        return ThreadPoolExecutor(max_workers=workers), True
+    return ProcessPoolExecutor(max_workers=workers), True
+
+
+async def extract_pages(
+    pages: AsyncIterator[tuple[str, str, str | None]],
+    names: list[str],
+    *,
+    include_text: bool,
+    method: str,
+    llm: LLMService | AsyncLLMService | None,
+    classify_pages: bool = False,
+    parse_cache: ParseCache | None = None,
+    near_duplicates: SimHashIndex | None = None,
+    store: ResultStore | None = None,
+    template: SiteTemplate | None = None,
+    workers: int | None = None,
+    executor: str | Executor = "process",
+    llm_concurrency: int = 4,
+) -> AsyncIterator[tuple[str, dict[str, object]]]:
+    """Process ``(url, raw, digest)`` pages and yield their results in order.
+
+    Without an executor every page is parsed and extracted inline. Otherwise
+    the work runs in the executor while further pages are fetched; worker
+    processes receive the raw HTML and return plain dictionaries.
+
+    Pages are fed to the ``template`` and the ``near_duplicates`` index in
+    crawl order, wherever they are processed. A ``template`` is learned from
+    the first pages and then strips their shared boilerplate from the
+    following ones. Pages whose content is a near-duplicate of an earlier
+    page are left out before their extractors run. Worker processes cannot
+    share the index, so with one the page is first parsed and fingerprinted
+    in a worker and only sent back for extraction when it is kept.
+
+    With a ``store``, results of pages whose content is unchanged since an
+    earlier run are reused, and new results are saved together with the
+    page fingerprints, so reused pages still contribute to the template and
+    the near-duplicate index. The store is read and written in a thread so
+    the event loop is not blocked on SQLite.
+
+    When only the built-in ``links`` and regex ``contacts`` extractors run,
+    their declared inputs are all provided by a scan and no option needs the
+    document tree, pages are scanned instead of parsed. With an
+    :class:`AsyncLLMService` up to ``llm_concurrency`` LLM calls are awaited
+    at once while further pages are fetched and processed.
+    """
+
+    scan = (
+        scan_inputs(names)
+        if method == "regex"
+        and not include_text
+        and not classify_pages
+        and parse_cache is None
+        and near_duplicates is None
+        and template is None
+        else None
+    )
+    config = (
+        ResultStore.config_key(
+            extract=names,
+            include_text=include_text,
+            method=method,
+            classify_pages=classify_pages,
+            parser=PARSER_VERSION,
+            keywords=[
+                keywords.signature for keywords in (NAV_KEYWORDS, JOB_KEYWORDS, APPLY_KEYWORDS)
+            ],
+            template=template.sample_pages if template is not None else None,
+            near_duplicates=near_duplicates is not None,
+            # Records hold the results and the page fingerprints.
+            record=2,
+            version=__version__,
+        )
+        if store is not None
+        else ""
+    )
+    # With a store the block fingerprints of every page are kept, so pages
+    # reused while a later run learns its template can still be observed.
+    keep_blocks = template is not None and store is not None
+
+    async def _stored(link: str, digest: str | None) -> tuple[
+        dict[str, object], int | None, frozenset[bytes] | None
+    ] | None:
+        if store is None or digest is None:
+            return None
+        stored = await asyncio.to_thread(store.get, link, config, digest)
+        if stored is None:
+            return None
+        logger.debug("Reusing stored results for unchanged page %s", link)
+        blocks = stored["blocks"]
+        return (
+            restore_models(stored["results"]),
+            stored["fingerprint"],
+            frozenset(bytes.fromhex(block) for block in blocks) if blocks is not None else None,
+        )
+
+    async def _save(
+        link: str,
+        digest: str | None,
+        page_results: dict[str, object],
+        fingerprint: int | None,
+        blocks: frozenset[bytes] | None,
+    ) -> None:
+        if store is None or digest is None:
+            return
+        record = {
+            "results": plain_results(page_results),
+            "fingerprint": fingerprint,
+            "blocks": sorted(block.hex() for block in blocks) if blocks is not None else None,
+        }
+        await asyncio.to_thread(store.put, link, config, digest, record)
+
+    def _accept(link: str, fingerprint: int | None, blocks: frozenset[bytes] | None) -> bool:
+        if template is not None and blocks is not None and template.learning:
+            template.observe(blocks)
+        if near_duplicates is not None and fingerprint is not None:
+            original = near_duplicates.match_or_add(fingerprint, link)
+            if original is not None:
+                logger.debug("Skipping %s as a near-duplicate of %s", link, original)
+                return False
+        return True
+
+    async_llm = method == "llm" and isinstance(llm, AsyncLLMService)
+    pool, owned = make_executor(executor, workers, use_llm=method == "llm")
+    in_process = isinstance(pool, ProcessPoolExecutor)
+    loop = asyncio.get_running_loop()
+    llm_slots = asyncio.Semaphore(llm_concurrency)
+
+    async def _run(call: Callable[[], Any]) -> Any:
+        if pool is None:
+            return call()
+        return await loop.run_in_executor(pool, call)
+
+    async def _page(
+        link: str,
+        raw: str,
+        digest: str | None,
+        *,
+        learn_template: bool,
+        boilerplate: frozenset[bytes] | None,
+        previous: asyncio.Future[None] | None,
+        turn: asyncio.Future[None],
+    ) -> dict[str, object] | None:
+        # ``previous`` is completed once the page before this one has been
+        # fed to the template and the index, and ``turn`` once this one is.
+        document = None
+        try:
+            stored = await _stored(link, digest)
+            if stored is not None:
+                page_results, fingerprint, blocks = stored
+            elif in_process and near_duplicates is None:
+                fingerprint = None
+                blocks, page_results = await _run(
+                    partial(
+                        process_page_plain,
+                        raw,
+                        link,
+                        names,
+                        parse_cache=parse_cache,
+                        digest=digest,
+                        learn_template=learn_template,
+                        boilerplate=boilerplate,
+                        scan=scan,
+                        include_text=include_text,
+                        method=method,
+                        classify_pages=classify_pages,
+                    )
+                )
+                page_results = restore_models(page_results)
+            else:
+                fingerprint = blocks = None
+                page_results = (
+                    await _run(partial(scan_page, raw, link, names, scan))
+                    if scan is not None
+                    else None
+                )
+                if page_results is None:
+                    prepared = await _run(
+                        partial(
+                            prepare_page,
+                            raw,
+                            link,
+                            parse_cache=parse_cache,
+                            digest=digest,
+                            fingerprint=near_duplicates is not None,
+                            learn_template=learn_template,
+                            boilerplate=boilerplate,
+                        )
+                    )
+                    document, fingerprint, blocks = (
+                        prepared.document,
+                        prepared.fingerprint,
+                        prepared.blocks,
+                    )
+            if previous is not None:
+                await previous
+            accepted = _accept(link, fingerprint, blocks)
+        finally:
+            if not turn.done():
+                turn.set_result(None)
+        if not accepted:
+            return None
+        if document is not None and in_process:
+            page_results = restore_models(
+                await _run(
+                    partial(
+                        extract_page_plain,
+                        document,
+                        names,
+                        include_text=include_text,
+                        method=method,
+                        classify_pages=classify_pages,
+                    )
+                )
+            )
+        elif document is not None:
+            extraction = _run(
+                partial(
+                    extract_page,
+                    document,
+                    names,
+                    include_text=include_text,
+                    method=method,
+                    llm=llm,
+                    classify_pages=classify_pages,
+                )
+            )
+            page_results = await (
+                await_pending_contacts(extraction, llm_slots) if async_llm else extraction
+            )
+        if stored is None:
+            await _save(link, digest, page_results, fingerprint, blocks)
+        return page_results
+
+    # Keep a bounded number of pages in flight so fetching stays ahead of
+    # the workers without buffering the whole site. Inline pages are
+    # finished one at a time unless they wait for an async LLM.
+    if pool is None and not async_llm:
+        limit = 1
+    else:
+        limit = 2 * (workers or os.cpu_count() or 1)
+        if async_llm:
+            limit = max(limit, 2 * llm_concurrency)
+    pending: deque[tuple[str, asyncio.Task[dict[str, object] | None]]] = deque()
+    previous: asyncio.Future[None] | None = None
+    # Pages submitted while the template is learned; once there are enough,
+    # they are awaited so that later pages are submitted with the template.
+    sampled = 0
+
+    try:
+        async for link, raw, digest in pages:
+            learning = template is not None and template.learning
+            turn = loop.create_future()
+            task = asyncio.ensure_future(
+                _page(
+                    link,
+                    raw,
+                    digest,
+                    learn_template=learning or keep_blocks,
+                    boilerplate=template.boilerplate if template is not None else None,
+                    previous=previous,
+                    turn=turn,
+                )
+            )
+            previous = turn
+            pending.append((link, task))
+            if learning:
+                sampled += 1
+            while pending and (
+                len(pending) >= limit
+                or pending[0][1].done()
+                or (template is not None and template.learning and sampled >= template.sample_pages)
+            ):
+                done, task = pending.popleft()
+                page_results = await task
+                if page_results is not None:
+                    yield done, page_results
+        while pending:
+            done, task = pending.popleft()
+            page_results = await task
+            if page_results is not None:
+                yield done, page_results
+    finally:
+        for _, task in pending:
+            task.cancel()
+        if owned:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_stream_site(
+    url: str,
+    *,
+    depth: int = 0,
+    render_js: bool = False,
+    extract: list[str] | None = None,
+    include_text: bool = False,
+    use_llm: bool = False,
+    llm: LLMService | AsyncLLMService | None = None,
+    dedupe: bool = True,
+    parse_cache: ParseCache | None = None,
+    near_duplicate_distance: int | None = None,
+    incremental: ResultStore | str | Path | None = None,
+    template_pages: int | None = None,
+    classify_pages: bool = False,
+    workers: int | None = None,
+    executor: str | Executor = "process",
+    llm_concurrency: int = 4,
+) -> AsyncIterator[tuple[str, dict[str, object]]]:
+    """Crawl ``url`` and yield ``(page_url, page_results)`` as pages complete.
+
+    This is the streaming form of :func:`async_extract_site`: results are
+    produced in crawl order while the crawl continues, and nothing is kept
+    once a page has been yielded apart from the fingerprints used for
+    deduplication. See :func:`async_extract_site` for the parameters.
+    """
+
+    extract_names = list(extract or ["contacts"])
+    method = "llm" if use_llm else "regex"
+    if use_llm and llm is None:
+        msg = "llm service required when use_llm=True"
+        raise ValueError(msg)
+    if llm_concurrency < 1:
+        msg = "llm_concurrency must be at least 1"
+        raise ValueError(msg)
+
+    start_domain = urlparse(url).netloc
+    seen_hashes: set[str] = set()
+    near_duplicates = (
+        SimHashIndex(near_duplicate_distance)
+        if near_duplicate_distance is not None
+        else None
+    )
+    template = SiteTemplate(template_pages) if template_pages is not None else None
+    owns_store = isinstance(incremental, (str, Path))
+    store = ResultStore(incremental) if owns_store else incremental
+    needs_digest = dedupe or parse_cache is not None or store is not None
+
+    async def _pages() -> AsyncIterator[tuple[str, str, str | None]]:
+        async for link, raw in crawl_urls(url, depth, render_js=render_js):
+            if urlparse(link).netloc != start_domain:
+                continue
+
+            digest = content_digest(raw) if needs_digest else None
+            if dedupe:
+                if digest in seen_hashes:
+                    logger.debug("Skipping %s due to duplicate content hash", link)
+                    continue
+                seen_hashes.add(digest)
+
+            yield link, raw, digest
+
+    try:
+        async for link, page_results in extract_pages(
+            _pages(),
+            extract_names,
+            include_text=include_text,
+            method=method,
+            llm=llm,
+            classify_pages=classify_pages,
+            parse_cache=parse_cache,
+            near_duplicates=near_duplicates,
+            store=store,
+            template=template,
+            workers=workers,
+            executor=executor,
+            llm_concurrency=llm_concurrency,
+        ):
+            yield link, page_results
+    finally:
+        if owns_store:
+            store.close()
+
+
+async def async_extract_site(
+    url: str,
+    *,
+    depth: int = 0,
+    render_js: bool = False,
+    extract: list[str] | None = None,
+    include_text: bool = False,
+    use_llm: bool = False,
+    llm: LLMService | AsyncLLMService | None = None,
+    dedupe: bool = True,
+    parse_cache: ParseCache | None = None,
+    near_duplicate_distance: int | None = None,
+    incremental: ResultStore | str | Path | None = None,
+    template_pages: int | None = None,
+    classify_pages: bool = False,
+    workers: int | None = None,
+    executor: str | Executor = "process",
+    llm_concurrency: int = 4,
+) -> dict[str, dict[str, object]]:
+    """Crawl ``url`` up to ``depth`` levels and run extractors on each page.
+
+    Results are returned as a mapping of page URL to the extracted data.
+    Duplicate pages are skipped by comparing a SHA-256 hash of their HTML
+    content. Only pages on the same domain as ``url`` are processed. Use
+    :func:`async_stream_site` to receive each page's results as soon as they
+    are ready instead.
+
+    When a :class:`~ainfo.parsing.ParseCache` is supplied, pages whose HTML
+    was parsed before are served from the cache using the same content hash.
+
+    ``near_duplicate_distance`` additionally skips pages whose content text is
+    nearly identical to an earlier page, such as pages that differ only in
+    tokens, timestamps or query parameters. Pages count as near-duplicates
+    when the 64-bit SimHash fingerprints of their content text differ in at
+    most this many bits; ``6`` is a good starting point. ``None`` disables the
+    check.
+
+    ``incremental`` enables incremental runs: pass a
+    :class:`~ainfo.incremental.ResultStore` or the path of its SQLite
+    database. The content hash and results of every processed page are
+    saved, and on later runs pages whose HTML is unchanged reuse the stored
+    results instead of being parsed and extracted again, including any LLM
+    calls. Results are only reused for the same extractors and options.
+
+    Parsing and extraction run on the event loop unless ``workers`` is given,
+    in which case pages are processed in parallel by a pool of that size
+    while crawling continues. ``executor`` selects a ``"process"`` (default)
+    or ``"thread"`` pool, or supplies an existing
+    :class:`~concurrent.futures.Executor`. Worker processes only see
+    extractors registered at import time, and LLM extraction always uses
+    threads because the service cannot be shared between processes.
+
+    With an :class:`~ainfo.llm_service.AsyncLLMService` as ``llm``, contact
+    extraction awaits the model instead of blocking the event loop: up to
+    ``llm_concurrency`` pages wait for the LLM at the same time while the
+    crawl continues. A synchronous :class:`LLMService` is still accepted.
+
+    With ``classify_pages`` every page is labelled with its type, reported
+    under ``"page_type"``, and extractors only run on the page types they
+    are declared for. An extractor skipped on a page is still listed with
+    the value ``None``. The homepage, for instance, is usually classified as
+    ``"other"`` and then has ``"contacts": None`` even when its footer lists
+    contact details.
+    """
+
+    results: dict[str, dict[str, object]] = {}
+    async for link, page_results in async_stream_site(
+        url,
+        depth=depth,
+        render_js=render_js,
+        extract=extract,
+        include_text=include_text,
+        use_llm=use_llm,
+        llm=llm,
+        dedupe=dedupe,
+        parse_cache=parse_cache,
+        near_duplicate_distance=near_duplicate_distance,
+        incremental=incremental,
+        template_pages=template_pages,
+        classify_pages=classify_pages,
+        workers=workers,
+        executor=executor,
+        llm_concurrency=llm_concurrency,
+    ):
+        results[link] = page_results
+
+    return results
+
+
+def stream_site(
+    url: str,
+    *,
+    depth: int = 0,
+    render_js: bool = False,
+    extract: list[str] | None = None,
+    include_text: bool = False,
+    use_llm: bool = False,
+    llm: LLMService | AsyncLLMService | None = None,
+    dedupe: bool = True,
+    parse_cache: ParseCache | None = None,
+    near_duplicate_distance: int | None = None,
+    incremental: ResultStore | str | Path | None = None,
+    template_pages: int | None = None,
+    classify_pages: bool = False,
+    workers: int | None = None,
+    executor: str | Executor = "process",
+    llm_concurrency: int = 4,
+) -> Iterator[tuple[str, dict[str, object]]]:
+    """Synchronously iterate over the results of :func:`async_stream_site`.
+
+    The crawl runs on a private event loop that only advances while the
+    caller asks for the next page. Inside a running event loop use
+    :func:`async_stream_site` directly.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        msg = "stream_site cannot be used inside an event loop; use async_stream_site"
+        raise RuntimeError(msg)
+
+    with ExitStack() as stack:
+        loop = asyncio.new_event_loop()
+        stack.callback(loop.close)
+        stack.callback(lambda: loop.run_until_complete(loop.shutdown_asyncgens()))
+        if use_llm and llm is None:
+            managed_llm = AsyncLLMService()
+            stack.callback(lambda: loop.run_until_complete(managed_llm.aclose()))
+            llm = managed_llm
+        pages = async_stream_site(
+            url,
+            depth=depth,
+            render_js=render_js,
+            extract=extract,
+            include_text=include_text,
+            use_llm=use_llm,
+            llm=llm,
+            dedupe=dedupe,
+            parse_cache=parse_cache,
+            near_duplicate_distance=near_duplicate_distance,
+            incremental=incremental,
+            template_pages=template_pages,
+            classify_pages=classify_pages,
+            workers=workers,
+            executor=executor,
+            llm_concurrency=llm_concurrency,
+        )
+        stack.callback(lambda: loop.run_until_complete(pages.aclose()))
+        while True:
+            try:
+                yield loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                return
+
+
+def extract_site(
+    url: str,
+    *,
+    depth: int = 0,
+    render_js: bool = False,
+    extract: list[str] | None = None,
+    include_text: bool = False,
+    use_llm: bool = False,
+    llm: LLMService | AsyncLLMService | None = None,
+    dedupe: bool = True,
+    parse_cache: ParseCache | None = None,
+    near_duplicate_distance: int | None = None,
+    incremental: ResultStore | str | Path | None = None,
+    template_pages: int | None = None,
+    classify_pages: bool = False,
+    workers: int | None = None,
+    executor: str | Executor = "process",
+    llm_concurrency: int = 4,
+) -> dict[str, dict[str, object]] | asyncio.Task[dict[str, dict[str, object]]]:
+    """Synchronously run :func:`async_extract_site` when no event loop exists.
+
+    When called from within a running event loop a task is scheduled instead.
+    """
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        if use_llm and llm is None:
+
+            async def _with_managed_llm() -> dict[str, dict[str, object]]:
+                async with AsyncLLMService() as managed_llm:
+                    return await async_extract_site(
+                        url,
+                        depth=depth,
+                        render_js=render_js,
+                        extract=extract,
+                        include_text=include_text,
+                        use_llm=True,
+                        llm=managed_llm,
+                        dedupe=dedupe,
+                        parse_cache=parse_cache,
+                        near_duplicate_distance=near_duplicate_distance,
+                        incremental=incremental,
+                        template_pages=template_pages,
+                        classify_pages=classify_pages,
+                        workers=workers,
+                        executor=executor,
+                        llm_concurrency=llm_concurrency,
+                    )
+
+            return asyncio.run(_with_managed_llm())
+        return asyncio.run(
+            async_extract_site(
+                url,
+                depth=depth,
+                render_js=render_js,
+                extract=extract,
+                include_text=include_text,
+                use_llm=use_llm,
+                llm=llm,
+                dedupe=dedupe,
+                parse_cache=parse_cache,
+                near_duplicate_distance=near_duplicate_distance,
+                incremental=incremental,
+                template_pages=template_pages,
+                classify_pages=classify_pages,
+                workers=workers,
+                executor=executor,
+                llm_concurrency=llm_concurrency,
+            )
+        )
+    else:
+        if use_llm and llm is None:
+            msg = "llm must be provided when use_llm=True inside an event loop"
+            raise RuntimeError(msg)
+        return loop.create_task(
+            async_extract_site(
+                url,
+                depth=depth,
+                render_js=render_js,
+                extract=extract,
+                include_text=include_text,
+                use_llm=use_llm,
+                llm=llm,
+                dedupe=dedupe,
+                parse_cache=parse_cache,
+                near_duplicate_distance=near_duplicate_distance,
+                incremental=incremental,
+                template_pages=template_pages,
+                classify_pages=classify_pages,
+                workers=workers,
+                executor=executor,
+                llm_concurrency=llm_concurrency,
+            )
+        )
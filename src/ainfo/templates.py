@@ -0,0 +1,168 @@
+"""Learn the boilerplate shared by the pages of a site and leave it out."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+import hashlib
+import math
+import threading
+
+from .models import Document, NodeTree
+
+__all__ = ["SiteTemplate", "page_fingerprints", "strip_boilerplate"]
+
+# Attributes identifying a block, hashed along with its tag. Classes are
+# left out because they often mark per-page state such as the active menu
+# entry.
+_BLOCK_ATTRS = ("id", "role")
+
+# Shorter blocks, such as single table cells or labels, are never treated as
+# boilerplate even when they recur on every page.
+_MIN_BLOCK_CHARS = 20
+
+
+def _node_fingerprints(tree: NodeTree) -> list[bytes]:
+    """Return a fingerprint of the subtree rooted at every node of ``tree``.
+
+    A fingerprint covers the tag and identifying attributes of the node, the
+    text it contains directly and the fingerprints of its children, so two
+    subtrees share it only if their structure and text are identical.
+    Fingerprints are built bottom-up, hashing every piece of text once.
+    """
+
+    buffer = tree.text_buffer
+    starts = tree.starts
+    stops = tree.stops
+    fingerprints: list[bytes] = [b""] * len(tree)
+    for index in range(len(tree) - 1, -1, -1):
+        digest = hashlib.blake2b(digest_size=8)
+        attrs = tree.attrs[index]
+        digest.update(tree.tag(index).encode("utf-8"))
+        for key in _BLOCK_ATTRS:
+            digest.update(b"\0" + attrs.get(key, "").encode("utf-8"))
+        position = starts[index]
+        for child in tree.children(index):
+            digest.update(b"\1" + buffer[position : starts[child]].strip().encode("utf-8"))
+            digest.update(b"\2" + fingerprints[child])
+            position = max(position, stops[child])
+        digest.update(b"\1" + buffer[position : stops[index]].strip().encode("utf-8"))
+        fingerprints[index] = digest.digest()
+    return fingerprints
+
+
+def page_fingerprints(doc: Document) -> frozenset[bytes]:
+    """Return the fingerprints of the subtrees of ``doc`` that may be boilerplate.
+
+    Only subtrees containing at least a short sentence of text are included.
+    """
+
+    tree = doc.tree
+    starts = tree.starts
+    stops = tree.stops
+    return frozenset(
+        fingerprint
+        for index, fingerprint in enumerate(_node_fingerprints(tree))
+        if stops[index] - starts[index] >= _MIN_BLOCK_CHARS
+    )
+
+
+def strip_boilerplate(doc: Document, boilerplate: frozenset[bytes]) -> int:
+    """Exclude the subtrees of ``doc`` whose fingerprint is in ``boilerplate``.
+
+    Only the outermost matching subtrees are excluded, see
+    :meth:`~ainfo.models.Document.exclude`. Returns their number.
+    """
+
+    if not boilerplate:
+        return 0
+    tree = doc.tree
+    fingerprints = _node_fingerprints(tree)
+    roots: list[int] = []
+    index = 0
+    while index < len(tree):
+        if fingerprints[index] in boilerplate:
+            roots.append(index)
+            index = tree.ends[index]
+        else:
+            index += 1
+    if roots:
+        doc.exclude(roots)
+    return len(roots)
+
+
+class SiteTemplate:
+    """Boilerplate blocks learned from the first pages of a site.
+
+    The first ``sample_pages`` pages passed to :meth:`apply` are left
+    unchanged while the fingerprints of their subtrees are counted. Blocks
+    that occur on at least ``min_share`` of them, such as the header, footer
+    and sidebars, are the site template. Later pages get these blocks
+    excluded from their text, so site-wide content, including contact
+    details in the footer, is extracted from the sample pages only and is
+    not scanned or sent to an LLM again for every page.
+
+    Parameters
+    ----------
+    sample_pages:
+        Number of pages the template is learned from.
+    min_share:
+        Fraction of the sample pages a block must occur on to be treated as
+        boilerplate. At least two pages are always required.
+    """
+
+    def __init__(self, sample_pages: int = 5, *, min_share: float = 0.5) -> None:
+        if sample_pages < 2:
+            raise ValueError("sample_pages must be at least 2")
+        if not 0 < min_share <= 1:
+            raise ValueError("min_share must be between 0 and 1")
+        self.sample_pages = sample_pages
+        self.min_pages = max(2, math.ceil(min_share * sample_pages))
+        self._counts: Counter[bytes] = Counter()
+        self._observed = 0
+        self._boilerplate: frozenset[bytes] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def learning(self) -> bool:
+        """Whether the template is still being learned."""
+
+        return self._boilerplate is None
+
+    @property
+    def boilerplate(self) -> frozenset[bytes] | None:
+        """Fingerprints of the boilerplate blocks, or ``None`` while learning."""
+
+        return self._boilerplate
+
+    def observe(self, fingerprints: Iterable[bytes]) -> None:
+        """Count the :func:`page_fingerprints` of one sample page.
+
+        Pages observed after the template is complete are ignored.
+        """
+
+        with self._lock:
+            if self._boilerplate is not None:
+                return
+            self._counts.update(set(fingerprints))
+            self._observed += 1
+            if self._observed >= self.sample_pages:
+                self._boilerplate = frozenset(
+                    fingerprint
+                    for fingerprint, count in self._counts.items()
+                    if count >= self.min_pages
+                )
+                self._counts.clear()
+
+    def apply(self, doc: Document) -> Document:
+        """Learn from ``doc`` or strip the learned boilerplate from it.
+
+        Returns ``doc``.
+        """
+
+        boilerplate = self._boilerplate
+        if boilerplate is None:
+            self.observe(page_fingerprints(doc))
+        else:
+            strip_boilerplate(doc, boilerplate)
+        return doc
@@ -1,10 +1,19 @@
 """Tests for contact information extraction helpers."""
 
+import random
+
+import pytest
+
+from ainfo.extraction import extract_information
+from ainfo.extractors import contact
 from ainfo.extractors.contact import (
     extract_addresses,
     extract_emails,
     extract_phone_numbers,
+    infer_region,
+    scan_contacts,
 )
+from ainfo.parsing import parse_html
 from ainfo.extractors.social import extract_social_profiles
 
 
@@ -20,8 +29,9 @@ def test_extract_emails() -> None:
     ]
 
 
-def test_extract_phone_numbers() -> None:
+def test_extract_phone_numbers(monkeypatch: pytest.MonkeyPatch) -> None:
     """Phone numbers are normalized to digits when phonenumbers is absent."""
+    monkeypatch.setattr(contact, "phonenumbers", None)
     text = "Call (123) 456-7890 or 987-654-3210."
     assert extract_phone_numbers(text) == [
         "1234567890",
@@ -48,3 +58,84 @@ def test_extract_social_profiles() -> None:
         "https://twitter.com/example",
         "https://linkedin.com/company/example",
     ]
+
+
+def test_scan_contacts_matches_field_extractors() -> None:
+    """The one-pass scanner returns the same results as each field helper."""
+    rng = random.Random(0)
+    pieces = [
+        "a", "Z", "9", "0", " ", "\n", "@", ".", "-", "+", "_", "(", ")", "/",
+        ",", "x@y.io", "hello.world@sub.example.org", "@@", "http://", "https://",
+        "twitter.com/", "https://www.linkedin.com/in/jane", "123 Main Street",
+        "45 Elm Rd", " St ", "Ave", "(555) 123-4567", "+1 555 987 6543",
+        "555-0000",
+    ]
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+        assert scan_contacts(text) == {
+            "emails": extract_emails(text),
+            "phone_numbers": extract_phone_numbers(text),
+            "addresses": extract_addresses(text),
+            "social_media": extract_social_profiles(text),
+        }
+
+
+def test_extract_phone_numbers_parses_candidate_spans() -> None:
+    """Only digit-dense spans are parsed and repeated spans hit the cache."""
+    pytest.importorskip("phonenumbers")
+    contact._parse_phone_span.cache_clear()
+    text = "Order 42, 3 items. Call (212) 456-7890."
+    assert extract_phone_numbers(text) == ["+12124567890"]
+    assert extract_phone_numbers(text) == ["+12124567890"]
+    info = contact._parse_phone_span.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert extract_phone_numbers("Tel 030 1234567", "DE") == ["+49301234567"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Tel: +1 (212) 456\u20137890",
+        "call 212\u2011456\u20117890",
+        "Phone 212\u2212456\u22127890",
+        "Fax 212\uff0d456\uff0d7890",
+    ],
+)
+def test_phone_numbers_with_dash_variants(text: str) -> None:
+    """Spans separated by en dashes, non-breaking hyphens and minus signs parse."""
+    pytest.importorskip("phonenumbers")
+    assert extract_phone_numbers(text) == ["+12124567890"]
+    assert scan_contacts(text)["phone_numbers"] == ["+12124567890"]
+
+
+def test_infer_region() -> None:
+    """The phone region comes from the TLD or the ``lang`` attribute."""
+    html = '<html lang="{lang}"><body><p>Hi</p></body></html>'
+    assert infer_region(parse_html(html.format(lang="fr"), url="https://example.de/")) == "DE"
+    assert infer_region(parse_html(html.format(lang="de-CH"), url="https://example.com/")) == "CH"
+    assert infer_region(parse_html(html.format(lang="de"), url="https://example.io/")) == "DE"
+    assert infer_region(parse_html("<p>Hi</p>", url="https://example.com/")) == "US"
+    assert infer_region(parse_html(html.format(lang="en-GB"), url="https://example.ws/")) == "GB"
+
+
+def test_infer_region_skips_tlds_that_are_not_phone_regions() -> None:
+    """A ``.eu`` site uses its ``lang`` region, or ``US`` without one."""
+    pytest.importorskip("phonenumbers")
+    html = '<html lang="{lang}"><body><p>Hi</p></body></html>'
+    assert infer_region(parse_html(html.format(lang="de"), url="https://example.eu/")) == "DE"
+    assert infer_region(parse_html("<p>Hi</p>", url="https://example.eu/")) == "US"
+    assert infer_region(parse_html(html.format(lang="de-EU"), url="https://example.eu/")) == "US"
+
+
+def test_scan_contacts_parses_spans_in_the_inferred_region() -> None:
+    """Local numbers on a ``.eu`` page are parsed in its ``lang`` region."""
+    pytest.importorskip("phonenumbers")
+    contact._parse_phone_span.cache_clear()
+    doc = parse_html(
+        '<html lang="de"><body><p>Ticket 12, Tel. 030 1234567 oder (030) 7654321</p>'
+        "</body></html>",
+        url="https://example.eu/kontakt",
+    )
+    contacts = extract_information(doc)
+    assert contacts.phone_numbers == ["+49301234567", "+49307654321"]
+    assert contact._parse_phone_span.cache_info().misses == 2
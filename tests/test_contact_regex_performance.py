@@ -0,0 +1,128 @@
+"""Benchmark and fuzz the contact regexes on adversarial and huge inputs.
+
+Each case times a scan of an input and of one four times as long, records
+the ratio as a test property (visible with ``--junitxml``) and fails when the
+time grows faster than linearly, which catches regressions to super-linear
+backtracking without depending on the speed of the machine.
+
+The timed cases take a while and still depend on the machine being idle, so
+they are marked ``benchmark`` and only run with ``pytest -m benchmark``.
+"""
+
+from collections.abc import Callable
+import random
+import re
+import time
+
+import pytest
+
+from ainfo.extractors.contact import (
+    ADDRESS_PATTERN,
+    EMAIL_PATTERN,
+    MAILTO_PATTERN,
+    PHONE_PATTERN,
+    scan_contacts,
+)
+from ainfo.extractors.social import SOCIAL_PATTERN
+
+SIZE = 50_000
+
+# Allowed growth of the scan time when the input grows four times. Linear
+# patterns stay close to 4; the previous unbounded patterns grew at least
+# sixteen times.
+MAX_RATIO = 8.0
+
+# Shorter scans are dominated by timer noise, so the ratio is taken against
+# at least this many seconds.
+MIN_SECONDS = 0.002
+
+PATTERNS = {
+    "email": EMAIL_PATTERN,
+    "mailto": MAILTO_PATTERN,
+    "phone": PHONE_PATTERN,
+    "address": ADDRESS_PATTERN,
+    "social": SOCIAL_PATTERN,
+}
+
+ADVERSARIAL: dict[str, Callable[[int], str]] = {
+    "local_part_run": lambda size: "a" * size,
+    "domain_run": lambda size: "a@" + "b" * size,
+    "at_signs": lambda size: "a@" * (size // 2),
+    "dotted_domain": lambda size: "a@b" + ".c-" * (size // 3),
+    "digits": lambda size: "1" * size,
+    "spaced_digits": lambda size: "1 " * (size // 2),
+    "number_word_table": lambda size: "12 item " * (size // 8),
+    "long_words": lambda size: ("1 " + "x" * 500 + " ") * (size // 503),
+    "street_words": lambda size: "1 main street " * (size // 14),
+    "mailto_run": lambda size: "mailto:" + "a" * size,
+    "social_urls": lambda size: "https://twitter.com/" * (size // 20),
+}
+
+
+def _fuzz_text(seed: int, size: int) -> str:
+    rng = random.Random(seed)
+    pieces = ["1", "12345", " ", "a", "x" * 50, "@", ".", "-", "St", "Street", "(", ")"]
+    return "".join(rng.choice(pieces) for _ in range(size // 4))[:size]
+
+
+def _finditer(pattern: re.Pattern[str]) -> Callable[[str], None]:
+    def scan(text: str) -> None:
+        for _ in pattern.finditer(text):
+            pass
+
+    return scan
+
+
+def _timed(scan: Callable[[str], object], text: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        scan(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _growth(scan: Callable[[str], object], make: Callable[[int], str]) -> float:
+    """Return how much longer ``scan`` takes on an input four times as long."""
+
+    small = _timed(scan, make(SIZE))
+    large = _timed(scan, make(4 * SIZE))
+    return large / max(small, MIN_SECONDS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("case", sorted(ADVERSARIAL))
+@pytest.mark.parametrize("name", sorted(PATTERNS))
+def test_contact_patterns_run_in_linear_time(name, case, record_property) -> None:
+    growth = _growth(_finditer(PATTERNS[name]), ADVERSARIAL[case])
+    record_property(f"{name}:{case}", round(growth, 2))
+    assert growth < MAX_RATIO
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("seed", range(3))
+def test_contact_scan_on_fuzzed_input(seed, record_property) -> None:
+    def make(size: int) -> str:
+        return _fuzz_text(seed, size)
+
+    for name, pattern in PATTERNS.items():
+        growth = _growth(_finditer(pattern), make)
+        record_property(f"{name}:fuzz{seed}", round(growth, 2))
+        assert growth < MAX_RATIO
+
+    growth = _growth(scan_contacts, make)
+    record_property(f"scan_contacts:fuzz{seed}", round(growth, 2))
+    assert growth < MAX_RATIO
+
+
+def test_bounded_patterns_keep_common_matches() -> None:
+    text = (
+        "Write to jane.doe+info@mail.example.co.uk or visit "
+        "1600 Pennsylvania Avenue NW Washington DC, call (202) 456-1111."
+    )
+    assert EMAIL_PATTERN.findall(text) == ["jane.doe+info@mail.example.co.uk"]
+    assert [m.group(0).strip() for m in ADDRESS_PATTERN.finditer(text)] == [
+        "1600 Pennsylvania Avenue NW Washington DC"
+    ]
+    assert PHONE_PATTERN.findall(text) == ["(202) 456-1111"]
+    assert EMAIL_PATTERN.findall("x" * 65 + "@example.com") == []
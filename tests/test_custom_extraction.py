@@ -1,4 +1,4 @@
-from ainfo import parse_data, extract_custom
+from ainfo import CustomExtractor, parse_data, extract_custom
 
 
 class DummyLLM:
@@ -27,3 +27,18 @@ def test_extract_custom_llm() -> None:
     assert results == {"prices": ["$30"]}
     assert llm.calls[0][1] == "Extract prices"
     assert llm.calls[0][2] == "test-model"
+
+
+def test_custom_extractor_runs_over_many_documents() -> None:
+    docs = [
+        parse_data(f"<html><body><p>Item {i} costs ${i}0 or ${i}5.</p></body></html>")
+        for i in range(1, 4)
+    ]
+    extractor = CustomExtractor({"prices": r"\$\d+", "items": r"item \d"})
+
+    expected = [
+        {"prices": [f"${i}0", f"${i}5"], "items": [f"Item {i}"]} for i in range(1, 4)
+    ]
+    assert extractor.extract_many(docs) == expected
+    assert extractor.extract_many(docs, max_workers=2) == expected
+    assert extractor(docs[0]) == expected[0]
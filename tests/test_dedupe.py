@@ -0,0 +1,30 @@
+import random
+
+from ainfo.dedupe import SimHashIndex, hamming_distance, simhash
+
+
+def _words(seed: int, count: int = 2000) -> str:
+    rng = random.Random(seed)
+    return " ".join(f"word{rng.randrange(2000)}" for _ in range(count))
+
+
+def test_simhash_is_close_for_near_duplicates() -> None:
+    text = _words(1)
+    near = text + " csrf 8f3a2c session 91b2 generated 2024-05-01"
+    other = _words(2)
+
+    assert simhash(text) == simhash(text.upper())
+    assert hamming_distance(simhash(text), simhash(near)) <= 6
+    assert hamming_distance(simhash(text), simhash(other)) > 12
+    assert simhash("") == 0
+
+
+def test_simhash_index_finds_fingerprints_within_distance() -> None:
+    index = SimHashIndex(max_distance=3)
+    base = 0x0123_4567_89AB_CDEF
+
+    assert index.match_or_add(base, "a") is None
+    assert index.match_or_add(base ^ 0b1011, "b") == "a"
+    assert index.find(base ^ 0b1111) is None
+    assert index.match_or_add(~base & (2**64 - 1), "c") is None
+    assert len(index) == 2
@@ -1,6 +1,8 @@
 import asyncio
+import json
 
 import ainfo
+from ainfo import pipeline
 
 
 def test_async_extract_site_dedupes_and_limits_domain(monkeypatch):
@@ -15,14 +17,14 @@ def test_async_extract_site_dedupes_and_limits_domain(monkeypatch):
         for link, raw in pages:
             yield link, raw
 
-    monkeypatch.setattr(ainfo, "crawl_urls", fake_crawl)
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
     monkeypatch.setattr(
-        ainfo,
+        pipeline,
         "parse_data",
         lambda raw, url=None: {"url": url, "raw": raw},
     )
     monkeypatch.setattr(
-        ainfo,
+        pipeline,
         "extract_text",
         lambda doc: f"text:{doc['url']}",
     )
@@ -31,7 +33,7 @@ def test_async_extract_site_dedupes_and_limits_domain(monkeypatch):
         return {"contacts": doc["url"], "method": method}
 
     monkeypatch.setattr(
-        ainfo,
+        pipeline,
         "AVAILABLE_EXTRACTORS",
         {"contacts": fake_contacts},
     )
@@ -59,9 +61,9 @@ def test_extract_site_runs_synchronously(monkeypatch):
     async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
         yield url, "<html><body>home</body></html>"
 
-    monkeypatch.setattr(ainfo, "crawl_urls", fake_crawl)
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
     monkeypatch.setattr(
-        ainfo,
+        pipeline,
         "parse_data",
         lambda raw, url=None: {"url": url, "raw": raw},
     )
@@ -70,7 +72,7 @@ def test_extract_site_runs_synchronously(monkeypatch):
         return doc["url"]
 
     monkeypatch.setattr(
-        ainfo,
+        pipeline,
         "AVAILABLE_EXTRACTORS",
         {"contacts": fake_contacts},
     )
@@ -78,3 +80,224 @@ def test_extract_site_runs_synchronously(monkeypatch):
     result = ainfo.extract_site("https://example.com")
     assert result == {"https://example.com": {"contacts": "https://example.com"}}
 
+
+
+def test_async_extract_site_processes_pages_in_worker_pools(monkeypatch):
+    pages = [
+        (
+            f"https://example.com/{i}",
+            f"<html><body><p>Mail team{i}@example.com</p>"
+            f"<a href='https://example.com/{i + 1}'>next</a></body></html>",
+        )
+        for i in range(4)
+    ]
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages:
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    def run(**kwargs):
+        return asyncio.run(
+            ainfo.async_extract_site(
+                "https://example.com", extract=["contacts", "links"], **kwargs
+            )
+        )
+
+    inline = run()
+    assert list(inline) == [link for link, _ in pages]
+    assert inline["https://example.com/2"]["contacts"].emails == ["team2@example.com"]
+    assert run(workers=2, executor="thread") == inline
+    assert run(workers=2) == inline
+
+
+def test_stream_site_yields_pages_while_crawling(monkeypatch):
+    crawled: list[str] = []
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for i in range(3):
+            link = f"https://example.com/{i}"
+            crawled.append(link)
+            yield link, f"<html><body><p>This is the text of page {i}</p></body></html>"
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    async def first_page():
+        async for link, page in ainfo.async_stream_site(
+            "https://example.com", extract=["links"], include_text=True
+        ):
+            return link, page, list(crawled)
+
+    link, page, seen = asyncio.run(first_page())
+    assert link == "https://example.com/0"
+    assert page == {"text": "This is the text of page 0", "links": []}
+    assert seen == ["https://example.com/0"]
+
+    crawled.clear()
+    stream = ainfo.stream_site("https://example.com", extract=["links"])
+    assert next(stream)[0] == "https://example.com/0"
+    assert crawled == ["https://example.com/0"]
+    assert [link for link, _ in stream] == ["https://example.com/1", "https://example.com/2"]
+
+
+def test_async_extract_site_skips_near_duplicate_content(monkeypatch):
+    article = " ".join(f"Sentence {i} of the calendar listing for this month." for i in range(40))
+    pages = [
+        (
+            f"https://example.com/events?day={day}",
+            f"<html><body><p>{article}</p><p>Generated token {day * 7919}</p></body></html>",
+        )
+        for day in range(3)
+    ]
+    pages.append(
+        ("https://example.com/about", "<html><body><p>We are a small team of makers.</p></body></html>")
+    )
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages:
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    for kwargs in ({}, {"workers": 2}):
+        result = asyncio.run(
+            ainfo.async_extract_site(
+                "https://example.com",
+                extract=["links"],
+                near_duplicate_distance=6,
+                **kwargs,
+            )
+        )
+        assert list(result) == ["https://example.com/events?day=0", "https://example.com/about"]
+
+
+def test_near_duplicates_are_not_extracted_in_worker_processes(monkeypatch, tmp_path):
+    article = " ".join(f"Sentence {i} of the calendar listing for this month." for i in range(40))
+    pages = [
+        (
+            f"https://example.com/events?day={day}",
+            f"<html><body><p>{article}</p><p>Generated token {day * 7919}</p></body></html>",
+        )
+        for day in range(3)
+    ]
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages:
+            yield link, raw
+
+    visits = tmp_path / "visits.txt"
+
+    def visited(doc):
+        # Runs in the worker processes, so record the call in a file.
+        with visits.open("a", encoding="utf-8") as handle:
+            handle.write(f"{doc.url}\n")
+        return doc.url
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    monkeypatch.setitem(pipeline.AVAILABLE_EXTRACTORS, "visited", visited)
+
+    result = asyncio.run(
+        ainfo.async_extract_site(
+            "https://example.com",
+            extract=["visited"],
+            near_duplicate_distance=6,
+            workers=2,
+        )
+    )
+    assert list(result) == ["https://example.com/events?day=0"]
+    assert visits.read_text(encoding="utf-8").split() == ["https://example.com/events?day=0"]
+
+
+def test_async_extract_site_strips_learned_template(monkeypatch):
+    footer = (
+        "<footer><p>Acme Inc, contact us at office@example.com</p>"
+        "<a href='mailto:office@example.com'>Mail us</a></footer>"
+    )
+    pages = [
+        (
+            f"https://example.com/{i}",
+            f"<html><body><div class='menu {'active' if i == 0 else ''}'>"
+            f"<p>Home and products and about us</p></div>"
+            f"<p>Article {i} is written by author{i}@example.com today.</p>{footer}"
+            "</body></html>",
+        )
+        for i in range(4)
+    ]
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages:
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    for kwargs in ({}, {"workers": 2}):
+        result = asyncio.run(
+            ainfo.async_extract_site(
+                "https://example.com", template_pages=2, include_text=True, **kwargs
+            )
+        )
+        emails = [page["contacts"].emails for page in result.values()]
+        assert emails == [
+            ["author0@example.com", "office@example.com"],
+            ["author1@example.com", "office@example.com"],
+            ["author2@example.com"],
+            ["author3@example.com"],
+        ]
+        assert result["https://example.com/3"]["text"] == (
+            "Article 3 is written by author3@example.com today."
+        )
+
+
+def test_async_extract_site_awaits_async_llm_while_crawling(monkeypatch):
+    pages = [
+        (
+            f"https://example.com/{i}",
+            f"<html><body><p>Write to page{i}@example.com</p></body></html>",
+        )
+        for i in range(4)
+    ]
+    fetched_all = asyncio.Event()
+    in_flight = 0
+    peak = 0
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for index, (link, raw) in enumerate(pages):
+            if index == len(pages) - 1:
+                fetched_all.set()
+            yield link, raw
+
+    class FakeAsyncLLM(ainfo.AsyncLLMService):
+        def __init__(self):
+            pass
+
+        async def extract(self, text, instruction, model=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Blocks until the crawl has moved on, so the pipeline must keep
+            # fetching while LLM calls are pending.
+            await asyncio.wait_for(fetched_all.wait(), timeout=5)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            email = text.split()[-1]
+            return json.dumps({"emails": [email]})
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    result = asyncio.run(
+        ainfo.async_extract_site(
+            "https://example.com",
+            use_llm=True,
+            llm=FakeAsyncLLM(),
+            llm_concurrency=2,
+            extract=["contacts", "links"],
+        )
+    )
+
+    assert list(result) == [link for link, _ in pages]
+    assert [page["contacts"].emails for page in result.values()] == [
+        [f"page{i}@example.com"] for i in range(4)
+    ]
+    assert list(result["https://example.com/0"]) == ["contacts", "links"]
+    assert peak == 2
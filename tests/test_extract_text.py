@@ -16,3 +16,48 @@ def test_extract_text_string_and_list() -> None:
         "First paragraph has enough words here.",
         "Second block also contains several words.",
     ]
+
+
+def test_extract_text_does_not_repeat_nested_content() -> None:
+    html = (
+        "<html><body><div><p>Nested paragraph with plenty of words.</p>"
+        "<p>Another nested paragraph with words.</p></div>"
+        "<footer>Contact footer@example.com</footer></body></html>"
+    )
+    doc = parse_data(html, url="http://example.com")
+    assert extract_text(doc, as_list=True) == [
+        "Nested paragraph with plenty of words. "
+        "Another nested paragraph with words."
+    ]
+    assert extract_text(doc, content_only=False) == (
+        "Nested paragraph with plenty of words. "
+        "Another nested paragraph with words. Contact footer@example.com"
+    )
+
+
+def test_extract_text_views_are_memoised(monkeypatch) -> None:
+    import ainfo.extraction as extraction
+    from ainfo import extract_custom, extract_information
+
+    calls: list[bool] = []
+    real_gather = extraction._gather_text
+
+    def counting_gather(tree, *, content_only, **kwargs):
+        calls.append(content_only)
+        return real_gather(tree, content_only=content_only, **kwargs)
+
+    monkeypatch.setattr(extraction, "_gather_text", counting_gather)
+    html = "<html><body><p>Write to hello@example.com for five words.</p></body></html>"
+    doc = parse_data(html)
+
+    extract_information(doc)
+    extract_text(doc, content_only=False)
+    extract_custom(doc, {"mail": r"\S+@\S+"})
+    assert extract_text(doc, joiner="\n") == extract_text(doc)
+    parts = extract_text(doc, as_list=True)
+    parts.append("mutated")
+
+    assert calls == [False, True]
+    assert extract_text(doc, as_list=True) == [
+        "Write to hello@example.com for five words."
+    ]
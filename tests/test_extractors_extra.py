@@ -13,3 +13,79 @@ def test_extract_links_and_headings() -> None:
     doc = parse_data(html, url="https://example.com")
     assert extract_links(doc) == ["https://example.com", "/relative"]
     assert extract_headings(doc) == {"h1": ["Main"], "h2": ["Sub"]}
+
+
+def test_run_extractors_matches_function_extractors() -> None:
+    from ainfo.extractors import AVAILABLE_EXTRACTORS, run_extractors
+
+    html = (
+        "<html><body><h1>Main</h1><p>Mail info@example.com or call us.</p>"
+        '<a href="mailto:team@example.com">Team</a>'
+        '<a href="/relative">Rel</a></body></html>'
+    )
+    doc = parse_data(html, url="https://example.com")
+    calls: list[str] = []
+
+    def shout(document, suffix="!"):
+        calls.append(document.url)
+        return document.title or "none" + suffix
+
+    registry = {**AVAILABLE_EXTRACTORS, "shout": shout}
+    names = ["links", "shout", "contacts", "headings"]
+    results = run_extractors(
+        doc, names, extractors=registry, options={"shout": {"suffix": "?"}}
+    )
+
+    assert list(results) == names
+    assert results["shout"] == "none?"
+    assert calls == ["https://example.com"]
+    for name in ("links", "contacts", "headings"):
+        assert results[name] == AVAILABLE_EXTRACTORS[name](doc)
+    assert results["contacts"].emails == ["info@example.com", "team@example.com"]
+
+
+def test_extractor_registry_loads_lazily_and_tracks_inputs(monkeypatch) -> None:
+    from ainfo.extractors import registry as registry_module
+    from ainfo.extractors import ExtractorRegistry, requires, run_extractors
+
+    class FakeEntryPoint:
+        name = "plugin_headings"
+        value = "ainfo.extractors.headings:extract_headings"
+
+    monkeypatch.setattr(
+        registry_module, "entry_points", lambda group: [FakeEntryPoint()]
+    )
+    registry = ExtractorRegistry()
+    registry.register("links", "ainfo.extractors.links:extract_links", inputs={"links"})
+
+    @requires("text")
+    def words(doc):
+        return len(doc.title.split())
+
+    registry["words"] = words
+
+    assert sorted(registry) == ["links", "plugin_headings", "words"]
+    assert registry.spec("links")._func is None
+    assert registry.required_inputs(["links", "words"]) == {"links", "text"}
+    assert registry.required_inputs(["plugin_headings"]) == registry_module.ARTIFACTS
+
+    doc = parse_data(
+        "<html><head><title>A b</title></head><body><p>Hello there</p>"
+        '<a href="/x">x</a></body></html>'
+    )
+    assert run_extractors(doc, ["links"], extractors=registry) == {"links": ["/x"]}
+    # Only the node structure was needed: text and navigation flags stay unbuilt.
+    assert set(doc.tree._deferred) == {"text", "flags"}
+    assert run_extractors(doc, ["words"], extractors=registry) == {"words": 2}
+
+
+def test_contacts_extractor_is_registered_by_reference() -> None:
+    from ainfo import extractors
+    from ainfo.extraction import ContactVisitor, extract_information
+    from ainfo.extractors.engine import _VISITORS
+
+    spec = extractors.AVAILABLE_EXTRACTORS.spec("contacts")
+    assert spec.target == "ainfo.extraction:extract_information"
+    assert extractors.AVAILABLE_EXTRACTORS["contacts"] is extract_information
+    assert extractors.extract_contacts is extract_information
+    assert _VISITORS[extract_information] is ContactVisitor
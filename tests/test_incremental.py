@@ -0,0 +1,151 @@
+import asyncio
+import threading
+
+import ainfo
+from ainfo import pipeline
+from ainfo.incremental import ResultStore
+from ainfo.schemas import ContactDetails
+
+
+def test_result_store_round_trip(tmp_path) -> None:
+    path = tmp_path / "results.sqlite"
+    config = ResultStore.config_key(extract=["links"], include_text=False)
+    with ResultStore(path) as store:
+        store.put("https://example.com", config, "abc", {"links": ["/a"]})
+        store.put("https://example.com/x", config, "def", {"bad": object()})
+
+    with ResultStore(path) as store:
+        assert len(store) == 1
+        assert store.get("https://example.com", config, "abc") == {"links": ["/a"]}
+        assert store.get("https://example.com", config, "changed") is None
+        assert store.get("https://example.com", "other-config", "abc") is None
+
+
+def test_extract_site_reuses_results_for_unchanged_pages(monkeypatch, tmp_path) -> None:
+    pages = {
+        "https://example.com": "<html><body><p>Mail info@example.com</p></body></html>",
+        "https://example.com/news": "<html><body><p>News from monday</p></body></html>",
+    }
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages.items():
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    parsed: list[str] = []
+    real_scan = pipeline.scan_page
+
+    def counting_scan(raw, url, *args, **kwargs):
+        parsed.append(url)
+        return real_scan(raw, url, *args, **kwargs)
+
+    monkeypatch.setattr(pipeline, "scan_page", counting_scan)
+    database = tmp_path / "incremental.sqlite"
+
+    def run(**kwargs):
+        return asyncio.run(
+            ainfo.async_extract_site(
+                "https://example.com", extract=["contacts"], incremental=database, **kwargs
+            )
+        )
+
+    first = run()
+    assert parsed == ["https://example.com", "https://example.com/news"]
+
+    pages["https://example.com/news"] = "<html><body><p>News from tuesday</p></body></html>"
+    parsed.clear()
+    second = run()
+    assert parsed == ["https://example.com/news"]
+    assert second == first
+    assert isinstance(second["https://example.com"]["contacts"], ContactDetails)
+
+    parsed.clear()
+    assert run(workers=2, executor="thread") == first
+    assert parsed == []
+
+
+def test_extract_site_reads_and_writes_the_store_off_the_event_loop(monkeypatch, tmp_path) -> None:
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        yield "https://example.com", "<html><body><p>Mail info@example.com</p></body></html>"
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    threads: list[int] = []
+
+    class RecordingStore(ResultStore):
+        def get(self, *args):
+            threads.append(threading.get_ident())
+            return super().get(*args)
+
+        def put(self, *args):
+            threads.append(threading.get_ident())
+            super().put(*args)
+
+    with RecordingStore(tmp_path / "incremental.sqlite") as store:
+        for _ in range(2):
+            asyncio.run(ainfo.async_extract_site("https://example.com", incremental=store))
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+
+def test_reused_pages_still_feed_the_near_duplicate_index(monkeypatch, tmp_path) -> None:
+    article = " ".join(f"Sentence {i} of the calendar listing for this month." for i in range(40))
+    pages = {
+        "https://example.com/events?day=0": f"<html><body><p>{article}</p></body></html>",
+    }
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages.items():
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    database = tmp_path / "incremental.sqlite"
+
+    def run(**kwargs):
+        return asyncio.run(
+            ainfo.async_extract_site(
+                "https://example.com",
+                extract=["links"],
+                near_duplicate_distance=6,
+                incremental=database,
+                **kwargs,
+            )
+        )
+
+    assert list(run()) == ["https://example.com/events?day=0"]
+    pages["https://example.com/events?day=1"] = (
+        f"<html><body><p>{article}</p><p>Generated token 7919</p></body></html>"
+    )
+    for kwargs in ({}, {"workers": 2}):
+        assert list(run(**kwargs)) == ["https://example.com/events?day=0"]
+
+
+def test_reused_pages_still_teach_the_site_template(monkeypatch, tmp_path) -> None:
+    footer = "<footer><p>Acme Inc, contact us at office@example.com</p></footer>"
+    pages = {
+        f"https://example.com/{i}": (
+            f"<html><body><p>Article {i} is written by author{i}@example.com today.</p>"
+            f"{footer}</body></html>"
+        )
+        for i in range(3)
+    }
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages.items():
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    database = tmp_path / "incremental.sqlite"
+
+    def run(**kwargs):
+        return asyncio.run(
+            ainfo.async_extract_site("https://example.com", template_pages=2, **kwargs)
+        )
+
+    run(incremental=database)
+    pages["https://example.com/2"] = pages["https://example.com/2"].replace(
+        "author2", "editor2"
+    )
+    expected = run()
+    assert expected["https://example.com/2"]["contacts"].emails == ["editor2@example.com"]
+    for kwargs in ({}, {"workers": 2}, {"workers": 2, "executor": "thread"}):
+        assert run(incremental=database, **kwargs) == expected
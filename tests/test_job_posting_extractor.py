@@ -108,3 +108,31 @@ def test_extract_job_postings_with_german_keywords() -> None:
             "position": "Werkstudent Marketing",
         },
     ]
+
+
+def test_extract_job_postings_merges_nested_containers_once(monkeypatch) -> None:
+    from ainfo.extractors import jobs
+
+    calls: list[int] = []
+    real_extract_fields = jobs._extract_fields
+
+    def counting_extract_fields(index, segments):
+        calls.append(index)
+        return real_extract_fields(index, segments)
+
+    monkeypatch.setattr(jobs, "_extract_fields", counting_extract_fields)
+
+    html = (
+        "<html><body>"
+        '<div class="jobs">'
+        "<div><div><h2>Backend Engineer</h2><p>Location: Vienna</p></div></div>"
+        '<div><a class="apply-button" href="/apply/1"></a></div>'
+        "</div>"
+        "</body></html>"
+    )
+
+    postings = extract_job_postings(parse_data(html, url="https://example.com"))
+
+    listing = {"location": "Vienna", "position": "Backend Engineer"}
+    assert postings == [{**listing, "apply_url": "/apply/1"}, listing, listing]
+    assert len(calls) == len(set(calls)) == 2
@@ -0,0 +1,56 @@
+import random
+
+from ainfo import parse_data
+from ainfo.extraction import extract_text
+from ainfo.extractors.jobs import JOB_KEYWORDS, extract_job_postings
+from ainfo.keywords import KeywordSet
+from ainfo.parsing import NAV_KEYWORDS, ParseCache
+
+
+def test_keyword_set_matches_like_substring_search() -> None:
+    rng = random.Random(0)
+    alphabet = "abcde -"
+    for _ in range(200):
+        keywords = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(0, 6))
+        }
+        keywords.discard("")
+        keyword_set = KeywordSet(keywords)
+        for _ in range(20):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            expected = any(keyword in text for keyword in keywords)
+            assert keyword_set.found_in(text) is expected
+
+    keyword_set = KeywordSet({"Nav"})
+    assert "nav" in keyword_set and keyword_set.found_in("site-nav")
+    keyword_set.discard("nav")
+    assert not keyword_set.found_in("site-nav")
+
+
+def test_extended_keywords_change_navigation_and_job_detection() -> None:
+    words = "one two three four five six"
+    html = (
+        "<html><body>"
+        f'<div class="valikko">{words}</div>'
+        f'<div class="vacature"><p>Location: Utrecht {words}</p></div>'
+        "</body></html>"
+    )
+    key = ParseCache.key("digest")
+
+    assert "valikko" not in NAV_KEYWORDS
+    NAV_KEYWORDS.add("valikko")
+    JOB_KEYWORDS.add("vacature")
+    try:
+        doc = parse_data(html)
+        assert extract_text(doc, content_only=True).startswith("Location")
+        assert extract_job_postings(doc) == [{"location": f"Utrecht {words}"}]
+        assert ParseCache.key("digest") != key
+    finally:
+        NAV_KEYWORDS.discard("valikko")
+        JOB_KEYWORDS.discard("vacature")
+
+    doc = parse_data(html)
+    assert extract_text(doc, content_only=True).startswith(words)
+    assert extract_job_postings(doc) == []
+    assert ParseCache.key("digest") == key
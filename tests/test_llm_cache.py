@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+
+import httpx
+
+from ainfo import llm_cache
+from ainfo.config import LLMConfig
+from ainfo.llm_cache import LLMCache
+from ainfo.llm_service import AsyncLLMService, LLMService
+
+
+def _handler(requests):
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests.append(payload)
+        answer = f"{payload['model']}: {payload['messages'][0]['content']}"
+        return httpx.Response(200, json={"choices": [{"message": {"content": answer}}]})
+
+    return handle
+
+
+def _service(requests, cache):
+    llm = LLMService(LLMConfig(api_key="test", model="m1"), cache=cache)
+    llm._client.close()
+    llm._client = httpx.Client(
+        base_url="https://llm.test", transport=httpx.MockTransport(_handler(requests))
+    )
+    return llm
+
+
+def test_llm_service_reuses_cached_responses_across_runs(tmp_path):
+    path = tmp_path / "llm.sqlite"
+    requests = []
+
+    with _service(requests, path) as llm:
+        assert llm.extract("text", "Find") == "m1: Find\n\ntext"
+        assert llm.extract("text", "Find") == "m1: Find\n\ntext"
+        assert llm.extract("text", "Find", model="m2") == "m2: Find\n\ntext"
+    assert len(requests) == 2
+
+    with _service(requests, path) as llm:
+        assert llm.extract("text", "Find") == "m1: Find\n\ntext"
+    assert len(requests) == 2
+
+
+def test_llm_service_without_cache_always_requests():
+    requests = []
+    with _service(requests, None) as llm:
+        llm.extract("text", "Find")
+        llm.extract("text", "Find")
+    assert len(requests) == 2
+
+
+def test_async_llm_service_uses_cache():
+    requests = []
+    cache = LLMCache()
+
+    async def run():
+        llm = AsyncLLMService(LLMConfig(api_key="test", model="m1"), cache=cache)
+        await llm._client.aclose()
+        llm._client = httpx.AsyncClient(
+            base_url="https://llm.test", transport=httpx.MockTransport(_handler(requests))
+        )
+        async with llm:
+            return [await llm.extract("text", "Find") for _ in range(3)]
+
+    assert asyncio.run(run()) == ["m1: Find\n\ntext"] * 3
+    assert len(requests) == 1
+
+
+def test_llm_cache_expires_entries_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    path = tmp_path / "llm.sqlite"
+
+    with LLMCache(path=path, ttl=60) as cache:
+        cache.put("key", "answer")
+        now[0] += 30
+        assert cache.get("key") == "answer"
+        now[0] += 31
+        assert cache.get("key") is None
+
+    with LLMCache(path=path, ttl=60) as cache:
+        assert cache.get("key") is None
+
+
+def test_llm_cache_limits_memory_and_disk_entries(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    path = tmp_path / "llm.sqlite"
+
+    with LLMCache(max_entries=1, path=path, max_disk_entries=2) as cache:
+        for key in ("a", "b", "c"):
+            now[0] += 1
+            cache.put(key, key.upper())
+        assert len(cache) == 1
+        now[0] += 1
+        # Served from disk; "b" is now more recently used than "c".
+        assert cache.get("b") == "B"
+        now[0] += 1
+        cache.put("d", "D")
+
+    with LLMCache(path=path) as cache:
+        assert [cache.get(key) for key in "abcd"] == [None, "B", None, "D"]
+
+
+def test_llm_cache_key_depends_on_endpoint_model_and_messages():
+    messages = [{"role": "user", "content": "hello"}]
+
+    assert LLMCache.key("m1", messages) == LLMCache.key("m1", [dict(messages[0])])
+    assert LLMCache.key("m1", messages) != LLMCache.key("m2", messages)
+    assert LLMCache.key("m1", messages) != LLMCache.key(
+        "m1", [{"role": "user", "content": "hello!"}]
+    )
+    assert LLMCache.key("m1", messages, endpoint="https://a.test") != LLMCache.key(
+        "m1", messages, endpoint="https://b.test"
+    )
+
+
+def test_llm_services_do_not_share_responses_across_endpoints():
+    requests = []
+    cache = LLMCache()
+    first = _service(requests, cache)
+    second = _service(requests, cache)
+    second._client = httpx.Client(
+        base_url="https://other.test", transport=httpx.MockTransport(_handler(requests))
+    )
+
+    with first, second:
+        assert first.extract("text", "Find") == second.extract("text", "Find")
+    assert len(requests) == 2
+
+
+def test_async_llm_service_reads_cache_off_the_event_loop(monkeypatch):
+    requests = []
+    threads = []
+    cache = LLMCache()
+    real_get = cache.get
+
+    def recording_get(key):
+        threads.append(threading.current_thread())
+        return real_get(key)
+
+    monkeypatch.setattr(cache, "get", recording_get)
+
+    async def run():
+        llm = AsyncLLMService(LLMConfig(api_key="test", model="m1"), cache=cache)
+        await llm._client.aclose()
+        llm._client = httpx.AsyncClient(
+            base_url="https://llm.test", transport=httpx.MockTransport(_handler(requests))
+        )
+        async with llm:
+            await llm.extract("text", "Find")
+            await llm.extract("text", "Find")
+
+    asyncio.run(run())
+    assert len(requests) == 1
+    assert threads and threading.main_thread() not in threads
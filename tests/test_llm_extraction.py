@@ -1,6 +1,8 @@
+import asyncio
 import json
 
-from ainfo import parse_data, extract_information
+from ainfo import async_extract_information, parse_data, extract_information
+from ainfo.llm_service import AsyncLLMService
 from ainfo.schemas import Address
 
 
@@ -41,3 +43,22 @@ def test_extract_information_llm_custom_prompt_and_model() -> None:
     assert result.addresses == [Address(street="123 Main St", city="Springfield", country="USA")]
     assert llm.calls[0][1] == "Find all emails"
     assert llm.calls[0][2] == "custom-model"
+
+
+class DummyAsyncLLM(AsyncLLMService):
+    def __init__(self) -> None:
+        self.sync = DummyLLM()
+
+    async def extract(self, text: str, instruction: str, model: str | None = None) -> str:
+        return self.sync.extract(text, instruction, model)
+
+
+def test_async_extract_information_matches_sync() -> None:
+    html = "<html><body><p>Contact us at test@example.com</p></body></html>"
+    doc = parse_data(html, url="http://example.com")
+    llm = DummyAsyncLLM()
+
+    result = asyncio.run(async_extract_information(doc, llm))
+
+    assert result == extract_information(doc, method="llm", llm=DummyLLM())
+    assert llm.sync.calls[0][0] == "Contact us at test@example.com"
@@ -0,0 +1,118 @@
+"""Tests for the document models and their compact tree representation."""
+
+import copy
+import pickle
+
+import pytest
+
+from ainfo.extraction import extract_text
+from ainfo.extractors.links import extract_links
+from ainfo.models import Document, NodeTree, PageNode
+from ainfo.parsing import parse_html
+
+
+def test_parsed_document_materialises_nodes_on_demand() -> None:
+    """Parsed documents keep a compact tree until ``nodes`` is accessed."""
+    html = (
+        "<html><body><div><p>Some words that form content.</p>"
+        '<a href="/a">A</a></div><footer>Bye</footer></body></html>'
+    )
+    doc = parse_html(html)
+
+    assert doc._nodes is None
+    tree = doc.tree
+    assert [tree.tag(i) for i in tree.roots()] == ["div", "footer"]
+    assert [tree.tag(i) for i in tree.children(0)] == ["p", "a"]
+
+    nodes = doc.nodes
+    assert [node.tag for node in nodes] == ["div", "footer"]
+    assert nodes[0].children[1].attrs == {"href": "/a"}
+    assert NodeTree.from_page_nodes(nodes).to_page_nodes() == list(nodes)
+
+
+def test_document_built_from_page_nodes_supports_extractors() -> None:
+    """Hand-built documents are converted to a tree for the extractors."""
+    doc = Document(
+        url="https://example.com",
+        nodes=[
+            PageNode(
+                tag="div",
+                children=[PageNode(tag="a", attrs={"href": "/x"}, text="x")],
+            )
+        ],
+    )
+
+    assert extract_links(doc) == ["/x"]
+    assert doc.model_dump()["nodes"][0]["children"][0]["tag"] == "a"
+
+
+def test_node_tree_indexes_tags_and_hrefs() -> None:
+    """Tag and href indexes return matches in document order."""
+    html = (
+        "<html><body><h2>B</h2><div><h1>A</h1><a href='/x'>x</a></div>"
+        "<link href='/style.css'><h2>C</h2></body></html>"
+    )
+    tree = parse_html(html).tree
+
+    assert [tree.text(i) for i in tree.find("h1", "h2")] == ["B", "A", "C"]
+    assert [tree.tag(i) for i in tree.with_href] == ["a", "link"]
+    assert tree.find("DIV") == [1]
+    assert tree.find("table") == []
+
+
+_LAZY_HTML = (
+    "<html><head><title>T</title></head><body><main><p>Some words that form "
+    'content here.</p><a href="/a">A</a></main><footer>Bye</footer></body></html>'
+)
+
+
+@pytest.mark.parametrize("access_tree", [False, True])
+def test_lazy_document_survives_pickle_and_deepcopy(access_tree: bool) -> None:
+    """Deferred layers are computed before a document is pickled or copied."""
+    expected = extract_text(parse_html(_LAZY_HTML, lazy=False))
+
+    for clone in (
+        lambda doc: pickle.loads(pickle.dumps(doc)),
+        copy.deepcopy,
+        lambda doc: doc.model_copy(deep=True),
+    ):
+        doc = parse_html(_LAZY_HTML)
+        if access_tree:
+            doc.tree
+        copied = clone(doc)
+        assert extract_text(copied) == expected
+        assert extract_links(copied) == ["/a"]
+        assert copied == doc
+
+
+def test_document_nodes_cannot_be_changed_in_place() -> None:
+    """Changes to the nodes must go through the setter so extractors see them."""
+    doc = parse_html("<html><body><p>No links here.</p></body></html>")
+    assert extract_links(doc) == []
+
+    with pytest.raises(AttributeError):
+        doc.nodes.append(PageNode(tag="a", attrs={"href": "/x"}))  # type: ignore[attr-defined]
+
+    doc.nodes = [*doc.nodes, PageNode(tag="a", attrs={"href": "/x"})]
+    assert extract_links(doc) == ["/x"]
+
+
+def test_document_json_schema_lists_nodes() -> None:
+    """``nodes`` is accepted on validation and documented in the schema."""
+    nodes = Document.model_json_schema()["properties"]["nodes"]
+
+    assert nodes["type"] == "array"
+    assert nodes["items"] == {"$ref": "#/$defs/PageNode"}
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_document_copies_do_not_share_cached_text(deep: bool) -> None:
+    doc = parse_html("<html><body><p>Original text</p></body></html>")
+    assert extract_text(doc, content_only=False) == "Original text"
+
+    copied = doc.model_copy(deep=deep)
+    assert copied._memo is not doc._memo
+    copied.nodes = [PageNode(tag="p", text="Copied text")]
+
+    assert extract_text(copied, content_only=False) == "Copied text"
+    assert extract_text(doc, content_only=False) == "Original text"
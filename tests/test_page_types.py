@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+import ainfo
+from ainfo import pipeline
+from ainfo import parse_data
+from ainfo.extractors import ExtractorRegistry, runs_on
+from ainfo.page_types import classify_page
+
+
+def test_classify_page_uses_url_title_and_headings() -> None:
+    def page(url: str, title: str = "", heading: str = "") -> str:
+        return classify_page(
+            parse_data(
+                f"<html><head><title>{title}</title></head>"
+                f"<body><h1>{heading}</h1><p>Body text</p></body></html>",
+                url=url,
+            )
+        )
+
+    assert page("https://example.com/kontakt") == "contact"
+    assert page("https://example.com/de/karriere/", title="Über uns") == "careers"
+    assert page("https://example.com/page?id=4", title="About Acme") == "about"
+    assert page("https://example.com/p/12", heading="Join our team") == "careers"
+    assert page("https://example.com/blog/post") == "other"
+
+
+def test_registry_routes_extractors_by_page_type() -> None:
+    registry = ExtractorRegistry(entry_point_group=None)
+
+    @runs_on("careers")
+    def jobs(doc):
+        return []
+
+    registry["jobs"] = jobs
+    registry.register("everywhere", lambda doc: None)
+    registry.register("contact", lambda doc: None, page_types={"contact"})
+
+    assert registry.for_page(["jobs", "everywhere", "contact"], "careers") == [
+        "jobs",
+        "everywhere",
+    ]
+    assert registry.for_page(["jobs", "everywhere", "contact"], "contact") == [
+        "everywhere",
+        "contact",
+    ]
+    with pytest.raises(ValueError):
+        runs_on("pricing")
+
+
+def test_async_extract_site_runs_extractors_on_matching_pages(monkeypatch) -> None:
+    pages = [
+        ("https://example.com/blog/1", "<html><body><p>Mail x@example.com</p></body></html>"),
+        ("https://example.com/contact", "<html><body><p>Mail y@example.com</p></body></html>"),
+    ]
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        for link, raw in pages:
+            yield link, raw
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    result = asyncio.run(
+        ainfo.async_extract_site(
+            "https://example.com",
+            extract=["contacts", "job_postings", "links"],
+            classify_pages=True,
+        )
+    )
+    assert result["https://example.com/blog/1"] == {
+        "page_type": "other",
+        "contacts": None,
+        "job_postings": None,
+        "links": [],
+    }
+    contact = result["https://example.com/contact"]
+    assert contact["page_type"] == "contact"
+    assert contact["contacts"].emails == ["y@example.com"]
+    assert contact["job_postings"] is None
+
+
+def test_classified_homepage_reports_skipped_contacts(monkeypatch) -> None:
+    homepage = (
+        "<html><head><title>Acme</title></head><body><main><h1>Welcome</h1>"
+        "<p>We build rockets.</p></main>"
+        "<footer>Mail info@acme.example or call +1 212 456 7890</footer>"
+        "</body></html>"
+    )
+
+    async def fake_crawl(url, depth, render_js=False):  # noqa: D401 - simple stub
+        yield url, homepage
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+
+    def run(**kwargs):
+        return asyncio.run(
+            ainfo.async_extract_site("https://acme.example", extract=["contacts"], **kwargs)
+        )["https://acme.example"]
+
+    assert run(classify_pages=True) == {"page_type": "other", "contacts": None}
+    assert run()["contacts"].emails == ["info@acme.example"]
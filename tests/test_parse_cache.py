@@ -0,0 +1,44 @@
+"""Tests for the content-hash keyed parse cache."""
+
+from ainfo.models import NodeTree
+from ainfo.parsing import ParseCache, parse_html
+import ainfo.parsing.cache as cache_module
+
+HTML = (
+    '<html lang="de"><head><title>Cached</title></head><body>'
+    '<div class="content"><p>Cached paragraph with enough words.</p>'
+    '<a href="/next" data-x="1">Next</a></div></body></html>'
+)
+
+
+def test_node_tree_round_trips_through_bytes() -> None:
+    tree = parse_html(HTML).tree
+    restored = NodeTree.from_bytes(tree.to_bytes())
+
+    assert restored.to_page_nodes() == tree.to_page_nodes()
+
+
+def test_parse_cache_reuses_memory_and_disk_entries(monkeypatch, tmp_path) -> None:
+    calls: list[str | None] = []
+    real_parse = cache_module.parse_html
+
+    def counting_parse(raw, url=None, *, lazy=True):
+        calls.append(url)
+        return real_parse(raw, url=url, lazy=lazy)
+
+    monkeypatch.setattr(cache_module, "parse_html", counting_parse)
+
+    cache = ParseCache(cache_dir=tmp_path)
+    first = cache.parse(HTML, url="https://example.com/a")
+    second = cache.parse(HTML, url="https://example.com/b")
+    assert calls == ["https://example.com/a"]
+    assert second.url == "https://example.com/b"
+    assert second.title == "Cached"
+    assert second.lang == "de"
+    assert second.nodes == first.nodes
+
+    fresh = ParseCache(cache_dir=tmp_path)
+    third = fresh.parse(HTML, url="https://example.com/c")
+    assert calls == ["https://example.com/a"]
+    assert third.nodes == first.nodes
+    assert len(fresh) == 1
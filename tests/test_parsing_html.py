@@ -20,3 +20,44 @@ def test_parse_html_builds_document_structure() -> None:
     assert div.is_content
     assert div.children[0].tag == "p"
     assert div.children[0].text == "Hello world this is content."
+
+
+def test_parse_html_nested_text_matches_subtree() -> None:
+    """Node text spans the whole subtree but skips script contents."""
+    html = (
+        "<html><body><div><section><p>One two</p>"
+        "<script>var x = 1;</script><span>three four five</span>"
+        "</section></div></body></html>"
+    )
+    doc = parse_html(html)
+
+    div = doc.nodes[0]
+    section = div.children[0]
+    assert div.text == section.text == "One two three four five"
+    assert div.is_content and section.is_content
+    assert section.children[1].text == ""
+    assert not section.children[1].is_content
+
+
+def test_lazy_parse_defers_text_and_flags() -> None:
+    """Lazy documents compute text and content flags on first access."""
+    html = (
+        "<html><head><title>Lazy</title></head><body>"
+        '<div class="menu"><a href="/a">A</a></div>'
+        "<p>Enough words to count as content.</p></body></html>"
+    )
+    lazy = parse_html(html)
+    eager = parse_html(html, lazy=False)
+
+    assert lazy.title == "Lazy"
+    assert lazy._tree is None
+
+    tree = lazy.tree
+    assert [tree.tag(i) for i in range(len(tree))] == ["div", "a", "p"]
+    assert set(tree._deferred) == {"text", "flags"}
+    assert tree.text(2) == "Enough words to count as content."
+    assert set(tree._deferred) == {"flags"}
+    assert tree.is_content(2) and not tree.is_content(0)
+    assert not tree._deferred
+
+    assert lazy == eager
@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+
+import ainfo
+from ainfo import extract_information, extract_text, parse_data, pipeline
+from ainfo.extractors import AVAILABLE_EXTRACTORS, extract_links
+from ainfo.parsing.stream import HTMLScanner, scan_html
+
+PAGE = """
+<html lang="de">
+<head>
+  <title>Kontakt</title>
+  <a href="/head-link">ignored</a>
+  <script type="application/ld+json">{json_ld}</script>
+</head>
+<body>
+  <nav><a href="/">Home</a> <a href="/about">About</a></nav>
+  <main>
+    <p>Schreiben Sie an <a href="mailto:info@example.com">uns</a>.</p>
+    <p>Telefon: +49 30 1234567</p>
+    <script>var ignored = "hidden@example.com";</script>
+    <p>Adresse: Hauptstr. 1, 10115 Berlin<br>Deutschland</p>
+  </main>
+</body>
+</html>
+""".replace(
+    "{json_ld}",
+    json.dumps(
+        {
+            "@context": "https://schema.org",
+            "@type": "Organization",
+            "email": "office@example.com",
+            "sameAs": ["https://twitter.com/example"],
+        }
+    ),
+)
+
+
+def test_scanner_matches_document_links_and_text():
+    doc = parse_data(PAGE, url="https://example.com/kontakt")
+    scanner = scan_html(PAGE)
+
+    tree = doc.tree
+    assert scanner.links == [tree.attrs[index]["href"] for index in tree.find("a")]
+    assert scanner.text == extract_text(doc, content_only=False)
+    assert scanner.lang == doc.lang
+    assert scanner.structured_data == doc.structured_data
+    assert not scanner.has_microdata
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "<p>mail foo<!-- c -->bar@example.com now</p>",
+        "<p>call +1 415<!---->555 0100 or <a href='mailto:a@example.com'>us</a></p>",
+        "<div>write to<![CDATA[ x@example.com ]]>today</div>",
+        "<template><p>hidden</p><![CDATA[shown@example.com]]></template>",
+        "<p>before<?php echo 1 ?>after@example.com</p>",
+        "<p>one<!bogus>two@example.com</p><!-- tail -->",
+    ],
+)
+def test_scanner_splits_text_like_the_parser(body):
+    html = f"<!DOCTYPE html><html><body>{body}</body></html>"
+    doc = parse_data(html, url="https://example.com")
+
+    assert scan_html(html).text == extract_text(doc, content_only=False)
+    assert extract_information(html, url="https://example.com") == extract_information(doc)
+
+
+def test_scanner_accepts_chunks_and_reports_links():
+    seen = []
+    scanner = HTMLScanner(collect_text=False, on_link=seen.append)
+    for start in range(0, len(PAGE), 7):
+        scanner.feed(PAGE[start : start + 7])
+    scanner.close()
+
+    assert scanner.links == ["/", "/about", "mailto:info@example.com"]
+    assert seen == ["/head-link", *scanner.links]
+    assert scanner.text == ""
+
+
+def test_extract_information_scans_raw_html():
+    url = "https://example.com/kontakt"
+
+    assert extract_information(PAGE, url=url) == extract_information(
+        parse_data(PAGE, url=url)
+    )
+
+
+def test_extract_site_scans_pages_without_parsing(monkeypatch):
+    url = "https://example.com/kontakt"
+
+    async def fake_crawl(start, depth, render_js=False):
+        yield url, PAGE
+
+    def fail_parse(raw, url=None):
+        raise AssertionError("page should be scanned, not parsed")
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    expected = {
+        "contacts": extract_information(parse_data(PAGE, url=url)),
+        "links": extract_links(parse_data(PAGE, url=url)),
+    }
+    monkeypatch.setattr(pipeline, "parse_data", fail_parse)
+
+    results = asyncio.run(
+        ainfo.async_extract_site(url, depth=0, extract=["contacts", "links"])
+    )
+
+    assert results[url]["contacts"] == expected["contacts"]
+    assert results[url]["links"] == expected["links"]
+
+
+def test_extract_site_scans_by_declared_inputs(monkeypatch):
+    url = "https://example.com/kontakt"
+    collected = []
+
+    async def fake_crawl(start, depth, render_js=False):
+        yield url, PAGE
+
+    def recording_scan(raw, collect_text=True):
+        collected.append(collect_text)
+        return scan_html(raw, collect_text=collect_text)
+
+    monkeypatch.setattr(pipeline, "crawl_urls", fake_crawl)
+    monkeypatch.setattr(pipeline, "scan_html", recording_scan)
+
+    results = asyncio.run(ainfo.async_extract_site(url, depth=0, extract=["links"]))
+    assert results[url]["links"] == ["/", "/about", "mailto:info@example.com"]
+    assert collected == [False]
+
+    # Declaring the tree as an input forces a parse.
+    spec = AVAILABLE_EXTRACTORS.spec("links")
+    monkeypatch.setattr(spec, "inputs", frozenset({"tree", "links"}))
+    asyncio.run(ainfo.async_extract_site(url, depth=0, extract=["links"]))
+    assert collected == [False]
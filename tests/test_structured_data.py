@@ -0,0 +1,147 @@
+import json
+
+from ainfo import extract_information, parse_data
+from ainfo.extractors.jobs import extract_job_postings
+from ainfo.parsing import ParseCache
+from ainfo.schemas import Address
+
+ORGANIZATION = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {
+            "@type": "Organization",
+            "name": "Acme",
+            "email": "mailto:office@acme.example",
+            "telephone": "+1 415 555 0100",
+            "address": {
+                "@type": "PostalAddress",
+                "streetAddress": "1 Market St",
+                "addressLocality": "San Francisco",
+                "postalCode": "94105",
+                "addressCountry": "US",
+            },
+            "sameAs": ["https://twitter.com/acme", "https://acme.example/blog"],
+        },
+        {
+            "@type": "JobPosting",
+            "title": "Backend Engineer",
+            "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+            "jobLocation": {"@type": "Place", "address": {"addressLocality": "Berlin"}},
+            "employmentType": ["FULL_TIME"],
+            "baseSalary": {
+                "@type": "MonetaryAmount",
+                "currency": "EUR",
+                "value": {"minValue": 60000, "maxValue": 70000, "unitText": "YEAR"},
+            },
+            "url": "https://acme.example/jobs/1",
+        },
+    ],
+}
+
+HTML = (
+    "<html><head>"
+    f'<script type="application/ld+json">{json.dumps(ORGANIZATION)}</script>'
+    '<script type="application/ld+json">{not json</script>'
+    "</head><body>"
+    '<div itemscope itemtype="https://schema.org/LocalBusiness">'
+    '<span itemprop="name">Acme Shop</span>'
+    '<a itemprop="email" href="mailto:shop@acme.example">shop@acme.example</a>'
+    '<div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">'
+    '<span itemprop="streetAddress">2 Main St</span>'
+    '<span itemprop="addressLocality">Oakland</span></div>'
+    "</div>"
+    "<p>Write to hello@acme.example</p>"
+    "</body></html>"
+)
+
+
+class FailingLLM:
+    def extract(self, text: str, instruction: str, model: str | None = None) -> str:
+        raise AssertionError("the LLM must not be called")
+
+
+def test_structured_data_is_parsed_and_mapped_to_contacts(tmp_path) -> None:
+    doc = parse_data(HTML, url="https://acme.example")
+
+    assert [item.get("@type") for item in doc.structured_data] == [
+        "Organization",
+        "JobPosting",
+        "LocalBusiness",
+    ]
+    assert doc.structured_data[2]["address"] == {
+        "@type": "PostalAddress",
+        "streetAddress": "2 Main St",
+        "addressLocality": "Oakland",
+    }
+
+    details = extract_information(doc)
+    assert details.emails == [
+        "office@acme.example",
+        "shop@acme.example",
+        "hello@acme.example",
+    ]
+    assert details.addresses[:2] == [
+        Address(street="1 Market St", city="San Francisco", postal_code="94105", country="US"),
+        Address(street="2 Main St", city="Oakland"),
+    ]
+    assert details.social_media == ["https://twitter.com/acme"]
+
+    answered = extract_information(doc, method="llm", llm=FailingLLM())
+    assert answered.emails == ["office@acme.example", "shop@acme.example"]
+    assert len(answered.phone_numbers) == 1
+
+    cache = ParseCache(cache_dir=tmp_path)
+    cache.parse(HTML)
+    assert ParseCache(cache_dir=tmp_path).parse(HTML).structured_data == doc.structured_data
+
+
+def test_job_postings_start_with_structured_data() -> None:
+    html = HTML.replace(
+        "<p>Write to hello@acme.example</p>",
+        '<section class="job"><h2>Backend Engineer</h2><p>Location: Berlin</p></section>'
+        '<section class="job"><h2>Designer</h2><p>Location: Hamburg</p></section>',
+    )
+    postings = extract_job_postings(parse_data(html))
+
+    assert postings == [
+        {
+            "company": "Acme",
+            "position": "Backend Engineer",
+            "location": "Berlin",
+            "employment_type": "FULL_TIME",
+            "salary": "EUR 60000-70000 per YEAR",
+            "apply_url": "https://acme.example/jobs/1",
+        },
+        {"location": "Hamburg", "position": "Designer"},
+    ]
+
+
+def test_skipped_llm_still_reports_social_profiles_from_the_text() -> None:
+    organization = dict(ORGANIZATION["@graph"][0])
+    del organization["sameAs"]
+    html = (
+        "<html><head>"
+        f'<script type="application/ld+json">{json.dumps(organization)}</script>'
+        "</head><body><p>Follow https://twitter.com/acme</p></body></html>"
+    )
+
+    answered = extract_information(parse_data(html), method="llm", llm=FailingLLM())
+    assert answered.emails == ["office@acme.example"]
+    assert answered.social_media == ["https://twitter.com/acme"]
+
+
+def test_merged_contacts_keep_repeated_values_found_in_the_text() -> None:
+    html = (
+        "<html><head>"
+        f'<script type="application/ld+json">{json.dumps(ORGANIZATION)}</script>'
+        "</head><body><p>Call 212 456 7890 or, after hours, 212 456 7890. "
+        "Mail office@acme.example today.</p></body></html>"
+    )
+    regex_only = extract_information(
+        parse_data(html.replace("application/ld+json", "text/plain"))
+    )
+
+    details = extract_information(parse_data(html))
+    assert details.emails == ["office@acme.example"]
+    assert details.phone_numbers[1:] == regex_only.phone_numbers
+    assert len(regex_only.phone_numbers) == 2
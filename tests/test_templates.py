@@ -0,0 +1,43 @@
+from ainfo import parse_data
+from ainfo.extraction import extract_information, extract_text
+from ainfo.templates import SiteTemplate, page_fingerprints
+
+
+def _page(body: str) -> str:
+    return (
+        "<html><body><header><nav>Home | Products | About us | Blog</nav></header>"
+        f"<main><p>{body}</p></main>"
+        "<footer><p>Call us on 030 1234567 or write to info@example.com</p></footer>"
+        "</body></html>"
+    )
+
+
+def test_site_template_strips_recurring_blocks_after_learning() -> None:
+    template = SiteTemplate(3, min_share=0.6)
+    for body in ("First article text here.", "Second article text here.", "Header only."):
+        doc = template.apply(parse_data(_page(body)))
+        assert "info@example.com" in extract_text(doc, content_only=False)
+    assert not template.learning
+
+    doc = template.apply(parse_data(_page("Fourth article, mail me at me@example.com")))
+    assert extract_text(doc, content_only=False) == "Fourth article, mail me at me@example.com"
+    assert extract_information(doc).emails == ["me@example.com"]
+    assert doc.is_excluded(0) and not doc.is_excluded(doc.tree.find("main")[0])
+
+    other = parse_data(_page("Fourth article, mail me at me@example.com"))
+    assert page_fingerprints(other) >= template.boilerplate
+
+
+def test_template_exclusion_on_a_copy_keeps_the_original_text() -> None:
+    template = SiteTemplate(2, min_share=0.6)
+    for body in ("First article text here.", "Second article text here."):
+        template.apply(parse_data(_page(body)))
+
+    doc = parse_data(_page("Third article text here."))
+    full = extract_text(doc, content_only=False)
+    assert "info@example.com" in full
+
+    copied = template.apply(doc.model_copy())
+    assert extract_text(copied, content_only=False) == "Third article text here."
+    assert extract_text(doc, content_only=False) == full
+    assert doc.excluded == ()